@@ -9,6 +9,8 @@ Não requer dependências de GUI.
 Uso:
     python main.py analyze <arquivo_grafo> [--algorithm bt|heur|both]
     python main.py generate <n> <densidade> [--output arquivo]
+    python main.py convert <entrada> <saida.hpg>
+    python main.py corpus pack|list <corpus.hpc> [arquivos...]
     python main.py experiment <n> <densidade> [--repetitions N]
     python main.py batch [--sizes N1,N2,...] [--densities sparse,medium,dense]
     python main.py gui (requer PyQt6)
@@ -17,7 +19,11 @@ Uso:
 import sys
 import os
 import argparse
+import math
 import time
+import re
+import shutil
+import warnings
 from pathlib import Path
 
 # Adicionar diretório raiz ao path
@@ -25,11 +31,21 @@ PROJECT_ROOT = Path(__file__).parent.absolute()
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.algorithms.backtracking import find_hamiltonian_path_bt
+from src.algorithms.backtracking import PRUNE_RULES, find_hamiltonian_path_bt
 from src.algorithms.heuristic import heuristic_path
-from src.graph_io import load_graph, save_graph
-from src.utils.graph_generator import generate_random_graph
+from src.graph_io import (
+    load_graph, save_graph, load_graph_auto, csr_to_edges, csr_to_adj,
+    detect_graph_format, save_graph_binary, strip_compression_suffix,
+)
+from src.utils.graph_generator import GENERATORS, COUPLED_GENERATORS, generate_instance
+from src.graph_corpus import RESERVED_KEYS, GraphCorpus, is_corpus_file
 from src.experiments.experiment_runner import ExperimentRunner
+from src.experiments.result_sink import ResultSink, TeeSink, adaptive_path, read_runs
+from src.experiments.results_db import ResultsDB
+from src.algorithms.progress import format_progress
+from src.utils.metrics import RunnerMetrics, MetricsExporter
+from src.utils.profiling import PROFILE_MODES, run_profiled, format_overhead
+from src.utils.benchmark import ENGINES, prepare_engine, benchmark, format_benchmark, format_time
 
 
 # ============================================================================
@@ -59,27 +75,53 @@ class Colors:
         Colors.UNDERLINE = ''
 
 
+class LiveStatus:
+    """
+    Linha de status ao vivo com a telemetria dos métodos (--progress).
+    
+    `begin` imprime o início de uma linha (ex.: "[3/9] n=30...") e o guarda
+    como prefixo; cada relatório reescreve a linha como prefixo + status, e
+    `end` a devolve ao prefixo antes do resultado ser impresso em seguida.
+    """
+    
+    ANSI = re.compile(r'\033\[[0-9;]*m')
+    
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.prefix = ''
+        self._dirty = False
+    
+    def begin(self, text):
+        print(f"\r{text}", end=" ", flush=True)
+        self.prefix = f"{text} "
+    
+    def update(self, info):
+        if not self.enabled:
+            return
+        status = f"run {info['run_id']} | {format_progress(info)}"
+        width = shutil.get_terminal_size().columns - len(self.ANSI.sub('', self.prefix)) - 1
+        sys.stdout.write(f"\r{self.prefix}{status[:max(0, width)]}\033[K")
+        sys.stdout.flush()
+        self._dirty = True
+    
+    def end(self):
+        if self._dirty:
+            sys.stdout.write(f"\r{self.prefix}\033[K")
+            sys.stdout.flush()
+            self._dirty = False
+
+
 # ============================================================================
 # COMANDOS
 # ============================================================================
 
-def cmd_analyze(args):
-    """Analisa um grafo de arquivo."""
-    print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
-    print(f"{Colors.BOLD}ANÁLISE DE CAMINHO HAMILTONIANO{Colors.ENDC}")
-    print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}\n")
-    
-    # Carregar grafo
-    print(f"Carregando grafo: {args.file}")
-    try:
-        n, adj = load_graph(args.file)
-        # Converter adjacência para lista de arestas
-        edges = [(u, v) for u in range(n) for v in adj[u] if u < v]
-        print(f"{Colors.OKGREEN}✓{Colors.ENDC} Grafo carregado: {n} vértices, {len(edges)} arestas\n")
-    except Exception as e:
-        print(f"{Colors.FAIL}✗ Erro ao carregar grafo: {e}{Colors.ENDC}")
-        return 1
+def _analyze_graph(n, edges, args, label='grafo'):
+    """
+    Executa os algoritmos selecionados sobre um grafo e imprime a comparação.
     
+    Com --profile, cada algoritmo é executado de novo sob o perfilador e os
+    arquivos vão para --profile-dir com o nome `<label>_<método>`.
+    """
     # Executar algoritmos
     algorithms = []
     if args.algorithm in ['bt', 'both']:
@@ -92,11 +134,11 @@ def cmd_analyze(args):
     for name, alg in algorithms:
         print(f"{Colors.OKCYAN}Executando {name}...{Colors.ENDC}")
         
-        t_start = time.time()
+        t_start = time.perf_counter()
         
         if alg == 'bt':
             path, stats = find_hamiltonian_path_bt(n, edges, collect_stats=True)
-            elapsed = time.time() - t_start
+            elapsed = time.perf_counter() - t_start
             results[name] = {
                 'path': path,
                 'time': elapsed,
@@ -104,7 +146,7 @@ def cmd_analyze(args):
             }
         else:  # heur
             path = heuristic_path(n, edges)
-            elapsed = time.time() - t_start
+            elapsed = time.perf_counter() - t_start
             results[name] = {
                 'path': path,
                 'time': elapsed,
@@ -119,6 +161,17 @@ def cmd_analyze(args):
                 print(f"  Caminho: {path}")
         else:
             print(f"{Colors.FAIL}✗{Colors.ENDC} Nenhum caminho encontrado ({elapsed:.6f}s)")
+        
+        if args.profile:
+            func, func_args, kwargs = (
+                (find_hamiltonian_path_bt, (n, edges), {'collect_stats': True}) if alg == 'bt'
+                else (heuristic_path, (n, edges), {})
+            )
+            report = run_profiled(func, func_args, kwargs, mode=args.profile, output_dir=args.profile_dir,
+                                  engine=alg, instance=label, baseline_time=elapsed)
+            print(f"  Perfil {format_overhead(report)}")
+            for path in report['files']:
+                print(f"    {path}")
         print()
     
     # Resumo comparativo
@@ -143,27 +196,196 @@ def cmd_analyze(args):
                 speedup = bt_time / h_time
                 print(f"\nSpeedup (BT/H): {Colors.BOLD}{speedup:.2f}x{Colors.ENDC}")
     
+    return results
+
+
+def _parse_where(items):
+    """Converte filtros CHAVE=VALOR em dicionário (valores numéricos convertidos)."""
+    criteria = {}
+    for item in items or []:
+        key, _, value = item.partition('=')
+        for cast in (int, float):
+            try:
+                value = cast(value)
+                break
+            except ValueError:
+                continue
+        criteria[key] = value
+    return criteria
+
+
+def _open_corpus(path, mode='r'):
+    """
+    Abre um corpus .hpc, reportando arquivo ausente ou inválido.
+    
+    Returns:
+        GraphCorpus ou None em caso de erro (já reportado)
+    """
+    try:
+        return GraphCorpus(path, mode)
+    except (OSError, ValueError) as e:
+        print(f"{Colors.FAIL}✗ Erro ao abrir corpus: {e}{Colors.ENDC}")
+        return None
+
+
+def _analyze_corpus(args):
+    """Analisa os grafos de um corpus .hpc, um de cada vez."""
+    ids = [int(x) if x.strip().isdigit() else x.strip() for x in args.ids.split(',')] if args.ids else None
+    criteria = _parse_where(args.where)
+    
+    corpus = _open_corpus(args.file)
+    if corpus is None:
+        return 1
+    with corpus:
+        print(f"Corpus: {args.file} ({len(corpus)} grafos)\n")
+        for entry, n, edge_array in corpus.iter_graphs(ids, **criteria):
+            edges = [tuple(e) for e in edge_array.tolist()]
+            meta = {k: v for k, v in entry.items() if k not in RESERVED_KEYS}
+            if 'name' in entry:
+                meta = {'name': entry['name'], **meta}
+            print(f"{Colors.HEADER}{'-'*80}{Colors.ENDC}")
+            print(f"{Colors.BOLD}Grafo #{entry['id']}{Colors.ENDC}: {n} vértices, {entry['m']} arestas {meta if meta else ''}\n")
+            _analyze_graph(n, edges, args, label=f"{Path(args.file).stem}_{entry['id']}")
+    
     print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
     return 0
 
 
+def _load_graph_file(path, fast_io=False):
+    """
+    Carrega um grafo (texto, .hpg, .hcp ou DIMACS) como lista de arestas,
+    exibindo o relatório de normalização.
+    
+    Returns:
+        (n, arestas) ou None em caso de erro (já reportado)
+    """
+    print(f"Carregando grafo: {path}")
+    report = None
+    try:
+        with warnings.catch_warnings():
+            # O relatório de normalização é exibido abaixo
+            warnings.simplefilter('ignore')
+            # Formatos não-texto (.hpg, .hcp, DIMACS) e --fast-io vão direto para CSR
+            fmt = detect_graph_format(path)
+            use_csr = fmt != 'edgelist' or fast_io
+            if use_csr:
+                n, indptr, indices, report = load_graph_auto(path, return_report=True)
+            else:
+                n, adj, report = load_graph(path, return_report=True)
+        
+        if use_csr:
+            u, v = csr_to_edges(n, indptr, indices)
+            edges = list(zip(u.tolist(), v.tolist()))
+        else:
+            # Converter adjacência para lista de arestas
+            edges = [(u, v) for u in range(n) for v in adj[u] if u < v]
+        print(f"{Colors.OKGREEN}✓{Colors.ENDC} Grafo carregado: {n} vértices, {len(edges)} arestas")
+        if report and (report['self_loops'] or report['duplicates'] or report['header_mismatch']):
+            print(f"{Colors.WARNING}!{Colors.ENDC} Normalização: {report['self_loops']} laço(s), "
+                  f"{report['duplicates']} duplicata(s) removidos "
+                  f"(cabeçalho: m={report['header_edges']}, lidas: {report['input_edges']})")
+        print()
+    except Exception as e:
+        print(f"{Colors.FAIL}✗ Erro ao carregar grafo: {e}{Colors.ENDC}")
+        return None
+    return n, edges
+
+
+def cmd_analyze(args):
+    """Analisa um grafo de arquivo."""
+    print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
+    print(f"{Colors.BOLD}ANÁLISE DE CAMINHO HAMILTONIANO{Colors.ENDC}")
+    print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}\n")
+    
+    # Corpus .hpc: analisar cada grafo (preguiçosamente)
+    if is_corpus_file(args.file):
+        return _analyze_corpus(args)
+    
+    loaded = _load_graph_file(args.file, getattr(args, 'fast_io', False))
+    if loaded is None:
+        return 1
+    n, edges = loaded
+    
+    _analyze_graph(n, edges, args, label=Path(args.file).stem)
+    
+    print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
+    return 0
+
+
+def cmd_bench(args):
+    """Micro-benchmark dos métodos sobre um grafo."""
+    print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
+    print(f"{Colors.BOLD}BENCHMARK{Colors.ENDC}")
+    print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}\n")
+    
+    engines = [x.strip() for x in args.engines.split(',') if x.strip()]
+    unknown = [e for e in engines if e not in ENGINES]
+    if unknown or not engines:
+        print(f"{Colors.FAIL}✗ Método(s) desconhecido(s): {', '.join(unknown) or '-'} "
+              f"(disponíveis: {', '.join(ENGINES)}){Colors.ENDC}")
+        return 1
+    
+    loaded = _load_graph_file(args.file, args.fast_io)
+    if loaded is None:
+        return 1
+    n, edges = loaded
+    
+    print(f"Configuração:")
+    print(f"  Amostras: {args.repeat} (+{args.warmup} de aquecimento)")
+    print(f"  Loops por amostra: {args.loops or f'calibrado (amostra >= {args.min_time}s)'}")
+    print(f"  GC: {'ligado' if args.keep_gc else 'desligado durante as medições'}")
+    print()
+    
+    results = {}
+    for name in engines:
+        print(f"{Colors.OKCYAN}Medindo {name}...{Colors.ENDC}", flush=True)
+        func, func_args = prepare_engine(name, n, edges)
+        results[name] = benchmark(
+            func, *func_args,
+            repeat=args.repeat, warmup=args.warmup, loops=args.loops,
+            min_time=args.min_time, time_budget=args.budget, disable_gc=not args.keep_gc
+        )
+        print(f"  {format_benchmark(results[name])}")
+    
+    print(f"\n{Colors.BOLD}{'Método':<12} {'Mín':>12} {'Mediana':>12} {'IQR':>12} {'Outliers':>9} {'Amostras':>10}{Colors.ENDC}")
+    for name, result in results.items():
+        print(f"{name:<12} {format_time(result['min']):>12} {format_time(result['median']):>12} "
+              f"{format_time(result['iqr']):>12} {result['outliers']:>9} "
+              f"{len(result['samples']):>4} x {result['loops']:<5}")
+    
+    # Razões em relação ao primeiro método (mínimo e mediana)
+    if len(results) > 1:
+        reference = engines[0]
+        print(f"\nRazão em relação a {reference} (mín / mediana):")
+        for name in engines[1:]:
+            print(f"  {name}: {results[name]['min'] / results[reference]['min']:.2f}x / "
+                  f"{results[name]['median'] / results[reference]['median']:.2f}x")
+    
+    print(f"\n{Colors.HEADER}{'='*80}{Colors.ENDC}")
+    return 0
+
+
 def cmd_generate(args):
     """Gera um grafo aleatório."""
     print(f"{Colors.HEADER}GERAÇÃO DE GRAFO ALEATÓRIO{Colors.ENDC}\n")
     
-    n = args.n
-    density_map = {'sparse': 0.2, 'medium': 0.5, 'dense': 0.8}
-    p = density_map.get(args.density, 0.5)
+    n, edges, info = generate_instance(args.generator, args.n, args.density)
+    p = info['probability']
     
     print(f"Parâmetros:")
     print(f"  Vértices: {n}")
-    print(f"  Densidade: {args.density} (p={p})")
-    
-    edges = generate_random_graph(n, p)
+    print(f"  Gerador: {args.generator}")
+    print(f"  Densidade: {args.density} (p={p:.4g})")
     
     print(f"{Colors.OKGREEN}✓{Colors.ENDC} Grafo gerado: {len(edges)} arestas\n")
     
-    if args.output:
+    if args.output and (args.output.endswith('.hpc') or is_corpus_file(args.output)):
+        # Acrescentar ao corpus com os parâmetros de geração
+        with GraphCorpus(args.output, 'a') as corpus:
+            graph_id = corpus.add(n, edges, generator=args.generator, density=args.density,
+                                  p=p, answer=info.get('known_answer'))
+        print(f"{Colors.OKGREEN}✓{Colors.ENDC} Acrescentado ao corpus {args.output} como #{graph_id}")
+    elif args.output:
         # Converter para formato de adjacência
         adj = [[] for _ in range(n)]
         for u, v in edges:
@@ -180,6 +402,92 @@ def cmd_generate(args):
     return 0
 
 
+def cmd_convert(args):
+    """Converte um grafo (qualquer formato suportado) para texto ou binário .hpg."""
+    print(f"{Colors.HEADER}CONVERSÃO DE GRAFO{Colors.ENDC}\n")
+    
+    try:
+        n, indptr, indices = load_graph_auto(args.input)
+    except Exception as e:
+        print(f"{Colors.FAIL}✗ Erro ao carregar grafo: {e}{Colors.ENDC}")
+        return 1
+    
+    print(f"Entrada: {args.input} ({n} vértices, {len(indices) // 2} arestas)")
+    
+    if strip_compression_suffix(args.output).endswith('.hpg'):
+        metadata = {'source': os.path.basename(args.input)}
+        for item in args.metadata or []:
+            key, _, value = item.partition('=')
+            metadata[key] = value
+        save_graph_binary(args.output, n, indptr, indices, metadata=metadata)
+    else:
+        save_graph(args.output, n, csr_to_adj(n, indptr, indices))
+    
+    print(f"{Colors.OKGREEN}✓{Colors.ENDC} Salvo em: {args.output}")
+    return 0
+
+
+def cmd_corpus(args):
+    """Cria/lista corpus .hpc de instâncias."""
+    if args.corpus_command == 'pack':
+        meta = _parse_where(args.meta)
+        reserved = sorted(RESERVED_KEYS.intersection(meta))
+        if reserved:
+            print(f"{Colors.FAIL}✗{Colors.ENDC} Metadados com chaves reservadas do índice: {', '.join(reserved)}")
+            return 1
+        corpus = _open_corpus(args.corpus, 'a')
+        if corpus is None:
+            return 1
+        with corpus:
+            for path in args.files:
+                try:
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore')
+                        n, indptr, indices = load_graph_auto(path)
+                except Exception as e:
+                    print(f"{Colors.FAIL}✗{Colors.ENDC} {path}: {e}")
+                    continue
+                u, v = csr_to_edges(n, indptr, indices)
+                graph_id = corpus.add(n, list(zip(u.tolist(), v.tolist())),
+                                      **{'source': os.path.basename(path), **meta})
+                print(f"{Colors.OKGREEN}✓{Colors.ENDC} #{graph_id} {path} ({n} vértices, {len(u)} arestas)")
+        return 0
+    
+    corpus = _open_corpus(args.corpus)
+    if corpus is None:
+        return 1
+    with corpus:
+        criteria = _parse_where(args.where)
+        entries = corpus.find(**criteria)
+        print(f"{'id':<6} {'n':<8} {'m':<10} metadados")
+        for entry in entries:
+            meta = {k: v for k, v in entry.items() if k not in RESERVED_KEYS}
+            if 'name' in entry:
+                meta = {'name': entry['name'], **meta}
+            print(f"{entry['id']:<6} {entry['n']:<8} {entry['m']:<10} {meta}")
+        print(f"\n{len(entries)} de {len(corpus)} grafos")
+    return 0
+
+
+def _format_memory(mb):
+    """Memória média em MB, ou 'n/d' se nenhuma execução teve a passada de memória."""
+    return "n/d" if math.isnan(mb) else f"{mb:.1f}MB"
+
+
+def _print_search_tree(stats):
+    """Resumo da instrumentação da árvore de busca do backtracking."""
+    print(f"  Becos sem saída: {stats['bt_avg_dead_ends']:.1f} (média)")
+    print(f"  Profundidade:    {stats['bt_avg_max_depth']:.1f} média, {stats['bt_max_depth']} máxima")
+    if stats['bt_avg_first_solution_time'] > 0:
+        print(f"  1ª solução em:   {stats['bt_avg_first_solution_time']:.6f}s (média das execuções com sucesso)")
+    for rule in PRUNE_RULES:
+        print(f"  Podas '{rule}':  {stats[f'bt_avg_prunes_{rule}']:.1f} (média)")
+    print(f"  Por profundidade (expansões médias / fator de ramificação):")
+    for depth, (expanded, branching) in enumerate(
+            zip(stats['bt_avg_depth_expansions'], stats['bt_depth_branching']), start=1):
+        print(f"    {depth:>4}: {expanded:>12.1f}  {branching:>6.2f}")
+
+
 def cmd_experiment(args):
     """Executa experimento individual."""
     print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
@@ -187,19 +495,35 @@ def cmd_experiment(args):
     print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}\n")
     
     timeout = getattr(args, 'timeout', 60)
-    runner = ExperimentRunner(timeout_seconds=timeout)
+    if args.memory_limit and args.isolation != 'subprocess':
+        print(f"{Colors.FAIL}✗ --memory-limit requer --isolation subprocess{Colors.ENDC}")
+        return 1
+    runner = ExperimentRunner(timeout_seconds=timeout, seed=args.seed, workers=args.workers,
+                              isolation=args.isolation, memory_limit_mb=args.memory_limit,
+                              measure=args.measure, instrument=args.instrument)
+    status = LiveStatus(args.progress)
+    if args.progress:
+        runner.telemetry = status.update
+    if args.db:
+        runner.sink = ResultsDB(args.db)
     
     print(f"Configuração:")
     print(f"  n = {args.n}")
     print(f"  densidade = {args.density}")
+    print(f"  gerador = {args.generator}")
     print(f"  repetições = {args.repetitions}")
     print(f"  timeout = {timeout}s")
+    print(f"  semente = {runner.seed}")
+    print(f"  workers = {runner.workers}")
+    print(f"  medição = {args.measure}")
+    print(f"  instrumentação = {'sim' if args.instrument else 'não'}")
     print()
     
     print(f"{Colors.OKCYAN}Executando experimento...{Colors.ENDC}\n")
     
-    result = runner.run_single_experiment(args.n, args.density, args.repetitions)
+    result = runner.run_single_experiment(args.n, args.density, args.repetitions, args.generator)
     stats = result['statistics']
+    status.end()
     
     print(f"{Colors.OKGREEN}✓ Experimento concluído!{Colors.ENDC}\n")
     print(f"{Colors.BOLD}Resultados:{Colors.ENDC}")
@@ -209,24 +533,46 @@ def cmd_experiment(args):
     print(f"  Taxa de sucesso: {stats['bt_success_rate']:.1%}")
     print(f"  Passos médios:   {stats['bt_avg_steps']:.0f}")
     print(f"  Passos min/max:  {stats['bt_min_steps']:.0f} / {stats['bt_max_steps']:.0f}")
+    if args.measure != 'time' and not math.isnan(stats['bt_avg_memory']):
+        print(f"  Pico de memória: {stats['bt_avg_memory']:.4f} MB "
+              f"(base do interpretador: {stats['bt_avg_baseline_memory']:.1f} MB)")
+    if args.instrument and stats['bt_instrumented_count']:
+        _print_search_tree(stats)
     
     print(f"\n{Colors.UNDERLINE}Heurística:{Colors.ENDC}")
     print(f"  Tempo médio:     {stats['h_avg_time']:.6f}s")
     print(f"  Tempo min/max:   {stats['h_min_time']:.6f}s / {stats['h_max_time']:.6f}s")
     print(f"  Taxa de sucesso: {stats['h_success_rate']:.1%}")
+    if args.measure != 'time' and not math.isnan(stats['h_avg_memory']):
+        print(f"  Pico de memória: {stats['h_avg_memory']:.4f} MB "
+              f"(base do interpretador: {stats['h_avg_baseline_memory']:.1f} MB)")
     
-    if stats['h_avg_time'] > 0:
+    if stats['h_avg_time'] > 0 and not math.isnan(stats['bt_avg_time']):
         speedup = stats['bt_avg_time'] / stats['h_avg_time']
         print(f"\n{Colors.BOLD}Speedup (BT/H): {speedup:.2f}x{Colors.ENDC}")
     
     if args.output:
         runner.export_to_csv(args.output)
         print(f"\n{Colors.OKGREEN}✓{Colors.ENDC} Resultados exportados para: {args.output}")
+    if args.db:
+        runner.sink.close()
+        print(f"{Colors.OKGREEN}✓{Colors.ENDC} {runner.sink.count} execuções gravadas no banco: {args.db}")
     
     print(f"\n{Colors.HEADER}{'='*80}{Colors.ENDC}")
     return 0
 
 
+def _print_profile_summary(reports, output_dir):
+    """Arquivos de perfil gravados e overhead mediano por método."""
+    print(f"\n{Colors.BOLD}Perfis ({reports[0]['mode']}):{Colors.ENDC} "
+          f"{sum(len(r['files']) for r in reports)} arquivo(s) em {output_dir}")
+    for engine in sorted({r['engine'] for r in reports}):
+        overheads = sorted(r['overhead'] for r in reports if r['engine'] == engine and r['overhead'] is not None)
+        if overheads:
+            print(f"  {engine}: {len(overheads)} instância(s), overhead mediano "
+                  f"{overheads[len(overheads) // 2]:+.0%} (mín {overheads[0]:+.0%}, máx {overheads[-1]:+.0%})")
+
+
 def cmd_batch(args):
     """Executa batch de experimentos."""
     print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}")
@@ -234,7 +580,57 @@ def cmd_batch(args):
     print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}\n")
     
     timeout = getattr(args, 'timeout', 60)
-    runner = ExperimentRunner(timeout_seconds=timeout)
+    if args.memory_limit and args.isolation != 'subprocess':
+        print(f"{Colors.FAIL}✗ --memory-limit requer --isolation subprocess{Colors.ENDC}")
+        return 1
+    
+    # Retomada: execuções já gravadas não são refeitas; a semente do arquivo
+    # garante que as restantes sejam as mesmas de um batch sem interrupção
+    seed = args.seed
+    completed = {}
+    if args.resume:
+        if args.coupled or args.instances or args.corpus:
+            print(f"{Colors.FAIL}✗ --resume só se aplica à grade gerada (sem --coupled/--instances/--corpus){Colors.ENDC}")
+            return 1
+        if args.output and args.output != args.resume:
+            print(f"{Colors.FAIL}✗ Com --resume, os resultados são acrescentados ao próprio arquivo retomado{Colors.ENDC}")
+            return 1
+        args.output = args.resume
+        
+        previous = read_runs(args.resume) if os.path.exists(args.resume) else []
+        seeds = {config['seed'] for config, _ in previous}
+        generators = {config['generator'] for config, _ in previous}
+        if len(seeds) > 1 or None in seeds or (seed is not None and seeds and seed not in seeds):
+            print(f"{Colors.FAIL}✗ Sementes incompatíveis em {args.resume}: {sorted(map(str, seeds))}{Colors.ENDC}")
+            return 1
+        if generators and generators != {args.generator}:
+            print(f"{Colors.FAIL}✗ {args.resume} foi gerado com: {', '.join(sorted(generators))}{Colors.ENDC}")
+            return 1
+        if seeds:
+            seed = seeds.pop()
+        completed = {(c['n_requested'], c['density'], run['run_id']): (c, run) for c, run in previous}
+    
+    runner = ExperimentRunner(timeout_seconds=timeout, seed=seed, workers=args.workers,
+                              isolation=args.isolation, memory_limit_mb=args.memory_limit,
+                              measure=args.measure, instrument=args.instrument,
+                              profile=args.profile, profile_dir=args.profile_dir)
+    status = LiveStatus(args.progress)
+    
+    # Métricas Prometheus: arquivo (textfile collector) e/ou endpoint HTTP local
+    metrics = exporter = None
+    if args.metrics_file or args.metrics_port is not None:
+        metrics = RunnerMetrics()
+        try:
+            exporter = MetricsExporter(metrics.registry, path=args.metrics_file, port=args.metrics_port,
+                                       interval=args.metrics_interval)
+        except (OSError, ValueError) as e:
+            print(f"{Colors.FAIL}✗ Erro ao publicar métricas: {e}{Colors.ENDC}")
+            return 1
+    if args.progress:
+        runner.telemetry = (
+            status.update if metrics is None
+            else lambda info: (status.update(info), metrics.telemetry(info))
+        )
     
     # Parse tamanhos
     if args.sizes:
@@ -248,37 +644,184 @@ def cmd_batch(args):
     else:
         densities = ['sparse', 'medium', 'dense']
     
+    if args.frontier is not None and (args.adaptive or args.coupled or args.instances or args.corpus):
+        print(f"{Colors.FAIL}✗ --frontier só se aplica à grade gerada (sem --adaptive/--coupled/--instances/--corpus){Colors.ENDC}")
+        return 1
+    if args.frontier is not None and not 0 <= args.frontier <= 1:
+        print(f"{Colors.FAIL}✗ --frontier espera uma taxa entre 0 e 1{Colors.ENDC}")
+        return 1
+    
+    if args.coupled and args.generator not in COUPLED_GENERATORS:
+        print(f"{Colors.FAIL}✗ --coupled requer um gerador G(n, p): {', '.join(COUPLED_GENERATORS)}{Colors.ENDC}")
+        return 1
+    if args.corpus:
+        # Corpus ausente ou inválido: erro antes de criar os arquivos de saída
+        corpus = _open_corpus(args.corpus)
+        if corpus is None:
+            return 1
+        corpus.close()
+    
     print(f"Configuração:")
     print(f"  Tamanhos: {sizes}")
     print(f"  Densidades: {densities}")
+    print(f"  Gerador: {args.generator}")
     print(f"  Repetições: {args.repetitions}")
     print(f"  Total de experimentos: {len(sizes) * len(densities)}")
     print(f"  Timeout por experimento: {args.timeout if hasattr(args, 'timeout') else 60}s")
+    print(f"  Semente: {runner.seed}")
+    print(f"  Workers: {runner.workers}")
+    print(f"  Medição: {args.measure}")
+    if args.instrument:
+        print(f"  Instrumentação da busca: sim")
+    if args.profile:
+        print(f"  Perfil: {args.profile} (execuções extras na 1ª repetição de cada configuração, em {args.profile_dir})")
+    if exporter is not None:
+        targets = [t for t in (exporter.path, exporter.url) if t]
+        print(f"  Métricas: {', '.join(targets)}")
+    if args.resume:
+        grid = {(n, d, i) for n in sizes for d in densities for i in range(args.repetitions)}
+        print(f"  Retomando {args.resume}: {len(grid & completed.keys())} execuções concluídas, "
+              f"{len(grid - completed.keys())} restantes")
     print()
     
+    # Saída incremental: cada execução é gravada (com fsync) ao terminar, e
+    # o store em memória guarda só as colunas numéricas (sem caminhos)
+    sinks = []
+    if args.output:
+        try:
+            sinks.append(ResultSink(args.output, append=bool(args.resume)))
+        except ValueError as e:
+            print(f"{Colors.FAIL}✗ {e}{Colors.ENDC}")
+            return 1
+    if args.db:
+        sinks.append(ResultsDB(args.db))
+    if sinks:
+        runner.store.path_policy = 'drop'
+    writers = sinks + ([metrics] if metrics is not None else [])
+    if writers:
+        runner.sink = writers[0] if len(writers) == 1 else TeeSink(*writers)
+    
     total = len(sizes) * len(densities)
     current = 0
     
+    # Corpus .hpc: grafos lidos sob demanda em vez da grade gerada
+    if args.corpus:
+        sizes = []
+        criteria = _parse_where(args.where)
+        for result in runner.iter_corpus_experiments(args.corpus, args.repetitions, **criteria):
+            current += 1
+            stats = result['statistics']
+            print(f"{Colors.OKCYAN}[{current}]{Colors.ENDC} {result['instance']} (n={result['n']})... "
+                  f"{Colors.OKGREEN}✓{Colors.ENDC} (BT: {stats['bt_avg_time']:.4f}s, H: {stats['h_avg_time']:.4f}s)")
+    
+    # Instâncias de arquivo (texto ou .hpg) em vez da grade gerada
+    if args.instances:
+        sizes = []
+        instances = [x.strip() for x in args.instances.split(',')]
+        total = len(instances)
+        for path in instances:
+            current += 1
+            status.begin(f"{Colors.OKCYAN}[{current}/{total}]{Colors.ENDC} {path}...")
+            result = runner.run_instance_experiment(path, args.repetitions)
+            stats = result['statistics']
+            status.end()
+            print(f"{Colors.OKGREEN}✓{Colors.ENDC} (n={result['n']}, BT: {stats['bt_avg_time']:.4f}s, H: {stats['h_avg_time']:.4f}s)")
+    
+    # Varredura acoplada: uma matriz aleatória por (n, repetição), todas as densidades
+    if args.coupled:
+        for n in sizes:
+            current += len(densities)
+            status.begin(f"{Colors.OKCYAN}[{current}/{total}]{Colors.ENDC} n={n}, densidades={','.join(densities)} (acoplado)...")
+            results = runner.run_coupled_sweep(n, densities, args.repetitions, args.generator,
+                                               reuse_solutions=not args.no_reuse)
+            status.end()
+            reused = sum(r['statistics']['bt_reused_count'] for r in results)
+            print(f"{Colors.OKGREEN}✓{Colors.ENDC} (BT reaproveitado em {reused} execuções)")
+        sizes = []
+    
+    # Busca da fronteira: maior n viável por densidade, entre o menor e o maior tamanho
+    if args.frontier_search:
+        threshold = args.frontier if args.frontier is not None else 0.5
+        for density in densities:
+            status.begin(f"{Colors.OKCYAN}Fronteira{Colors.ENDC} densidade={density} "
+                         f"(n entre {min(sizes)} e {max(sizes)})...")
+            entry = runner.search_frontier(density, args.generator, args.repetitions, threshold,
+                                           start_n=min(sizes), max_n=max(sizes))
+            status.end()
+            evaluated = ", ".join(f"{n}" for n, _ in entry['evaluated'])
+            print(f"{Colors.OKGREEN}✓{Colors.ENDC} maior n viável: {entry['max_feasible_n']} (avaliados: {evaluated})")
+        sizes = []
+    
+    # Pool de processos e/ou fronteira: a grade (n, densidade, repetição) de uma vez
+    if (runner.workers > 1 or args.frontier is not None) and sizes and not args.adaptive:
+        def report(done, total_tasks):
+            status.begin(f"{Colors.OKCYAN}[{done}/{total_tasks}]{Colors.ENDC} repetições concluídas")
+        
+        results = runner.run_batch_experiments(sizes, densities, args.repetitions, args.generator,
+                                               progress=report, completed=completed,
+                                               frontier_threshold=args.frontier)
+        status.end()
+        print()
+        for result in results:
+            stats = result['statistics']
+            timeout_mark = f" ⏱️" if stats.get('bt_timeout_count', 0) > 0 else ""
+            skipped_mark = " (BT pulado)" if stats.get('bt_skipped_count', 0) else ""
+            print(f"  n={result['n']}, densidade={result['density']}: "
+                  f"BT: {stats['bt_avg_time']:.4f}s, H: {stats['h_avg_time']:.4f}s{timeout_mark}{skipped_mark}")
+        sizes = []
+    
     for n in sizes:
         for density in densities:
             current += 1
-            print(f"{Colors.OKCYAN}[{current}/{total}]{Colors.ENDC} n={n}, densidade={density}...", end=" ", flush=True)
+            status.begin(f"{Colors.OKCYAN}[{current}/{total}]{Colors.ENDC} n={n}, densidade={density}...")
             
-            result = runner.run_single_experiment(n, density, args.repetitions)
+            if args.adaptive:
+                result = runner.run_adaptive_experiment(
+                    n, density, args.generator,
+                    min_reps=args.min_reps, max_reps=args.max_reps,
+                    time_width=args.ci_width, rate_width=args.rate_width,
+                    statistic=args.ci_stat, completed=completed
+                )
+            else:
+                result = runner.run_batch_experiments([n], [density], args.repetitions, args.generator,
+                                                      completed=completed)[0]
             stats = result['statistics']
+            status.end()
             
             timeout_mark = f" ⏱️" if stats.get('bt_timeout_count', 0) > 0 else ""
-            print(f"{Colors.OKGREEN}✓{Colors.ENDC} (BT: {stats['bt_avg_time']:.4f}s, H: {stats['h_avg_time']:.4f}s, Mem BT: {stats.get('bt_avg_memory', 0):.1f}MB){timeout_mark}")
+            print(f"{Colors.OKGREEN}✓{Colors.ENDC} (BT: {stats['bt_avg_time']:.4f}s, H: {stats['h_avg_time']:.4f}s, Mem BT: {_format_memory(stats['bt_avg_memory'])}){timeout_mark}")
+            if args.adaptive:
+                adaptive = result['adaptive']
+                rate_lo, rate_hi = adaptive['success_ci']
+                mark = "" if adaptive['converged'] else f" {Colors.WARNING}(alvo não atingido){Colors.ENDC}"
+                if adaptive['time_ci'] is None:
+                    time_text = "indefinido (tempos insuficientes)"
+                else:
+                    time_text = "[{:.4f}, {:.4f}]s".format(*adaptive['time_ci'])
+                print(f"      {result['repetitions']} repetições; IC tempo BT {time_text}, "
+                      f"IC sucesso BT [{rate_lo:.0%}, {rate_hi:.0%}]{mark}")
     
     print(f"\n{Colors.OKGREEN}✓ Batch concluído!{Colors.ENDC}\n")
     
     # Mostrar sumário
     print(runner.get_summary_table())
+    if runner.frontier:
+        print(f"\n{Colors.BOLD}Fronteira de viabilidade:{Colors.ENDC}")
+        print(runner.frontier_table())
+    if runner.profile_reports:
+        _print_profile_summary(runner.profile_reports, args.profile_dir)
     
     # Exportar
-    if args.output:
-        runner.export_to_csv(args.output)
-        print(f"\n{Colors.OKGREEN}✓{Colors.ENDC} Resultados exportados para: {args.output}")
+    if exporter is not None:
+        exporter.close()
+    if runner.sink is not None:
+        runner.sink.close()
+    if sinks:
+        print()
+        for sink in sinks:
+            print(f"{Colors.OKGREEN}✓{Colors.ENDC} {sink.count} execuções gravadas em: {sink.path}")
+        if args.adaptive and args.output:
+            print(f"{Colors.OKGREEN}✓{Colors.ENDC} Critérios de parada em: {adaptive_path(args.output)}")
         
         # Gerar gráficos
         if hasattr(args, 'plots') and args.plots:
@@ -318,15 +861,42 @@ Exemplos:
   # Analisar grafo de arquivo
   python main.py analyze instances/auto_n10_p05.txt
   python main.py analyze instances/auto_n10_p05.txt --algorithm both -v
+  python main.py analyze grafo_grande.txt --algorithm heur --fast-io
+  python main.py analyze instances/auto_n10_p05.txt --profile sample
+  
+  # Micro-benchmark dos métodos (mín/mediana/IQR por amostras calibradas)
+  python main.py bench instances/auto_n10_p05.txt --engines bt,h,bt-legacy
   
   # Gerar grafo aleatório
   python main.py generate 20 medium --output meu_grafo.txt
   
+  # Converter para binário mapeável em memória
+  python main.py convert instances/auto_n10_p05.txt auto_n10_p05.hpg
+  
+  # Empacotar instâncias em um corpus e executar o batch sobre ele
+  python main.py corpus pack instancias.hpc notebooks/grafo_exp_*.txt
+  python main.py batch --corpus instancias.hpc --where n=10
+  
   # Executar experimento
   python main.py experiment 30 sparse --repetitions 10 --output results.csv
   
   # Executar batch
   python main.py batch --sizes 10,20,30 --densities sparse,dense --output batch.csv
+  python main.py batch --generator planted --sizes 20,30,40
+  python main.py batch --coupled --sizes 20,30 --output acoplado.csv
+  python main.py batch --workers 8 --seed 42 --output batch.csv
+  python main.py batch --sizes 20,30 --output batch.jsonl
+  python main.py batch --sizes 20,30,40 --resume batch.csv
+  python main.py batch --adaptive --min-reps 5 --max-reps 100 --ci-width 0.1
+  python main.py batch --sizes 10,20,30,40,50,60 --frontier 0.5 --timeout 5
+  python main.py batch --sizes 8,256 --densities sparse --frontier-search --timeout 2
+  python main.py batch --isolation subprocess --memory-limit 2048 --timeout 30
+  python main.py batch --sizes 20,30 --db results.db --workers 4
+  python main.py batch --sizes 20,30,40 --measure time --output tempos.csv
+  python main.py batch --sizes 20,30 --profile --profile-dir perfis
+  python main.py batch --sizes 40,50 --densities sparse --timeout 600 --progress
+  python main.py batch --sizes 30,40 --metrics-file /var/lib/node_exporter/hamiltonian.prom
+  python main.py batch --sizes 30,40 --metrics-port 9105
   
   # Interface gráfica (requer PyQt6)
   python main.py gui
@@ -339,18 +909,50 @@ Exemplos:
     
     # Comando: analyze
     parser_analyze = subparsers.add_parser('analyze', help='Analisar grafo de arquivo')
-    parser_analyze.add_argument('file', help='Arquivo do grafo')
+    parser_analyze.add_argument('file', help='Arquivo do grafo (n m, .hpg, TSPLIB .hcp ou DIMACS; detectado automaticamente)')
     parser_analyze.add_argument('-a', '--algorithm', choices=['bt', 'heur', 'both'], 
                                 default='both', help='Algoritmo a usar (padrão: both)')
     parser_analyze.add_argument('-v', '--verbose', action='store_true', 
                                 help='Mostrar caminho completo')
+    parser_analyze.add_argument('--fast-io', action='store_true',
+                                help='Usar carregador vetorizado para arquivos grandes (requer numpy)')
+    parser_analyze.add_argument('--ids', help='Corpus .hpc: ids/nomes dos grafos separados por vírgula')
+    parser_analyze.add_argument('--profile', nargs='?', const='cprofile', choices=PROFILE_MODES,
+                                help='Perfilar os métodos numa execução extra: cprofile (padrão; .pstats + pilhas '
+                                     'colapsadas) ou sample (amostragem, só pilhas colapsadas); o overhead é relatado')
+    parser_analyze.add_argument('--profile-dir', default='results/profiles', metavar='DIR',
+                                help='Diretório dos arquivos de perfil (padrão: results/profiles)')
+    parser_analyze.add_argument('-w', '--where', action='append', metavar='CHAVE=VALOR',
+                                help='Corpus .hpc: filtrar grafos por metadado (pode repetir)')
+    
+    # Comando: bench
+    parser_bench = subparsers.add_parser('bench', help='Micro-benchmark dos métodos sobre um grafo')
+    parser_bench.add_argument('file', help='Arquivo do grafo (n m, .hpg, TSPLIB .hcp ou DIMACS)')
+    parser_bench.add_argument('-e', '--engines', default='bt,h',
+                              help=f"Métodos separados por vírgula ({', '.join(ENGINES)}; padrão: bt,h)")
+    parser_bench.add_argument('-r', '--repeat', type=int, default=7,
+                              help='Amostras registradas por método (padrão: 7)')
+    parser_bench.add_argument('--warmup', type=int, default=1,
+                              help='Amostras de aquecimento descartadas (padrão: 1)')
+    parser_bench.add_argument('-l', '--loops', type=int,
+                              help='Chamadas por amostra (padrão: calibrado por --min-time)')
+    parser_bench.add_argument('--min-time', type=float, default=0.05,
+                              help='Duração mínima de uma amostra na calibração, em segundos (padrão: 0.05)')
+    parser_bench.add_argument('--budget', type=float,
+                              help='Tempo máximo por método, em segundos (ao menos uma amostra)')
+    parser_bench.add_argument('--keep-gc', action='store_true',
+                              help='Manter o coletor de lixo ligado durante as medições')
+    parser_bench.add_argument('--fast-io', action='store_true',
+                              help='Usar carregador vetorizado para arquivos grandes (requer numpy)')
     
     # Comando: generate
     parser_generate = subparsers.add_parser('generate', help='Gerar grafo aleatório')
     parser_generate.add_argument('n', type=int, help='Número de vértices')
     parser_generate.add_argument('density', choices=['sparse', 'medium', 'dense'], 
                                  help='Densidade do grafo')
-    parser_generate.add_argument('-o', '--output', help='Arquivo de saída')
+    parser_generate.add_argument('-o', '--output', help='Arquivo de saída (.hpc acrescenta a um corpus)')
+    parser_generate.add_argument('-g', '--generator', choices=list(GENERATORS), default='gnp',
+                                 help=f"Família de grafos ({', '.join(GENERATORS)}; padrão: gnp)")
     
     # Comando: experiment
     parser_exp = subparsers.add_parser('experiment', help='Executar experimento individual')
@@ -362,6 +964,29 @@ Exemplos:
     parser_exp.add_argument('-t', '--timeout', type=int, default=60,
                             help='Timeout em segundos por experimento (padrão: 60)')
     parser_exp.add_argument('-o', '--output', help='Arquivo CSV de saída')
+    parser_exp.add_argument('--db', metavar='ARQUIVO',
+                            help='Banco SQLite de resultados (criado se não existir; acumula execuções)')
+    parser_exp.add_argument('-j', '--workers', type=int, default=1,
+                            help='Processos para executar as repetições em paralelo (padrão: 1)')
+    parser_exp.add_argument('--seed', type=int,
+                            help='Semente base (cada n/densidade/repetição deriva a sua; padrão: aleatória)')
+    parser_exp.add_argument('--isolation', choices=['inline', 'subprocess'], default='inline',
+                            help='inline: timeout por sinal no próprio processo; subprocess: cada medição '
+                                 'num processo filho, morto no timeout (padrão: inline)')
+    parser_exp.add_argument('--memory-limit', type=float, metavar='MB',
+                            help='Teto de memória por medição em MB (requer --isolation subprocess)')
+    parser_exp.add_argument('--measure', choices=['time', 'memory', 'both'], default='both',
+                            help='time: só tempo (sem tracemalloc, GC desligado); memory: só memória '
+                                 '(tempo inflado pelo rastreamento); both: tempo e memória em execuções '
+                                 'separadas (padrão: both)')
+    parser_exp.add_argument('--progress', action='store_true',
+                            help='Linha de status ao vivo durante a busca: nós/s, profundidade, maior caminho '
+                                 'e tempo decorrido (o backtracking roda instrumentado, mais lento; não vale com --workers > 1)')
+    parser_exp.add_argument('--instrument', action='store_true',
+                            help='Instrumentar o backtracking: expansões e ramificação por profundidade, '
+                                 'becos sem saída, podas e tempo até a 1ª solução (custo extra no tempo medido)')
+    parser_exp.add_argument('-g', '--generator', choices=list(GENERATORS), default='gnp',
+                            help=f"Família de grafos ({', '.join(GENERATORS)}; padrão: gnp)")
     parser_exp.add_argument('--plots', action='store_true',
                             help='Gerar gráficos (requer matplotlib)')
     
@@ -373,9 +998,103 @@ Exemplos:
                               help='Número de repetições (padrão: 5)')
     parser_batch.add_argument('-t', '--timeout', type=int, default=60,
                               help='Timeout em segundos por experimento (padrão: 60)')
-    parser_batch.add_argument('-o', '--output', help='Arquivo CSV de saída')
+    parser_batch.add_argument('-o', '--output',
+                              help='Arquivo de saída, gravado a cada execução (.csv, ou .jsonl com os caminhos)')
+    parser_batch.add_argument('--db', metavar='ARQUIVO',
+                              help='Banco SQLite de resultados (modo WAL; vários batches podem gravar '
+                                   'no mesmo banco ao mesmo tempo)')
+    parser_batch.add_argument('-j', '--workers', type=int, default=1,
+                              help='Processos para executar as repetições em paralelo (padrão: 1)')
+    parser_batch.add_argument('--seed', type=int,
+                              help='Semente base (cada n/densidade/repetição deriva a sua; padrão: aleatória)')
+    parser_batch.add_argument('--isolation', choices=['inline', 'subprocess'], default='inline',
+                              help='inline: timeout por sinal no próprio processo; subprocess: cada medição '
+                                   'num processo filho, morto no timeout (padrão: inline)')
+    parser_batch.add_argument('--memory-limit', type=float, metavar='MB',
+                              help='Teto de memória por medição em MB (requer --isolation subprocess)')
+    parser_batch.add_argument('--measure', choices=['time', 'memory', 'both'], default='both',
+                              help='time: só tempo (sem tracemalloc, GC desligado); memory: só memória '
+                                   '(tempo inflado pelo rastreamento); both: tempo e memória em execuções '
+                                   'separadas (padrão: both)')
+    parser_batch.add_argument('--profile', nargs='?', const='cprofile', choices=PROFILE_MODES,
+                              help='Perfilar os métodos numa execução extra: cprofile (padrão; .pstats + pilhas '
+                                   'colapsadas) ou sample (amostragem, só pilhas colapsadas); o overhead é relatado')
+    parser_batch.add_argument('--profile-dir', default='results/profiles', metavar='DIR',
+                              help='Diretório dos arquivos de perfil (padrão: results/profiles)')
+    parser_batch.add_argument('--metrics-file', metavar='ARQUIVO',
+                              help='Métricas Prometheus (execuções, desfechos, histograma de tempos, nós/s, RSS) '
+                                   'regravadas atomicamente neste arquivo .prom (textfile collector do node_exporter)')
+    parser_batch.add_argument('--metrics-port', type=int, metavar='PORTA',
+                              help='Servir as métricas em http://127.0.0.1:PORTA/metrics')
+    parser_batch.add_argument('--metrics-interval', type=float, default=5.0, metavar='S',
+                              help='Período de regravação do --metrics-file em segundos (padrão: 5)')
+    parser_batch.add_argument('--progress', action='store_true',
+                              help='Linha de status ao vivo durante a busca: nós/s, profundidade, maior caminho '
+                                   'e tempo decorrido (o backtracking roda instrumentado, mais lento; não vale com --workers > 1)')
+    parser_batch.add_argument('--instrument', action='store_true',
+                              help='Instrumentar o backtracking: expansões e ramificação por profundidade, '
+                                   'becos sem saída, podas e tempo até a 1ª solução (custo extra no tempo medido)')
+    parser_batch.add_argument('-g', '--generator', choices=list(GENERATORS), default='gnp',
+                              help=f"Família de grafos ({', '.join(GENERATORS)}; padrão: gnp)")
     parser_batch.add_argument('--plots', action='store_true',
                               help='Gerar gráficos automaticamente (requer matplotlib)')
+    # Modos que substituem a grade (n, densidade) gerada: no máximo um por batch
+    batch_mode = parser_batch.add_mutually_exclusive_group()
+    batch_mode.add_argument('-i', '--instances',
+                              help='Arquivos de grafo (texto, .hpg, .hcp ou DIMACS) separados por vírgula, em vez da grade gerada')
+    batch_mode.add_argument('--corpus', help='Corpus .hpc a executar em vez da grade gerada')
+    parser_batch.add_argument('-w', '--where', action='append', metavar='CHAVE=VALOR',
+                              help='Filtrar grafos do corpus por metadado (pode repetir)')
+    parser_batch.add_argument('--frontier', type=float, metavar='LIMIAR',
+                              help='Modo fronteira: tamanhos em ordem crescente; um método deixa de ser '
+                                   'executado nos n maiores quando sua taxa de timeout numa densidade '
+                                   'passa do limiar (ex.: 0.5)')
+    batch_mode.add_argument('--frontier-search', action='store_true',
+                              help='Buscar (exponencial + binária) o maior n viável do backtracking entre '
+                                   'o menor e o maior tamanho de --sizes (limiar: --frontier, padrão 0.5)')
+    batch_mode.add_argument('--adaptive', action='store_true',
+                              help='Repetições adaptativas: repetir até os intervalos de confiança '
+                                   'atingirem as larguras alvo (ignora --repetitions)')
+    parser_batch.add_argument('--min-reps', type=int, default=5,
+                              help='Com --adaptive, mínimo de repetições (padrão: 5)')
+    parser_batch.add_argument('--max-reps', type=int, default=50,
+                              help='Com --adaptive, máximo de repetições (padrão: 50)')
+    parser_batch.add_argument('--ci-width', type=float, default=0.2,
+                              help='Largura máxima do IC 95%% do tempo, relativa ao centro (padrão: 0.2)')
+    parser_batch.add_argument('--rate-width', type=float, default=0.3,
+                              help='Largura máxima do IC de Wilson da taxa de sucesso (padrão: 0.3)')
+    parser_batch.add_argument('--ci-stat', choices=['mean', 'median'], default='mean',
+                              help='Estatística do tempo para o IC (padrão: mean)')
+    parser_batch.add_argument('--resume', metavar='ARQUIVO',
+                              help='Retomar um batch: pula as execuções já gravadas no arquivo '
+                                   '(mesma semente) e acrescenta as restantes')
+    batch_mode.add_argument('--coupled', action='store_true',
+                              help='Varredura acoplada: densidades de uma mesma repetição são subgrafos '
+                                   'encaixados (geradores gnp e threshold)')
+    parser_batch.add_argument('--no-reuse', action='store_true',
+                              help='Com --coupled, executar o backtracking mesmo quando um caminho de '
+                                   'densidade menor já é conhecido')
+    
+    # Comando: convert
+    parser_convert = subparsers.add_parser('convert', help='Converter grafo entre texto e binário .hpg')
+    parser_convert.add_argument('input', help='Arquivo de entrada (texto, .hpg, .hcp ou DIMACS)')
+    parser_convert.add_argument('output', help='Arquivo de saída (.hpg para binário, texto caso contrário; '
+                                               '.gz/.bz2/.xz comprime)')
+    parser_convert.add_argument('-m', '--metadata', action='append', metavar='CHAVE=VALOR',
+                                help='Metadado extra para o .hpg (pode repetir)')
+    
+    # Comando: corpus
+    parser_corpus = subparsers.add_parser('corpus', help='Criar/listar corpus .hpc de instâncias')
+    corpus_sub = parser_corpus.add_subparsers(dest='corpus_command', required=True)
+    parser_pack = corpus_sub.add_parser('pack', help='Acrescentar arquivos de grafo a um corpus')
+    parser_pack.add_argument('corpus', help='Arquivo .hpc (criado se não existir)')
+    parser_pack.add_argument('files', nargs='+', help='Arquivos de grafo (qualquer formato suportado)')
+    parser_pack.add_argument('-m', '--meta', action='append', metavar='CHAVE=VALOR',
+                             help='Metadado aplicado a todos os grafos (pode repetir)')
+    parser_list = corpus_sub.add_parser('list', help='Listar grafos de um corpus')
+    parser_list.add_argument('corpus', help='Arquivo .hpc')
+    parser_list.add_argument('-w', '--where', action='append', metavar='CHAVE=VALOR',
+                             help='Filtrar por metadado (pode repetir)')
     
     # Comando: gui
     parser_gui = subparsers.add_parser('gui', help='Iniciar interface gráfica (requer PyQt6)')
@@ -389,8 +1108,14 @@ Exemplos:
     # Executar comando
     if args.command == 'analyze':
         return cmd_analyze(args)
+    elif args.command == 'bench':
+        return cmd_bench(args)
     elif args.command == 'generate':
         return cmd_generate(args)
+    elif args.command == 'convert':
+        return cmd_convert(args)
+    elif args.command == 'corpus':
+        return cmd_corpus(args)
     elif args.command == 'experiment':
         return cmd_experiment(args)
     elif args.command == 'batch':
@@ -1,4 +1,26 @@
-def find_hamiltonian_path_bt(n, edges, collect_stats=False):
+import time
+
+from src.algorithms.progress import PROGRESS_CHECK_MASK, make_reporter
+
+# Regras de poda do backtracking (contadas com `instrument=True`):
+# 'visited' = vizinho descartado por já estar no caminho
+PRUNE_RULES = ('visited',)
+
+
+def find_hamiltonian_path_bt(n, edges, collect_stats=False, instrument=False,
+                             progress=None, progress_interval=0.5, stats=None):
+    """
+    Caminho hamiltoniano por backtracking (DFS a partir de cada vértice).
+
+    `stats`, se dado, é o dicionário de estatísticas preenchido (e devolvido
+    com `collect_stats`): os contadores ficam nele mesmo quando a busca é
+    interrompida por exceção (ex.: timeout), o que permite registrar a
+    parte da árvore já explorada.
+    """
+    # A telemetria usa a variante instrumentada (profundidade máxima por nó)
+    if instrument or progress is not None:
+        return _find_hamiltonian_path_bt_instrumented(n, edges, collect_stats, progress, progress_interval, stats)
+
     adj = {i: [] for i in range(n)}
     for u, v in edges:
         adj[u].append(v)
@@ -6,7 +28,8 @@ def find_hamiltonian_path_bt(n, edges, collect_stats=False):
 
     visited = [False] * n
     path = []
-    stats = {"steps": 0}
+    stats = {} if stats is None else stats
+    stats["steps"] = 0
 
     def backtrack(u):
         stats["steps"] += 1
@@ -32,3 +55,95 @@ def find_hamiltonian_path_bt(n, edges, collect_stats=False):
             return path, stats if collect_stats else path
 
     return None, stats if collect_stats else None
+
+
+def _find_hamiltonian_path_bt_instrumented(n, edges, collect_stats, progress=None, progress_interval=0.5,
+                                           stats=None):
+    """
+    Mesma busca de find_hamiltonian_path_bt, instrumentada; é também a
+    busca usada com telemetria de progresso (`progress`), que relata a
+    profundidade máxima mantida aqui.
+
+    Além de `steps`, `stats` recebe:
+        depth_expansions  nós expandidos por profundidade (índice 0 = profundidade 1)
+        depth_children    filhos gerados pelos nós de cada profundidade
+                          (fator de ramificação = children / expansions)
+        dead_ends         nós sem vizinho livre antes de completar o caminho
+        prunes            contagem por regra de PRUNE_RULES
+        max_depth         maior profundidade (tamanho do caminho) atingida
+        time_to_first_solution  segundos até o primeiro caminho (None se não há)
+
+    Os contadores são gravados em `stats` num `finally`: uma busca
+    interrompida (timeout) deixa neles a árvore explorada até ali.
+
+    Fica numa função separada para que a versão sem instrumentação nem
+    telemetria não pague nenhum custo extra.
+    """
+    adj = {i: [] for i in range(n)}
+    for u, v in edges:
+        adj[u].append(v)
+        adj[v].append(u)
+
+    expansions = [0] * n
+    children = [0] * n
+    steps = dead_ends = visited_prunes = max_depth = 0
+    visited = [False] * n
+    path = []
+    stats = {} if stats is None else stats
+    start_time = time.perf_counter()
+    reporter = make_reporter(progress, 'bt', n, progress_interval)
+
+    def backtrack(u):
+        nonlocal steps, dead_ends, visited_prunes, max_depth
+        steps += 1
+        path.append(u)
+        visited[u] = True
+        depth = len(path)
+        expansions[depth - 1] += 1
+        if depth > max_depth:
+            max_depth = depth
+        if reporter is not None and not steps & PROGRESS_CHECK_MASK:
+            reporter.maybe_report(steps, depth, max_depth)
+
+        if depth == n:
+            return True
+
+        generated = 0
+        for v in adj[u]:
+            if visited[v]:
+                visited_prunes += 1
+                continue
+            generated += 1
+            if backtrack(v):
+                children[depth - 1] += generated
+                return True
+
+        children[depth - 1] += generated
+        if generated == 0:
+            dead_ends += 1
+        visited[u] = False
+        path.pop()
+        return False
+
+    found = None
+    try:
+        for start in range(n):
+            visited = [False] * n
+            path = []
+            if backtrack(start):
+                found = path
+                break
+    finally:
+        stats.update({
+            "steps": steps,
+            "depth_expansions": expansions[:max_depth],
+            "depth_children": children[:max_depth],
+            "dead_ends": dead_ends,
+            "prunes": {"visited": visited_prunes},
+            "max_depth": max_depth,
+            "time_to_first_solution": time.perf_counter() - start_time if found is not None else None,
+        })
+
+    if found is not None:
+        return found, stats if collect_stats else found
+    return None, stats if collect_stats else None
@@ -1,10 +1,19 @@
-def heuristic_path(n, edges):
+from src.algorithms.progress import make_reporter
+
+
+def heuristic_path(n, edges, progress=None, progress_interval=0.5):
+    # Telemetria (opcional): consultada uma vez por vértice inicial
+    reporter = make_reporter(progress, 'h', n, progress_interval)
+    nodes = best_length = 0
+
     adj = {i: [] for i in range(n)}
     for u, v in edges:
         adj[u].append(v)
         adj[v].append(u)
 
     for start in range(n):
+        if reporter is not None:
+            reporter.maybe_report(nodes, 0, best_length)
         path = [start]
         visited = {start}
 
@@ -24,5 +33,7 @@ def heuristic_path(n, edges):
 
         if len(path) == n:
             return path
+        nodes += len(path)
+        best_length = max(best_length, len(path))
 
     return None
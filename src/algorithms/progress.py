@@ -0,0 +1,76 @@
+# src/algorithms/progress.py
+"""
+Telemetria de progresso dos métodos durante a busca.
+
+Os métodos aceitam `progress=callback`; o callback recebe, no máximo uma
+vez a cada `progress_interval` segundos, um dicionário com:
+    solver          'bt' ou 'h'
+    n               número de vértices
+    nodes           nós expandidos até agora
+    nodes_per_second  taxa desde o relatório anterior (estagnação aparece
+                    como queda da taxa, não da média acumulada)
+    depth           tamanho do caminho parcial atual
+    best_length     maior caminho parcial visto até agora
+    elapsed         segundos desde o início da busca
+
+O relógio só é consultado a cada PROGRESS_CHECK_MASK + 1 nós. No
+backtracking, a telemetria roda sobre a busca instrumentada (que já mantém
+o maior caminho por nó), com o mesmo custo dela; sem callback nem
+instrumentação, a busca original roda sem custo nenhum — por isso a
+telemetria é opcional nas medições (desligada por padrão na GUI).
+"""
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Consultar o relógio a cada 1024 nós (steps & MASK == 0)
+PROGRESS_CHECK_MASK = 1023
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+class ProgressReporter:
+    """Limita a taxa de chamadas do callback e calcula nós/s por janela."""
+
+    def __init__(self, callback: ProgressCallback, solver: str, n: int, interval: float = 0.5):
+        self.callback = callback
+        self.solver = solver
+        self.n = n
+        self.interval = interval
+        self.start = time.perf_counter()
+        self._last_time = self.start
+        self._last_nodes = 0
+
+    def maybe_report(self, nodes: int, depth: int, best_length: int):
+        """Chama o callback se `interval` segundos passaram desde o último relatório."""
+        now = time.perf_counter()
+        window = now - self._last_time
+        if window < self.interval:
+            return
+        self.callback({
+            'solver': self.solver,
+            'n': self.n,
+            'nodes': nodes,
+            'nodes_per_second': (nodes - self._last_nodes) / window,
+            'depth': depth,
+            'best_length': best_length,
+            'elapsed': now - self.start,
+        })
+        self._last_time = now
+        self._last_nodes = nodes
+
+
+def make_reporter(callback: Optional[ProgressCallback], solver: str, n: int,
+                  interval: float) -> Optional[ProgressReporter]:
+    return ProgressReporter(callback, solver, n, interval) if callback is not None else None
+
+
+def format_progress(info: Dict[str, Any]) -> str:
+    """Linha de status: método, nós/s, profundidade, melhor caminho e tempo."""
+    rate = info['nodes_per_second']
+    rate_text = f"{rate / 1e6:.2f}M" if rate >= 1e6 else f"{rate / 1e3:.1f}k" if rate >= 1e3 else f"{rate:.0f}"
+    return (
+        f"{info['solver'].upper()} {rate_text} nós/s | "
+        f"prof. {info['depth']} | melhor {info['best_length']}/{info['n']} | "
+        f"{info['nodes']} nós | {info['elapsed']:.1f}s"
+    )
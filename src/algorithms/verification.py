@@ -0,0 +1,25 @@
+def is_hamiltonian_path(n, edges, path):
+    """
+    Verifica se `path` é um caminho hamiltoniano válido do grafo.
+
+    Com o conjunto de arestas já montado a verificação é O(n).
+
+    Args:
+        n (int): número de vértices
+        edges: lista de arestas (u, v) ou conjunto de pares já normalizados
+        path (list[int] | None): caminho candidato
+    Retorna:
+        bool
+    """
+    if path is None or len(path) != n or len(set(path)) != n:
+        return False
+    if any(not 0 <= v < n for v in path):
+        return False
+
+    edge_set = edges if isinstance(edges, (set, frozenset)) else {
+        (u, v) if u < v else (v, u) for u, v in edges
+    }
+    return all(
+        ((a, b) if a < b else (b, a)) in edge_set
+        for a, b in zip(path, path[1:])
+    )
@@ -11,14 +11,14 @@ def run_experiment(path):
     print(f"Executando instância: {path} | n={n}")
 
     # método exato
-    t0 = time.time()
+    t0 = time.perf_counter()
     result_exact = hamiltonian_path_backtracking(n, adj)
-    t1 = time.time()
+    t1 = time.perf_counter()
 
     # heurística
-    t2 = time.time()
+    t2 = time.perf_counter()
     result_heur = heuristic_hamiltonian_path(n, adj)
-    t3 = time.time()
+    t3 = time.perf_counter()
 
     print("\nResultados:")
     print(f"Backtracking: {'SIM' if result_exact else 'NÃO'} | Tempo: {t1 - t0:.4f}s")
@@ -6,9 +6,12 @@ Mede tempo, passos, taxas de sucesso, memória para diferentes configurações.
 
 import time
 import csv
+import math
 import random
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
 from datetime import datetime
 import sys
 import os
@@ -20,41 +23,173 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(CURRENT_DIR))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from src.algorithms.backtracking import find_hamiltonian_path_bt
+from src.algorithms.backtracking import find_hamiltonian_path_bt, PRUNE_RULES
 from src.algorithms.heuristic import heuristic_path
 from src.utils.performance_monitor import PerformanceMonitor, TimeoutError
+from src.graph_io import load_graph_auto, csr_to_edges
+from src.graph_corpus import GraphCorpus
+from src.utils.graph_generator import (
+    generate_random_graph, generate_instance, DENSITY_MAP,
+    coupled_gnp_edges, edge_probability,
+)
+from src.algorithms.verification import is_hamiltonian_path
+from src.experiments.result_sink import ResultSink, CSV_COLUMNS, csv_row
+from src.experiments.result_store import ResultStore
+from src.utils.profiling import run_profiled
+from src.utils.confidence import mean_ci, median_ci, wilson_interval
+
+import numpy as np
 
 
 def generate_graph(n: int, p: float) -> List[Tuple[int, int]]:
     """Gera grafo aleatório com n vértices e probabilidade p."""
-    import random
-    edges = []
-    for u in range(n):
-        for v in range(u + 1, n):
-            if random.random() < p:
-                edges.append((u, v))
-    return edges
+    return generate_random_graph(n, p)
+
+
+def task_seed(base_seed: int, n: int, density: str, run_id: int) -> np.random.SeedSequence:
+    """
+    Semente de uma tarefa (n, densidade, repetição) derivada da semente base.
+    
+    Equivale ao filho `run_id` de `SeedSequence(base_seed).spawn(...)` no nó
+    (n, densidade): a semente depende só da identidade da tarefa, nunca da
+    ordem de execução ou do número de workers.
+    """
+    return np.random.SeedSequence(
+        base_seed, spawn_key=(n, zlib.crc32(density.encode("utf-8")), run_id)
+    )
+
+
+# Métodos medidos em cada repetição: backtracking e heurística
+SOLVERS = ('bt', 'h')
+
+# Perfil só de métodos cujo tempo medido é no máximo esta fração do
+# timeout: as execuções extras (base + perfilada, ~5x o tempo medido) rodam
+# sem prazo no processo atual
+PROFILE_TIMEOUT_FRACTION = 0.1
+
+
+# Runner reaproveitado pelas tarefas de um mesmo processo do pool
+_WORKER_RUNNER = None
+
+
+def _worker_runner(config: Dict) -> "ExperimentRunner":
+    global _WORKER_RUNNER
+    if _WORKER_RUNNER is None or _WORKER_RUNNER._worker_config() != config:
+        _WORKER_RUNNER = ExperimentRunner(**config)
+    return _WORKER_RUNNER
+
+
+def _run_task(task: Tuple) -> Tuple[Dict, Dict]:
+    """Executa uma tarefa (config do runner, gerador, n, densidade, run_id[, skip]) num worker."""
+    config, *task = task
+    return _worker_runner(config)._generate_and_run(*task)
+
+
+def _run_coupled_task(task: Tuple) -> List[Tuple[str, Dict]]:
+    """Executa uma repetição da varredura acoplada (config do runner, n, ...) num worker."""
+    config, *task = task
+    return _worker_runner(config)._coupled_repetition(*task)
 
 
 class ExperimentRunner:
     """Gerencia e executa experimentos com grafos hamiltonianos."""
     
-    def __init__(self, timeout_seconds: int = 60, measure_memory: bool = True):
+    def __init__(
+        self,
+        timeout_seconds: int = 60,
+        measure_memory: bool = True,
+        seed: Optional[int] = None,
+        workers: int = 1,
+        isolation: str = 'inline',
+        memory_limit_mb: Optional[float] = None,
+        measure: str = 'both',
+        instrument: bool = False,
+        profile: Optional[str] = None,
+        profile_dir: str = 'profiles',
+        telemetry: Optional[Callable[[Dict], None]] = None,
+        progress_interval: float = 0.5,
+        sink: Optional[ResultSink] = None,
+        path_policy: str = 'keep',
+        spill_path: Optional[str] = None
+    ):
         """
         Args:
             timeout_seconds: tempo limite por experimento individual (padrão: 60s)
             measure_memory: se deve medir consumo de memória
+            seed: semente base; cada (n, densidade, repetição) deriva a sua
+                com `task_seed` (padrão: sorteada do módulo `random`)
+            workers: processos para executar as repetições (1 = sequencial)
+            isolation: 'inline' ou 'subprocess' (cada medição num processo
+                filho, com kill garantido no timeout; ver PerformanceMonitor)
+            memory_limit_mb: teto de memória por medição (só 'subprocess')
+            measure: 'time', 'memory' ou 'both' (ver PerformanceMonitor);
+                registrado com cada execução (coluna `modo_medicao`)
+            instrument: instrumentar a árvore de busca do backtracking
+                (expansões/ramificação por profundidade, becos sem saída,
+                podas, profundidade máxima, tempo até a primeira solução)
+            profile: 'cprofile' ou 'sample' para perfilar, em execuções
+                extras na primeira repetição de cada configuração, cada
+                método chamado diretamente no processo atual (ver
+                src/utils/profiling.py); None desliga. Essas execuções não
+                têm prazo nem teto de memória: só são perfilados os métodos
+                medidos sem timeout/estouro de memória e em até
+                PROFILE_TIMEOUT_FRACTION do timeout
+            profile_dir: diretório dos arquivos .pstats/.collapsed
+            telemetry: callback de progresso dos métodos durante a busca
+                (ver src/algorithms/progress.py), chamado no máximo a cada
+                `progress_interval` s com `density` e `run_id` acrescentados;
+                no isolamento 'subprocess' os relatórios vêm pelo pipe do
+                filho. Não é repassado aos processos do pool (workers > 1)
+            progress_interval: intervalo mínimo entre relatórios (s)
+            sink: destino incremental; cada execução é gravada ao terminar
+            path_policy: destino dos caminhos encontrados no ResultStore:
+                'keep' (memória), 'drop' (descartados; use com `sink`) ou
+                'spill' (arquivo `spill_path`, lido sob demanda)
+            spill_path: arquivo dos caminhos na política 'spill'
         """
         self.results: List[Dict] = []
         self.timeout_seconds = timeout_seconds
         self.measure_memory = measure_memory
-        self.monitor = PerformanceMonitor(timeout_seconds=timeout_seconds)
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.workers = max(1, workers)
+        self.sink = sink
+        self.instrument = instrument
+        self.profile = profile
+        self.profile_dir = profile_dir
+        self.profile_reports: List[Dict] = []
+        self.telemetry = telemetry
+        self.progress_interval = progress_interval
+        self.store = ResultStore(path_policy=path_policy, spill_path=spill_path)
+        self.frontier: Dict[Tuple[str, str], Dict] = {}
+        self.monitor = PerformanceMonitor(
+            timeout_seconds=timeout_seconds,
+            isolation=isolation,
+            memory_limit_mb=memory_limit_mb,
+            measure=measure
+        )
+        if profile and isolation == 'subprocess':
+            warnings.warn("O perfil roda no processo atual, fora do isolamento 'subprocess' (sem teto de "
+                          f"memória; só métodos medidos em até {PROFILE_TIMEOUT_FRACTION:.0%} do timeout)")
+    
+    def _worker_config(self) -> Dict:
+        """Parâmetros para recriar este runner num processo do pool."""
+        return {
+            "timeout_seconds": self.timeout_seconds,
+            "seed": self.seed,
+            "isolation": self.monitor.isolation,
+            "memory_limit_mb": self.monitor.memory_limit_mb,
+            "measure": self.monitor.measure,
+            "instrument": self.instrument,
+            "profile": self.profile,
+            "profile_dir": self.profile_dir,
+        }
         
     def run_single_experiment(
         self, 
         n: int, 
         density: str, 
-        repetitions: int = 5
+        repetitions: int = 5,
+        generator: str = 'gnp'
     ) -> Dict:
         """
         Executa experimento para um tamanho n e densidade específica.
@@ -63,129 +198,771 @@ class ExperimentRunner:
             n: número de vértices
             density: 'sparse' (0.2), 'medium' (0.5) ou 'dense' (0.8)
             repetitions: número de repetições
+            generator: família de grafos (ver GENERATORS: 'gnp', 'planted', 'threshold')
             
         Returns:
             Dicionário com estatísticas agregadas
         """
-        density_map = {
-            'sparse': 0.2,
-            'medium': 0.5,
-            'dense': 0.8
-        }
-        p = density_map.get(density, 0.5)
+        return self.run_batch_experiments([n], [density], repetitions, generator)[0]
+    
+    def _generate_and_run(
+        self, generator: str, n: int, density: str, run_id: int, skip: Tuple[str, ...] = ()
+    ) -> Tuple[Dict, Dict]:
+        """Gera a instância da tarefa com sua semente e executa uma repetição."""
+        rng = np.random.default_rng(task_seed(self.seed, n, density, run_id))
+        n_graph, edges, info = generate_instance(generator, n, density, rng)
+        run = self._run_repetition(n_graph, edges, run_id, known_answer=info.get("known_answer"), skip=skip,
+                                   profile_label=f"{generator}_n{n}_{density}" if run_id == 0 else None,
+                                   density=density)
+        return info, run
+    
+    def _emit(self, result: Dict, run: Dict):
+        """Grava uma execução concluída no sink (se houver), com o modo de medição."""
+        if self.sink is not None:
+            self.sink.write(dict(result, measure=self.monitor.measure), run)
+        self.profile_reports.extend(run.get("profiles", ()))
+    
+    def _emit_task(self, task: Tuple, info: Dict, run: Dict):
+        generator, n, density = task[:3]
+        self._emit({
+            "n": info["n"], "n_requested": n, "density": density, "probability": info["probability"],
+            "generator": generator, "seed": self.seed,
+        }, run)
+    
+    def _finish_result(self, result: Dict):
+        """
+        Move as execuções de um resultado para o ResultStore e o registra em
+        `results`; `runs` passa a ser uma visão sob demanda das linhas do store.
+        """
+        config_id = self.store.add_config(measure=self.monitor.measure, **{
+            key: result.get(key)
+            for key in ("n", "n_requested", "density", "probability", "generator", "seed", "instance")
+        })
+        self.store.extend(config_id, result["runs"])
+        result["config_id"] = config_id
+        result["runs"] = self.store.runs(config_id)
+        result["statistics"] = self.store.statistics(config_id)
+        self.results.append(result)
+    
+    def clear_results(self):
+        """Descarta todos os resultados (e as execuções do store)."""
+        self.results.clear()
+        self.store.clear()
+        self.profile_reports.clear()
+    
+    def _execute_tasks(
+        self,
+        tasks: List[Tuple],
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> List[Tuple[Dict, Dict]]:
+        """
+        Executa tarefas (gerador, n, densidade, run_id[, skip]), em processo ou no pool.
         
+        Returns:
+            Lista (info, run) na mesma ordem de `tasks`
+        """
+        outputs = [None] * len(tasks)
+        
+        if self.workers <= 1:
+            for i, task in enumerate(tasks):
+                outputs[i] = self._generate_and_run(*task)
+                self._emit_task(task, *outputs[i])
+                if progress:
+                    progress(i + 1, len(tasks))
+            return outputs
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(_run_task, (self._worker_config(),) + task): i
+                for i, task in enumerate(tasks)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                outputs[i] = future.result()
+                self._emit_task(tasks[i], *outputs[i])
+                if progress:
+                    progress(done, len(tasks))
+        
+        return outputs
+    
+    def run_instance_experiment(self, path: str, repetitions: int = 5) -> Dict:
+        """
+        Executa experimento sobre um grafo lido de arquivo (texto, .hpg, .hcp ou DIMACS).
+        
+        Args:
+            path: caminho do grafo
+            repetitions: número de repetições sobre a mesma instância
+            
+        Returns:
+            Dicionário com estatísticas agregadas
+        """
+        n, indptr, indices = load_graph_auto(path)
+        u, v = csr_to_edges(n, indptr, indices)
+        edges = list(zip(u.tolist(), v.tolist()))
+        
+        return self._run_fixed_instance(n, edges, repetitions, instance=str(path))
+    
+    def iter_corpus_experiments(
+        self,
+        corpus_path: str,
+        repetitions: int = 5,
+        ids: Optional[List] = None,
+        **criteria
+    ) -> Iterator[Dict]:
+        """
+        Executa experimentos sobre os grafos de um corpus .hpc, lidos sob demanda.
+        
+        Args:
+            corpus_path: caminho do corpus
+            repetitions: repetições por grafo
+            ids: ids/nomes específicos (padrão: todos)
+            **criteria: filtros de igualdade sobre os metadados do corpus
+            
+        Yields:
+            Resultado de cada grafo, na ordem do corpus
+        """
+        with GraphCorpus(corpus_path) as corpus:
+            for entry, n, edge_array in corpus.iter_graphs(ids, **criteria):
+                edges = [tuple(e) for e in edge_array.tolist()]
+                yield self._run_fixed_instance(
+                    n, edges, repetitions,
+                    instance=f"{corpus_path}#{entry['id']}",
+                    density=entry.get("density", "corpus"),
+                    known_answer=entry.get("answer"),
+                )
+    
+    def _run_fixed_instance(
+        self,
+        n: int,
+        edges: List[Tuple[int, int]],
+        repetitions: int,
+        instance: str,
+        density: str = "instance",
+        known_answer: Optional[bool] = None
+    ) -> Dict:
+        """Executa as repetições sobre um grafo fixo e registra o resultado."""
         result = {
             "n": n,
             "density": density,
-            "probability": p,
+            "probability": 2 * len(edges) / (n * (n - 1)) if n > 1 else 0,
+            "instance": instance,
+            "known_answer": known_answer,
             "repetitions": repetitions,
             "runs": [],
             "timestamp": datetime.now().isoformat()
         }
-
+        
+        edge_set = {(u, v) if u < v else (v, u) for u, v in edges}
         for run_id in range(repetitions):
-            edges = generate_graph(n, p)
-            
-            # --- Backtracking com monitoramento ---
+            # Um perfil por instância: o grafo é o mesmo em todas as repetições
+            run = self._run_repetition(
+                n, edges, run_id, known_answer=known_answer, edge_set=edge_set,
+                profile_label=os.path.basename(instance) if run_id == 0 else None,
+                density=density
+            )
+            result["runs"].append(run)
+            self._emit(result, run)
+        
+        self._finish_result(result)
+        
+        return result
+    
+    def _profile_solvers(
+        self, n: int, edges: List[Tuple[int, int]], label: str, perfs: Dict[str, Dict]
+    ) -> List[Dict]:
+        """
+        Execução extra de cada método sob o perfilador, chamando o método
+        diretamente no processo atual: sem a passada de memória do wrapper
+        de medição (que dominaria o perfil no modo 'both') e sem o filho do
+        isolamento 'subprocess' (cujo trabalho o perfilador do pai não vê).
+
+        Args:
+            perfs: estatísticas da medição de cada método a perfilar; o
+                tempo medido é uma das amostras da base (exceto no modo
+                'memory', inflado pelo rastreamento) e decide se o método
+                cabe no limite PROFILE_TIMEOUT_FRACTION do timeout
+        """
+        calls = {
+            'bt': (find_hamiltonian_path_bt, {'collect_stats': True, 'instrument': self.instrument}),
+            'h': (heuristic_path, {}),
+        }
+        limit = self.timeout_seconds * PROFILE_TIMEOUT_FRACTION if self.timeout_seconds else None
+        reports = []
+        for solver, perf in perfs.items():
+            if limit is not None and perf['time_seconds'] > limit:
+                warnings.warn(f"Perfil de {solver} em {label} pulado: {perf['time_seconds']:.3f}s medidos "
+                              f"passam de {PROFILE_TIMEOUT_FRACTION:.0%} do timeout")
+                continue
+            func, kwargs = calls[solver]
+            report = run_profiled(
+                func, (n, edges), kwargs,
+                mode=self.profile, output_dir=self.profile_dir, engine=solver, instance=label,
+                baseline_time=perf['time_seconds'] if self.monitor.measure != 'memory' else None
+            )
+            reports.append(report)
+        return reports
+    
+    def _run_repetition(
+        self,
+        n: int,
+        edges: List[Tuple[int, int]],
+        run_id: int,
+        known_answer: Optional[bool] = None,
+        edge_set: Optional[set] = None,
+        reuse_path: Optional[List[int]] = None,
+        skip: Tuple[str, ...] = (),
+        profile_label: Optional[str] = None,
+        density: Optional[str] = None
+    ) -> Dict:
+        """
+        Executa backtracking e heurística sobre um grafo e retorna os dados da execução.
+        
+        Os caminhos devolvidos são verificados; com resposta conhecida
+        (`known_answer=True`), uma falha do método exato sem timeout também
+        é registrada como erro (`bt_error`).
+        
+        Args:
+            n: número de vértices
+            edges: lista de arestas
+            run_id: índice da repetição
+            known_answer: True se o grafo sabidamente tem caminho hamiltoniano
+            edge_set: conjunto de arestas normalizadas (evita remontá-lo)
+            reuse_path: caminho hamiltoniano já conhecido para este grafo; o
+                backtracking não é executado e a resposta é reaproveitada
+            skip: métodos a não executar ('bt', 'h'), ex.: além da fronteira
+            profile_label: nome da configuração nos arquivos de perfil
+                (só numa repetição por configuração); com `profile` ligado,
+                os métodos medidos com sucesso são perfilados em execuções
+                extras (ver _profile_solvers)
+            density: densidade da configuração (só para a telemetria)
+        """
+        not_run = {'time_seconds': 0.0, 'success': False, 'timeout': False}
+        progress = {}
+        if self.telemetry is not None:
+            telemetry = self.telemetry
+            progress = {
+                'progress': lambda info: telemetry(dict(info, density=density, run_id=run_id)),
+                'progress_interval': self.progress_interval,
+            }
+        
+        # --- Backtracking com monitoramento ---
+        # `partial` recebe os contadores mesmo se a busca for interrompida
+        partial = {}
+        if 'bt' in skip:
+            bt_result, bt_perf = None, dict(not_run)
+        elif reuse_path is not None:
+            # Resposta instantânea (varredura acoplada): nada a medir
+            bt_result = (list(reuse_path), {"steps": 0})
+            bt_perf = {'time_seconds': 0.0, 'success': True, 'timeout': False}
+        else:
             bt_result, bt_perf = self.monitor.measure_function(
-                find_hamiltonian_path_bt, n, edges, collect_stats=True
+                find_hamiltonian_path_bt, n, edges, collect_stats=True, instrument=self.instrument,
+                stats=partial, **progress
             )
-            
-            if bt_perf['success']:
-                path_bt, stats_bt = bt_result if bt_result else (None, {"steps": 0})
-            else:
-                path_bt, stats_bt = None, {"steps": 0}
-                if bt_perf.get('timeout'):
-                    warnings.warn(f"Backtracking TIMEOUT em n={n}, run={run_id}")
+        
+        if bt_perf['success']:
+            path_bt, stats_bt = bt_result if bt_result else (None, {"steps": 0})
+        else:
+            # Timeout/OOM: vale a árvore explorada até a interrupção (vazia se
+            # o processo foi morto sem responder)
+            path_bt, stats_bt = None, dict({"steps": 0}, **partial)
+            if bt_perf.get('timeout'):
+                warnings.warn(f"Backtracking TIMEOUT em n={n}, run={run_id}")
+            elif bt_perf.get('oom'):
+                warnings.warn(f"Backtracking sem memória em n={n}, run={run_id}")
 
-            # --- Heurística com monitoramento ---
+        # --- Heurística com monitoramento ---
+        if 'h' in skip:
+            h_result, h_perf = None, dict(not_run)
+        else:
             h_result, h_perf = self.monitor.measure_function(
-                heuristic_path, n, edges
+                heuristic_path, n, edges, **progress
             )
-            path_h = h_result if h_perf['success'] else None
+        path_h = h_result if h_perf['success'] else None
 
-            run_data = {
-                "run_id": run_id,
-                "num_edges": len(edges),
-                "bt_time": bt_perf['time_seconds'],
-                "bt_success": path_bt is not None and not bt_perf.get('timeout'),
-                "bt_steps": stats_bt.get("steps", 0) if stats_bt else 0,
-                "bt_path": path_bt,
-                "bt_timeout": bt_perf.get('timeout', False),
-                "bt_memory_mb": bt_perf.get('memory_mb', 0),
-                "bt_peak_memory_mb": bt_perf.get('peak_memory_mb', 0),
-                "h_time": h_perf['time_seconds'],
-                "h_success": path_h is not None,
-                "h_path": path_h,
-                "h_memory_mb": h_perf.get('memory_mb', 0),
-                "h_peak_memory_mb": h_perf.get('peak_memory_mb', 0),
-            }
-            
-            result["runs"].append(run_data)
+        # --- Verificação de corretude (O(n) por caminho) ---
+        if edge_set is None:
+            edge_set = {(u, v) if u < v else (v, u) for u, v in edges}
+        bt_error = path_bt is not None and not is_hamiltonian_path(n, edge_set, path_bt)
+        if (known_answer is True and path_bt is None and 'bt' not in skip
+                and not (bt_perf.get('timeout') or bt_perf.get('oom'))):
+            bt_error = True
+        h_error = path_h is not None and not is_hamiltonian_path(n, edge_set, path_h)
+        if bt_error or h_error:
+            warnings.warn(f"Resultado incorreto em n={n}, run={run_id} (BT: {bt_error}, H: {h_error})")
+
+        # A telemetria também passa pela busca instrumentada: a árvore de
+        # busca só é registrada com `instrument`
+        tree = stats_bt if self.instrument else {}
+        run_data = {
+            "run_id": run_id,
+            "num_edges": len(edges),
+            "bt_time": bt_perf['time_seconds'],
+            "bt_success": path_bt is not None and not bt_perf.get('timeout'),
+            "bt_steps": stats_bt.get("steps", 0) if stats_bt else 0,
+            "bt_path": path_bt,
+            "bt_timeout": bt_perf.get('timeout', False),
+            "bt_oom": bt_perf.get('oom', False),
+            "bt_memory_measured": bt_perf.get('memory_source') is not None,
+            "bt_memory_mb": bt_perf.get('memory_mb', 0),
+            "bt_peak_memory_mb": bt_perf.get('peak_memory_mb'),
+            "bt_baseline_mb": bt_perf.get('baseline_mb', 0),
+            "bt_instrumented": "max_depth" in tree,
+            "bt_max_depth": tree.get("max_depth", 0),
+            "bt_dead_ends": tree.get("dead_ends", 0),
+            "bt_first_solution_time": tree.get("time_to_first_solution"),
+            "bt_depth_expansions": tree.get("depth_expansions"),
+            "bt_depth_children": tree.get("depth_children"),
+            **{f"bt_prunes_{rule}": tree.get("prunes", {}).get(rule, 0) for rule in PRUNE_RULES},
+            "h_time": h_perf['time_seconds'],
+            "h_success": path_h is not None,
+            "h_timeout": h_perf.get('timeout', False),
+            "h_oom": h_perf.get('oom', False),
+            "h_path": path_h,
+            "h_memory_measured": h_perf.get('memory_source') is not None,
+            "h_memory_mb": h_perf.get('memory_mb', 0),
+            "h_peak_memory_mb": h_perf.get('peak_memory_mb'),
+            "h_baseline_mb": h_perf.get('baseline_mb', 0),
+            "known_answer": known_answer,
+            "bt_reused": reuse_path is not None and 'bt' not in skip,
+            "bt_skipped": 'bt' in skip,
+            "h_skipped": 'h' in skip,
+            "bt_error": bt_error,
+            "h_error": h_error,
+        }
         
-        # Calcular estatísticas agregadas
-        result["statistics"] = self._compute_statistics(result["runs"])
-        self.results.append(result)
+        if self.profile and profile_label is not None:
+            perfs = {'bt': bt_perf, 'h': h_perf}
+            perfs = {
+                solver: perfs[solver] for solver in SOLVERS
+                if solver not in skip and not (solver == 'bt' and reuse_path is not None)
+                and perfs[solver]['success']
+            }
+            run_data["profiles"] = self._profile_solvers(n, edges, profile_label, perfs)
         
-        return result
-    
+        return run_data
+
     def run_batch_experiments(
         self,
         sizes: List[int] = [10, 20, 30, 40, 50],
         densities: List[str] = ['sparse', 'medium', 'dense'],
-        repetitions: int = 5
+        repetitions: int = 5,
+        generator: str = 'gnp',
+        progress: Optional[Callable[[int, int], None]] = None,
+        completed: Optional[Dict[Tuple[int, str, int], Tuple[Dict, Dict]]] = None,
+        frontier_threshold: Optional[float] = None
     ) -> List[Dict]:
         """
         Executa batch de experimentos para múltiplos tamanhos e densidades.
         
+        Com `workers > 1`, todas as repetições da grade (n, densidade, run_id)
+        são distribuídas num pool de processos; as sementes por tarefa tornam
+        o resultado independente do número de workers.
+        
         Args:
             sizes: lista de tamanhos de grafos
             densities: lista de densidades
             repetitions: repetições por configuração
+            generator: família de grafos (ver GENERATORS)
+            progress: callback (concluídas, total) chamado a cada repetição
+            completed: execuções já feitas, {(n, densidade, run_id): (config, run)}
+                (ver result_sink.read_runs); só as tarefas restantes são
+                executadas, e as estatísticas incluem as duas partes
+            frontier_threshold: modo fronteira; os tamanhos são executados em
+                ordem crescente e um método cuja taxa de timeout numa
+                densidade passar deste limiar não é mais executado nos n
+                maiores dessa densidade (ver `frontier`)
             
         Returns:
             Lista de resultados
         """
+        completed = completed or {}
+        if frontier_threshold is None:
+            return self._run_grid(sizes, densities, repetitions, generator, progress, completed)
+        
+        # Fronteira: uma camada de n por vez, para decidir o que pular na próxima
+        dropped = {density: set() for density in densities}
         batch_results = []
+        for n in sorted(sizes):
+            skips = {density: tuple(sorted(dropped[density])) for density in densities}
+            layer = self._run_grid([n], densities, repetitions, generator, progress, completed, skips)
+            for result in layer:
+                self._update_frontier(result, frontier_threshold, dropped[result["density"]])
+            batch_results.extend(layer)
         
-        for n in sizes:
-            for density in densities:
-                result = self.run_single_experiment(n, density, repetitions)
-                batch_results.append(result)
+        return batch_results
+    
+    def _run_grid(
+        self,
+        sizes: List[int],
+        densities: List[str],
+        repetitions: int,
+        generator: str,
+        progress: Optional[Callable[[int, int], None]],
+        completed: Dict[Tuple[int, str, int], Tuple[Dict, Dict]],
+        skips: Optional[Dict[str, Tuple[str, ...]]] = None
+    ) -> List[Dict]:
+        """Executa a grade sizes × densities (repetições já feitas vêm de `completed`)."""
+        skips = skips or {}
+        configs = [(n, density) for n in sizes for density in densities]
+        tasks = [
+            (generator, n, density, run_id, skips.get(density, ()))
+            for n, density in configs
+            for run_id in range(repetitions)
+            if (n, density, run_id) not in completed
+        ]
+        outputs = dict(zip(
+            (task[1:4] for task in tasks),
+            self._execute_tasks(tasks, progress)
+        ))
+        
+        batch_results = []
+        for n, density in configs:
+            chunk = []
+            for run_id in range(repetitions):
+                key = (n, density, run_id)
+                if key in outputs:
+                    chunk.append(outputs[key])
+                elif key in completed:
+                    config, run = completed[key]
+                    chunk.append(({"n": config["n"], "probability": config["probability"]}, run))
+            # Famílias estruturadas arredondam o tamanho: `n` é o do grafo gerado
+            result = {
+                "n": chunk[-1][0].get("n", n) if chunk else n,
+                "n_requested": n,
+                "density": density,
+                "generator": generator,
+                "probability": chunk[-1][0]["probability"] if chunk else DENSITY_MAP.get(density, 0.5),
+                "repetitions": repetitions,
+                "seed": self.seed,
+                "runs": [run for _, run in chunk],
+                "timestamp": datetime.now().isoformat()
+            }
+            
+            # Calcular estatísticas agregadas
+            self._finish_result(result)
+            batch_results.append(result)
                 
         return batch_results
     
-    def _compute_statistics(self, runs: List[Dict]) -> Dict:
-        """Computa estatísticas agregadas de múltiplas execuções."""
-        bt_times = [r["bt_time"] for r in runs if not r.get("bt_timeout")]
-        h_times = [r["h_time"] for r in runs]
-        bt_steps = [r["bt_steps"] for r in runs]
-        bt_memory = [r.get("bt_memory_mb", 0) for r in runs]
-        h_memory = [r.get("h_memory_mb", 0) for r in runs]
+    @staticmethod
+    def _failure_rate(result: Dict, solver: str) -> Optional[float]:
+        """Fração de execuções do método que não terminaram no orçamento (timeout/OOM)."""
+        stats = result["statistics"]
+        runs = result["repetitions"] - stats[f"{solver}_skipped_count"]
+        if runs <= 0:
+            return None
+        failures = stats["bt_timeout_count"] + stats["bt_oom_count"] if solver == "bt" else stats["h_timeout_count"]
+        return failures / runs
+    
+    def _update_frontier(self, result: Dict, threshold: float, dropped: set):
+        """Atualiza `frontier` com uma célula e marca os métodos saturados em `dropped`."""
+        n, density = result["n"], result["density"]
+        for solver in SOLVERS:
+            rate = self._failure_rate(result, solver)
+            if solver in dropped or rate is None:
+                continue
+            entry = self.frontier.setdefault((solver, density), {
+                "solver": solver, "density": density,
+                "max_feasible_n": None, "dropped_at": None, "threshold": threshold,
+            })
+            if rate > threshold:
+                entry["dropped_at"] = n
+                dropped.add(solver)
+            else:
+                entry["max_feasible_n"] = max(n, entry["max_feasible_n"] or n)
+    
+    def search_frontier(
+        self,
+        density: str,
+        generator: str = 'gnp',
+        repetitions: int = 5,
+        threshold: float = 0.5,
+        solver: str = 'bt',
+        start_n: int = 8,
+        max_n: int = 1024
+    ) -> Dict:
+        """
+        Localiza o maior n resolvível no orçamento por busca exponencial e binária.
         
-        bt_success_count = sum(1 for r in runs if r["bt_success"])
-        h_success_count = sum(1 for r in runs if r["h_success"])
-        bt_timeout_count = sum(1 for r in runs if r.get("bt_timeout", False))
+        n dobra a partir de `start_n` enquanto a taxa de timeout do método
+        ficar <= `threshold`; o intervalo [último viável, primeiro inviável]
+        é então bissectado. Só o método pesquisado é executado; cada célula
+        avaliada entra em `results` (e no sink) como uma célula comum.
         
-        total = len(runs)
+        Returns:
+            Entrada de `frontier` com `max_feasible_n` (None se nem `start_n`
+            for viável), `dropped_at` e as células avaliadas (`evaluated`)
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Método inválido: {solver} (use: {', '.join(SOLVERS)})")
+        skip = {density: tuple(s for s in SOLVERS if s != solver)}
+        evaluated = []
         
-        return {
-            "bt_avg_time": sum(bt_times) / len(bt_times) if bt_times else 0,
-            "bt_min_time": min(bt_times) if bt_times else 0,
-            "bt_max_time": max(bt_times) if bt_times else 0,
-            "bt_success_rate": bt_success_count / total if total > 0 else 0,
-            "bt_timeout_count": bt_timeout_count,
-            "bt_avg_steps": sum(bt_steps) / total if total > 0 else 0,
-            "bt_min_steps": min(bt_steps) if bt_steps else 0,
-            "bt_max_steps": max(bt_steps) if bt_steps else 0,
-            "bt_avg_memory": sum(bt_memory) / total if total > 0 else 0,
+        def feasible(n):
+            result = self._run_grid([n], [density], repetitions, generator, None, {}, skip)[0]
+            rate = self._failure_rate(result, solver)
+            evaluated.append((n, rate))
+            return rate is not None and rate <= threshold
+        
+        lo, hi = None, None
+        n = start_n
+        while n <= max_n:
+            if not feasible(n):
+                hi = n
+                break
+            lo = n
+            n = min(2 * n, max_n) if n < max_n else max_n + 1
+        
+        if lo is not None and hi is not None:
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if feasible(mid):
+                    lo = mid
+                else:
+                    hi = mid
+        
+        entry = {
+            "solver": solver, "density": density,
+            "max_feasible_n": lo, "dropped_at": hi, "threshold": threshold,
+            "evaluated": evaluated,
+        }
+        self.frontier[(solver, density)] = entry
+        return entry
+    
+    def frontier_table(self) -> str:
+        """Tabela da fronteira de viabilidade por método e densidade."""
+        if not self.frontier:
+            return "Nenhuma fronteira calculada."
+        
+        names = {"bt": "Backtracking", "h": "Heurística"}
+        lines = ["=" * 70]
+        lines.append(f"{'Método':<14} {'Dens':<8} {'Maior n viável':<16} {'Saturou em n':<14} {'Limiar':<8}")
+        lines.append("=" * 70)
+        for (solver, density), entry in sorted(self.frontier.items()):
+            best = entry["max_feasible_n"]
+            dropped = entry["dropped_at"]
+            lines.append(
+                f"{names[solver]:<14} {density:<8} "
+                f"{'-' if best is None else best:<16} "
+                f"{'-' if dropped is None else dropped:<14} "
+                f"{entry['threshold']:<8.0%}"
+            )
+        lines.append("=" * 70)
+        return "\n".join(lines)
+    
+    def run_adaptive_experiment(
+        self,
+        n: int,
+        density: str,
+        generator: str = 'gnp',
+        min_reps: int = 5,
+        max_reps: int = 50,
+        time_width: float = 0.2,
+        rate_width: float = 0.3,
+        statistic: str = 'mean',
+        confidence: float = 0.95,
+        completed: Optional[Dict[Tuple[int, str, int], Tuple[Dict, Dict]]] = None
+    ) -> Dict:
+        """
+        Executa repetições até os intervalos de confiança ficarem estreitos.
+        
+        Após `min_reps`, novas repetições (em lotes de `workers`) são feitas
+        enquanto o IC do tempo do backtracking (média ou mediana) tiver
+        largura relativa acima de `time_width` ou o IC de Wilson da taxa de
+        sucesso tiver largura acima de `rate_width`, até `max_reps`. As
+        sementes por tarefa são as mesmas do modo de repetições fixas.
+        
+        Args:
+            n: número de vértices
+            density: rótulo de densidade
+            generator: família de grafos (ver GENERATORS)
+            min_reps / max_reps: limites do número de repetições
+            time_width: largura máxima do IC do tempo, relativa ao centro
+            rate_width: largura máxima (absoluta) do IC da taxa de sucesso
+            statistic: 'mean' ou 'median' (estatística do tempo)
+            confidence: nível de confiança dos intervalos
+            completed: execuções já feitas (ver run_batch_experiments)
+            
+        Returns:
+            Resultado com `repetitions` final e o bloco `adaptive` (ICs e
+            se os alvos foram atingidos), também gravado no sink (ver
+            ResultSink.write_adaptive e ResultsDB.write_adaptive)
+        """
+        if statistic not in ('mean', 'median'):
+            raise ValueError(f"Estatística inválida: {statistic} (use 'mean' ou 'median')")
+        interval = mean_ci if statistic == 'mean' else median_ci
+        completed = completed or {}
+        
+        outputs = []
+        converged = False
+        while len(outputs) < max_reps:
+            first = len(outputs)
+            step = min_reps if first == 0 else self.workers
+            run_ids = range(first, min(first + step, max_reps))
+            
+            tasks = [(generator, n, density, i) for i in run_ids if (n, density, i) not in completed]
+            fresh = dict(zip((t[3] for t in tasks), self._execute_tasks(tasks)))
+            for i in run_ids:
+                if i in fresh:
+                    outputs.append(fresh[i])
+                else:
+                    config, run = completed[(n, density, i)]
+                    outputs.append(({"n": config["n"], "probability": config["probability"]}, run))
+            
+            runs = [run for _, run in outputs]
+            times = [r["bt_time"] for r in runs if not (r.get("bt_reused") or r.get("bt_timeout"))]
+            center, lo, hi = interval(times, confidence)
+            successes = sum(1 for r in runs if r["bt_success"])
+            rate, rate_lo, rate_hi = wilson_interval(successes, len(runs), confidence)
+            
+            # Sem tempos medidos (tudo em timeout) só a taxa decide
+            time_ok = not times or (center > 0 and (hi - lo) / center <= time_width)
+            converged = time_ok and rate_hi - rate_lo <= rate_width
+            if converged:
+                break
+        
+        result = {
+            "n": outputs[-1][0].get("n", n) if outputs else n,
+            "n_requested": n,
+            "density": density,
+            "generator": generator,
+            "probability": outputs[-1][0]["probability"] if outputs else DENSITY_MAP.get(density, 0.5),
+            "repetitions": len(outputs),
+            "seed": self.seed,
+            "runs": [run for _, run in outputs],
+            "adaptive": {
+                "statistic": statistic,
+                "confidence": confidence,
+                "time_center": center if outputs else 0,
+                # Amostra pequena demais (ex.: um só tempo medido): IC indefinido, não ±inf
+                "time_ci": ((lo, hi) if math.isfinite(lo) and math.isfinite(hi) else None) if outputs else (0, 0),
+                "success_rate": rate if outputs else 0,
+                "success_ci": (rate_lo, rate_hi) if outputs else (0, 1),
+                "converged": converged,
+            },
+            "timestamp": datetime.now().isoformat()
+        }
+        self._finish_result(result)
+        self._emit_adaptive(result)
+        
+        return result
+    
+    def _emit_adaptive(self, result: Dict):
+        """Grava o critério de parada de uma configuração adaptativa (sinks com write_adaptive)."""
+        write = getattr(self.sink, "write_adaptive", None)
+        if write is not None:
+            write(dict(result, measure=self.monitor.measure))
+    
+    def run_coupled_sweep(
+        self,
+        n: int,
+        densities: List[str],
+        repetitions: int = 5,
+        generator: str = 'gnp',
+        reuse_solutions: bool = True
+    ) -> List[Dict]:
+        """
+        Varredura de densidades com acoplamento monótono.
+        
+        Em cada repetição, um único uniforme por par de vértices é limiarizado
+        em cada p, em ordem crescente; os grafos são encaixados, então um
+        caminho encontrado numa densidade menor continua válido nas maiores e
+        (com `reuse_solutions`) é usado como resposta instantânea.
+        
+        Args:
+            n: número de vértices
+            densities: densidades a varrer (qualquer ordem)
+            repetitions: repetições (uma matriz aleatória por repetição)
+            generator: família G(n, p) acoplável ('gnp' ou 'threshold')
+            reuse_solutions: reaproveitar caminhos de densidades menores
             
-            "h_avg_time": sum(h_times) / total if total > 0 else 0,
-            "h_min_time": min(h_times) if h_times else 0,
-            "h_max_time": max(h_times) if h_times else 0,
-            "h_success_rate": h_success_count / total if total > 0 else 0,
-            "h_avg_memory": sum(h_memory) / total if total > 0 else 0,
+        As repetições são independentes: com `workers > 1` rodam no pool,
+        cada uma com todas as suas densidades no mesmo processo.
+            
+        Returns:
+            Lista de resultados, um por densidade (na ordem de `densities`)
+        """
+        probabilities = {d: edge_probability(generator, n, d) for d in densities}
+        by_probability = {}
+        for density, p in probabilities.items():
+            by_probability.setdefault(p, []).append(density)
+        
+        results = {
+            density: {
+                "n": n,
+                "density": density,
+                "generator": generator,
+                "probability": probabilities[density],
+                "repetitions": repetitions,
+                "coupled": True,
+                "seed": self.seed,
+                "runs": [],
+                "timestamp": datetime.now().isoformat()
+            }
+            for density in densities
         }
+        
+        outputs = [None] * repetitions
+        if self.workers <= 1:
+            for run_id in range(repetitions):
+                outputs[run_id] = self._coupled_repetition(n, by_probability, run_id, reuse_solutions)
+                for density, run in outputs[run_id]:
+                    self._emit(results[density], run)
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = {
+                    pool.submit(_run_coupled_task,
+                                (self._worker_config(), n, by_probability, run_id, reuse_solutions)): run_id
+                    for run_id in range(repetitions)
+                }
+                for future in as_completed(futures):
+                    run_id = futures[future]
+                    outputs[run_id] = future.result()
+                    for density, run in outputs[run_id]:
+                        self._emit(results[density], run)
+        
+        for output in outputs:
+            for density, run in output:
+                results[density]["runs"].append(run)
+        
+        ordered = [results[d] for d in densities]
+        for result in ordered:
+            self._finish_result(result)
+        
+        return ordered
+    
+    def _coupled_repetition(
+        self, n: int, by_probability: Dict[float, List[str]], run_id: int, reuse_solutions: bool
+    ) -> List[Tuple[str, Dict]]:
+        """Uma repetição da varredura acoplada: (densidade, execução), em p crescente."""
+        runs = []
+        known_path = None
+        rng = np.random.default_rng(task_seed(self.seed, n, "coupled", run_id))
+        for p, u, v in coupled_gnp_edges(n, list(by_probability), rng):
+            edges = list(zip(u.tolist(), v.tolist()))
+            edge_set = set(edges)
+            for density in by_probability[p]:
+                run = self._run_repetition(
+                    n, edges, run_id, edge_set=edge_set,
+                    known_answer=True if known_path is not None else None,
+                    reuse_path=known_path if reuse_solutions else None,
+                    profile_label=f"coupled_n{n}_{density}" if run_id == 0 else None,
+                    density=density
+                )
+                runs.append((density, run))
+                
+                # Caminhos válidos em p continuam válidos em p' > p
+                if known_path is None:
+                    if run["bt_path"] is not None and not run["bt_error"]:
+                        known_path = run["bt_path"]
+                    elif run["h_path"] is not None and not run["h_error"]:
+                        known_path = run["h_path"]
+        return runs
+    
+    def _compute_statistics(self, runs: List[Dict]) -> Dict:
+        """Computa estatísticas agregadas de múltiplas execuções (ver ResultStore)."""
+        return ResultStore.from_runs(runs).statistics(0)
     
     def export_to_csv(self, filepath: str):
         """
@@ -201,32 +978,12 @@ class ExperimentRunner:
             writer = csv.writer(f)
             
             # Cabeçalho
-            writer.writerow([
-                'n', 'densidade', 'probabilidade', 'run_id', 
-                'num_arestas',
-                'bt_tempo', 'bt_sucesso', 'bt_timeout', 'bt_passos', 'bt_memoria_mb',
-                'h_tempo', 'h_sucesso', 'h_memoria_mb'
-            ])
+            writer.writerow(CSV_COLUMNS)
             
             # Dados
-            for result in self.results:
-                n = result['n']
-                density = result['density']
-                prob = result['probability']
-                
-                for run in result['runs']:
-                    writer.writerow([
-                        n, density, prob, run['run_id'],
-                        run['num_edges'],
-                        f"{run['bt_time']:.6f}", 
-                        1 if run['bt_success'] else 0,
-                        1 if run.get('bt_timeout', False) else 0,
-                        run['bt_steps'],
-                        f"{run.get('bt_memory_mb', 0):.4f}",
-                        f"{run['h_time']:.6f}",
-                        1 if run['h_success'] else 0,
-                        f"{run.get('h_memory_mb', 0):.4f}"
-                    ])
+            for config_id, config in enumerate(self.store.configs):
+                for row in self.store.rows(config_id):
+                    writer.writerow(csv_row(config, self.store.run(int(row))))
     
     def get_summary_table(self) -> str:
         """Retorna tabela formatada com resumo dos resultados."""
@@ -238,8 +995,9 @@ class ExperimentRunner:
         lines.append(f"{'n':<5} {'Dens':<8} {'BT Tempo':<12} {'BT Taxa':<10} {'BT Passos':<12} {'H Tempo':<12} {'H Taxa':<10}")
         lines.append("=" * 100)
         
+        group_stats = self.store.group_statistics()
         for result in self.results:
-            stats = result['statistics']
+            stats = group_stats[result['config_id']] if 'config_id' in result else result['statistics']
             lines.append(
                 f"{result['n']:<5} "
                 f"{result['density']:<8} "
@@ -256,19 +1014,10 @@ class ExperimentRunner:
     def generate_plots(self, output_dir: str = "results/plots"):
         """Gera gráficos dos resultados."""
         try:
-            from src.utils.plot_generator import PlotGenerator
-            
-            # Adicionar estatísticas de memória aos resultados
-            for result in self.results:
-                if 'statistics' in result:
-                    if 'memory_stats' not in result:
-                        result['memory_stats'] = {
-                            'bt_avg_memory': result['statistics'].get('bt_avg_memory', 0),
-                            'h_avg_memory': result['statistics'].get('h_avg_memory', 0)
-                        }
+            from src.utils.plot_generator import PlotGenerator, load_results_from_store
             
             generator = PlotGenerator(output_dir)
-            return generator.generate_all_plots(self.results)
+            return generator.generate_all_plots(load_results_from_store(self.store))
         except ImportError as e:
             warnings.warn(f"Erro ao gerar gráficos: {e}. Instale matplotlib: pip install matplotlib")
             return []
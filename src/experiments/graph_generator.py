@@ -1,8 +1,9 @@
 import random
 
-def generate_graph(n: int, density: str):
-    edges = []
+from src.utils.graph_generator import generate_random_graph
+
 
+def generate_graph(n: int, density: str):
     if density == "sparse":
         p = 1.5 / n      # baixa densidade
     elif density == "dense":
@@ -10,9 +11,4 @@ def generate_graph(n: int, density: str):
     else:
         p = random.uniform(0.05, 0.25)
 
-    for u in range(n):
-        for v in range(u+1, n):
-            if random.random() < p:
-                edges.append((u, v))
-
-    return edges
+    return generate_random_graph(n, p)
@@ -0,0 +1,455 @@
+# src/experiments/result_sink.py
+"""
+Gravação incremental de resultados (CSV ou JSONL).
+
+Cada execução vira uma linha assim que termina; a linha é descarregada e
+sincronizada com o disco (fsync) antes de seguir, então uma interrupção no
+meio de um batch longo perde no máximo a execução em andamento. O
+cabeçalho CSV é escrito uma única vez, inclusive ao reabrir para append:
+nesse caso as linhas seguem as colunas do arquivo existente (que pode ser
+de uma versão anterior, com menos colunas).
+"""
+
+import csv
+import json
+import os
+import warnings
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.algorithms.backtracking import PRUNE_RULES
+
+# Colunas do CSV de execuções (compartilhadas com ExperimentRunner.export_to_csv)
+CSV_COLUMNS = [
+    'n', 'densidade', 'probabilidade', 'run_id',
+    'num_arestas',
+    'bt_tempo', 'bt_sucesso', 'bt_timeout', 'bt_passos', 'bt_memoria_mb',
+    'h_tempo', 'h_sucesso', 'h_memoria_mb',
+    'gerador', 'resposta_conhecida', 'bt_erro', 'h_erro', 'bt_reutilizado',
+    'semente', 'bt_sem_memoria', 'bt_pulado', 'h_pulado',
+    'modo_medicao', 'bt_memoria_base_mb', 'h_memoria_base_mb',
+    'bt_instrumentado', 'bt_prof_max', 'bt_becos', 'bt_tempo_1a_solucao',
+    *[f'bt_podas_{rule}' for rule in PRUNE_RULES],
+    'bt_expansoes_prof', 'bt_filhos_prof',
+    'n_solicitado', 'h_timeout', 'h_sem_memoria',
+]
+
+# Colunas sem as quais um CSV não pode ser lido de volta (ver record_to_run)
+REQUIRED_COLUMNS = (
+    'n', 'densidade', 'probabilidade', 'run_id', 'num_arestas',
+    'bt_tempo', 'bt_sucesso', 'bt_passos', 'bt_memoria_mb',
+    'h_tempo', 'h_sucesso', 'h_memoria_mb',
+)
+
+# Histogramas por profundidade: listas no JSONL, valores separados por ';' no CSV
+HISTOGRAM_COLUMNS = {'bt_expansoes_prof': 'bt_depth_expansions', 'bt_filhos_prof': 'bt_depth_children'}
+
+SINK_FORMATS = ('csv', 'jsonl')
+
+# Critério de parada por configuração adaptativa (arquivo companheiro, ver
+# adaptive_path); ICs indefinidos ficam em branco
+ADAPTIVE_COLUMNS = [
+    'n', 'n_solicitado', 'densidade', 'gerador', 'semente', 'modo_medicao',
+    'repeticoes', 'estatistica', 'confianca', 'tempo_centro', 'ic_tempo_baixo', 'ic_tempo_alto',
+    'taxa_sucesso', 'ic_sucesso_baixo', 'ic_sucesso_alto', 'convergiu',
+]
+
+
+def memory_measured(record: Dict[str, Any], solver: str) -> bool:
+    """
+    Se a execução gravada em `record` (colunas de CSV_COLUMNS) teve a
+    passada de memória de `solver` ('bt' ou 'h') concluída.
+
+    Arquivos atuais deixam a memória em branco sem essa passada; nos
+    anteriores (zeros) ela é deduzida do modo de medição e dos desfechos.
+    """
+    def flag(key):
+        return bool(int(record.get(key) or 0))
+
+    if record.get(f'{solver}_memoria_mb') in (None, '') or record.get('modo_medicao') == 'time':
+        return False
+    failed = ('timeout', 'sem_memoria', 'pulado') + (('reutilizado',) if solver == 'bt' else ())
+    return not any(flag(f'{solver}_{outcome}') for outcome in failed)
+
+
+def run_record(result: Dict, run: Dict) -> Dict[str, Any]:
+    """
+    Registro de uma execução com as colunas de CSV_COLUMNS (valores tipados).
+    As colunas de memória de um método ficam vazias (None) se a passada de
+    memória não foi concluída (`<método>_memory_measured`).
+
+    Args:
+        result: configuração da execução (n, n_requested, density,
+            probability, generator, seed, measure); `n` é o tamanho do grafo
+            gerado e `n_requested` o da grade (diferem nas famílias que
+            arredondam o tamanho)
+        run: dados da execução (ver ExperimentRunner._run_repetition)
+    """
+    known = run.get('known_answer')
+
+    def memory(solver, field):
+        return run.get(f'{solver}_{field}', 0) if run.get(f'{solver}_memory_measured', True) else None
+
+    return {
+        'n': result['n'],
+        'densidade': result['density'],
+        'probabilidade': result['probability'],
+        'run_id': run['run_id'],
+        'num_arestas': run['num_edges'],
+        'bt_tempo': run['bt_time'],
+        'bt_sucesso': int(bool(run['bt_success'])),
+        'bt_timeout': int(bool(run.get('bt_timeout', False))),
+        'bt_passos': run['bt_steps'],
+        'bt_memoria_mb': memory('bt', 'memory_mb'),
+        'h_tempo': run['h_time'],
+        'h_sucesso': int(bool(run['h_success'])),
+        'h_memoria_mb': memory('h', 'memory_mb'),
+        'gerador': result.get('generator', ''),
+        'resposta_conhecida': None if known is None else int(known),
+        'bt_erro': int(bool(run.get('bt_error', False))),
+        'h_erro': int(bool(run.get('h_error', False))),
+        'bt_reutilizado': int(bool(run.get('bt_reused', False))),
+        'semente': result.get('seed'),
+        'bt_sem_memoria': int(bool(run.get('bt_oom', False))),
+        'bt_pulado': int(bool(run.get('bt_skipped', False))),
+        'h_pulado': int(bool(run.get('h_skipped', False))),
+        'modo_medicao': result.get('measure'),
+        'bt_memoria_base_mb': memory('bt', 'baseline_mb'),
+        'h_memoria_base_mb': memory('h', 'baseline_mb'),
+        'bt_instrumentado': int(bool(run.get('bt_instrumented', False))),
+        'bt_prof_max': run.get('bt_max_depth', 0),
+        'bt_becos': run.get('bt_dead_ends', 0),
+        'bt_tempo_1a_solucao': run.get('bt_first_solution_time'),
+        **{f'bt_podas_{rule}': run.get(f'bt_prunes_{rule}', 0) for rule in PRUNE_RULES},
+        **{column: run.get(field) for column, field in HISTOGRAM_COLUMNS.items()},
+        'n_solicitado': result.get('n_requested', result['n']),
+        'h_timeout': int(bool(run.get('h_timeout', False))),
+        'h_sem_memoria': int(bool(run.get('h_oom', False))),
+    }
+
+
+def csv_row(result: Dict, run: Dict, columns: Optional[List[str]] = None) -> List:
+    """
+    Linha CSV de uma execução.
+
+    Args:
+        columns: ordem das colunas (padrão: CSV_COLUMNS); colunas
+            desconhecidas ficam em branco
+    """
+    record = run_record(result, run)
+    for key in ('bt_tempo', 'h_tempo'):
+        record[key] = f"{record[key]:.6f}"
+    for key in ('bt_memoria_mb', 'h_memoria_mb', 'bt_memoria_base_mb', 'h_memoria_base_mb'):
+        if record[key] is not None:
+            record[key] = f"{record[key]:.4f}"
+    if record['bt_tempo_1a_solucao'] is not None:
+        record['bt_tempo_1a_solucao'] = f"{record['bt_tempo_1a_solucao']:.6f}"
+    for column in HISTOGRAM_COLUMNS:
+        if record[column] is not None:
+            record[column] = ';'.join(map(str, record[column]))
+    return ['' if record.get(c) is None else record[c] for c in (columns or CSV_COLUMNS)]
+
+
+def record_to_run(record: Dict[str, Any]) -> Tuple[Dict, Dict]:
+    """
+    Inverso de run_record: (configuração, execução) a partir de um registro.
+
+    Campos não gravados no arquivo (ex.: caminhos no CSV) voltam como None.
+    """
+    def flag(key):
+        return bool(int(record.get(key) or 0))
+
+    def histogram(key):
+        value = record.get(key)
+        if value in (None, ''):
+            return None
+        if isinstance(value, str):
+            return [int(v) for v in value.split(';')]
+        return [int(v) for v in value]
+
+    known = record.get('resposta_conhecida')
+    seed = record.get('semente')
+    requested = record.get('n_solicitado')
+    result = {
+        'n': int(record['n']),
+        'n_requested': int(requested) if requested not in (None, '') else int(record['n']),
+        'density': record['densidade'],
+        'probability': float(record['probabilidade']),
+        'generator': record.get('gerador') or '',
+        'seed': int(seed) if seed not in (None, '') else None,
+        'measure': record.get('modo_medicao') or None,
+    }
+    run = {
+        'run_id': int(record['run_id']),
+        'num_edges': int(record['num_arestas']),
+        'bt_time': float(record['bt_tempo']),
+        'bt_success': flag('bt_sucesso'),
+        'bt_steps': int(record['bt_passos']),
+        'bt_path': record.get('bt_caminho'),
+        'bt_timeout': flag('bt_timeout'),
+        'bt_oom': flag('bt_sem_memoria'),
+        'bt_memory_measured': memory_measured(record, 'bt'),
+        'bt_memory_mb': float(record['bt_memoria_mb'] or 0),
+        'bt_baseline_mb': float(record.get('bt_memoria_base_mb') or 0),
+        'h_time': float(record['h_tempo']),
+        'h_success': flag('h_sucesso'),
+        'h_path': record.get('h_caminho'),
+        'h_timeout': flag('h_timeout'),
+        'h_oom': flag('h_sem_memoria'),
+        'h_memory_measured': memory_measured(record, 'h'),
+        'h_memory_mb': float(record['h_memoria_mb'] or 0),
+        'h_baseline_mb': float(record.get('h_memoria_base_mb') or 0),
+        'known_answer': None if known in (None, '') else bool(int(known)),
+        'bt_reused': flag('bt_reutilizado'),
+        'bt_error': flag('bt_erro'),
+        'h_error': flag('h_erro'),
+        'bt_skipped': flag('bt_pulado'),
+        'h_skipped': flag('h_pulado'),
+        'bt_instrumented': flag('bt_instrumentado'),
+        'bt_max_depth': int(record.get('bt_prof_max') or 0),
+        'bt_dead_ends': int(record.get('bt_becos') or 0),
+        'bt_first_solution_time': (
+            float(record['bt_tempo_1a_solucao']) if record.get('bt_tempo_1a_solucao') not in (None, '') else None
+        ),
+        **{f'bt_prunes_{rule}': int(record.get(f'bt_podas_{rule}') or 0) for rule in PRUNE_RULES},
+        **{field: histogram(column) for column, field in HISTOGRAM_COLUMNS.items()},
+    }
+    return result, run
+
+
+def read_runs(path: str, fmt: Optional[str] = None) -> List[Tuple[Dict, Dict]]:
+    """
+    Lê as execuções já gravadas por um ResultSink.
+
+    Linhas de CSV com a largura de CSV_COLUMNS sob um cabeçalho mais
+    antigo (gravadas por versões que não conferiam o cabeçalho no append)
+    são lidas com as colunas atuais. Linhas incompletas (ex.: a última, se
+    o processo morreu no meio da escrita) são ignoradas com um aviso.
+
+    Returns:
+        Lista de (configuração, execução), na ordem do arquivo
+    """
+    fmt = fmt or detect_sink_format(path)
+    runs = []
+    skipped = 0
+    with open(path, newline='', encoding='utf-8') as f:
+        records = []
+        if fmt == 'csv':
+            reader = csv.reader(f)
+            header = next(reader, [])
+            for row in reader:
+                if len(row) == len(header):
+                    records.append(dict(zip(header, row)))
+                elif len(row) == len(CSV_COLUMNS):
+                    records.append(dict(zip(CSV_COLUMNS, row)))
+                elif row:
+                    skipped += 1
+        else:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    skipped += bool(line.strip())
+
+        for record in records:
+            try:
+                runs.append(record_to_run(record))
+            except (KeyError, TypeError, ValueError):
+                skipped += 1
+    if skipped:
+        warnings.warn(f"{skipped} linha(s) incompleta(s) ou ilegível(is) ignorada(s) em {path}")
+    return runs
+
+
+def read_csv_header(path: str) -> List[str]:
+    """Cabeçalho de um CSV existente (lista vazia se o arquivo estiver vazio)."""
+    with open(path, newline='', encoding='utf-8') as f:
+        return next(csv.reader(f), [])
+
+
+def adaptive_record(result: Dict) -> Dict[str, Any]:
+    """Registro com as colunas de ADAPTIVE_COLUMNS (ver run_adaptive_experiment)."""
+    adaptive = result['adaptive']
+    time_lo, time_hi = adaptive['time_ci'] or (None, None)
+    rate_lo, rate_hi = adaptive['success_ci']
+    return {
+        'n': result['n'],
+        'n_solicitado': result.get('n_requested', result['n']),
+        'densidade': result['density'],
+        'gerador': result.get('generator', ''),
+        'semente': result.get('seed'),
+        'modo_medicao': result.get('measure'),
+        'repeticoes': result['repetitions'],
+        'estatistica': adaptive['statistic'],
+        'confianca': adaptive['confidence'],
+        'tempo_centro': adaptive['time_center'],
+        'ic_tempo_baixo': time_lo,
+        'ic_tempo_alto': time_hi,
+        'taxa_sucesso': adaptive['success_rate'],
+        'ic_sucesso_baixo': rate_lo,
+        'ic_sucesso_alto': rate_hi,
+        'convergiu': int(bool(adaptive['converged'])),
+    }
+
+
+def adaptive_path(path: str) -> str:
+    """Arquivo companheiro dos critérios de parada: `<nome>_adaptativo<ext>`."""
+    root, ext = os.path.splitext(str(path))
+    return f"{root}_adaptativo{ext}"
+
+
+def detect_sink_format(path: str) -> str:
+    """'jsonl' para .jsonl/.ndjson, 'csv' caso contrário."""
+    return 'jsonl' if str(path).lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+
+
+class ResultSink:
+    """
+    Destino incremental, somente-append, para execuções de experimentos.
+
+    Uso:
+        with ResultSink("batch.csv") as sink:
+            runner = ExperimentRunner(sink=sink, path_policy='drop')
+            runner.run_batch_experiments(...)
+    """
+
+    def __init__(self, path: str, fmt: Optional[str] = None, append: bool = False,
+                 fsync: bool = True):
+        """
+        Args:
+            path: arquivo de saída
+            fmt: 'csv' ou 'jsonl' (padrão: pela extensão)
+            append: acrescentar a um arquivo existente em vez de truncá-lo;
+                no CSV, as linhas seguem o cabeçalho já gravado
+            fsync: sincronizar com o disco a cada linha
+
+        Raises:
+            ValueError: se o formato for inválido ou o CSV existente não
+                tiver as colunas de um ResultSink
+        """
+        self.path = str(path)
+        self.format = fmt or detect_sink_format(self.path)
+        if self.format not in SINK_FORMATS:
+            raise ValueError(f"Formato inválido: {self.format} (use: {', '.join(SINK_FORMATS)})")
+        self.fsync = fsync
+        self.append = append
+        self.count = 0
+        self._adaptive_file = None
+
+        has_content = append and os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        self.columns = list(CSV_COLUMNS)
+        if self.format == 'csv' and has_content:
+            self.columns = self._existing_columns()
+        self._file = open(self.path, 'a' if append else 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file) if self.format == 'csv' else None
+
+        if self.format == 'csv' and not has_content:
+            self._writer.writerow(CSV_COLUMNS)
+            self._sync()
+        elif has_content and not self._ends_with_newline():
+            # Linha truncada por uma interrupção: isolá-la (a leitura a ignora)
+            self._file.write("\n")
+            self._sync()
+
+    def _existing_columns(self) -> List[str]:
+        """Colunas do CSV existente; recusa arquivos que não são de um ResultSink."""
+        header = read_csv_header(self.path)
+        missing = [c for c in REQUIRED_COLUMNS if c not in header]
+        if missing:
+            raise ValueError(
+                f"{self.path} não é um CSV de execuções (faltam as colunas: {', '.join(missing)})"
+            )
+        dropped = [c for c in CSV_COLUMNS if c not in header]
+        if dropped:
+            warnings.warn(
+                f"{self.path} usa um cabeçalho anterior; colunas não gravadas: {', '.join(dropped)}"
+            )
+        return header
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _sync(self):
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def write(self, result: Dict, run: Dict):
+        """Grava (e sincroniza) uma execução concluída."""
+        if self.format == 'csv':
+            self._writer.writerow(csv_row(result, run, self.columns))
+        else:
+            record = run_record(result, run)
+            record['bt_caminho'] = run.get('bt_path')
+            record['h_caminho'] = run.get('h_path')
+            self._file.write(json.dumps(record) + "\n")
+        self._sync()
+        self.count += 1
+
+    def write_adaptive(self, result: Dict):
+        """
+        Grava o critério de parada de uma configuração adaptativa
+        (repetições feitas e ICs finais) no arquivo companheiro
+        `adaptive_path(path)`, no mesmo formato e modo de abertura.
+        """
+        record = adaptive_record(result)
+        if self._adaptive_file is None:
+            path = adaptive_path(self.path)
+            has_content = self.append and os.path.exists(path) and os.path.getsize(path) > 0
+            self._adaptive_file = open(path, 'a' if self.append else 'w', newline='', encoding='utf-8')
+            if self.format == 'csv' and not has_content:
+                csv.writer(self._adaptive_file).writerow(ADAPTIVE_COLUMNS)
+        if self.format == 'csv':
+            csv.writer(self._adaptive_file).writerow(
+                ['' if record[c] is None else record[c] for c in ADAPTIVE_COLUMNS]
+            )
+        else:
+            self._adaptive_file.write(json.dumps(record) + "\n")
+        self._adaptive_file.flush()
+        if self.fsync:
+            os.fsync(self._adaptive_file.fileno())
+
+    def close(self):
+        if not self._file.closed:
+            self._sync()
+            self._file.close()
+        if self._adaptive_file is not None and not self._adaptive_file.closed:
+            self._adaptive_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class TeeSink:
+    """Repassa cada execução a vários destinos (ex.: CSV e ResultsDB)."""
+
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+    @property
+    def count(self) -> int:
+        return self.sinks[0].count if self.sinks else 0
+
+    def write(self, result: Dict, run: Dict):
+        for sink in self.sinks:
+            sink.write(result, run)
+
+    def write_adaptive(self, result: Dict):
+        for sink in self.sinks:
+            write = getattr(sink, 'write_adaptive', None)
+            if write is not None:
+                write(result)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
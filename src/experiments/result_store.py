@@ -0,0 +1,483 @@
+# src/experiments/result_store.py
+"""
+Armazenamento colunar e compacto das execuções de experimentos.
+
+Cada campo de uma execução vira uma coluna NumPy tipada (crescimento por
+duplicação), em vez de um dicionário por execução. Os caminhos encontrados
+ficam num buffer int32 único com (início, tamanho) por execução, ou são
+descartados / despejados em disco conforme a política. As estatísticas
+por configuração saem de uma agregação vetorizada (group-by por
+`np.bincount`), usada por ExperimentRunner, pelo sumário e pelos gráficos.
+"""
+
+import math
+import os
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from src.algorithms.backtracking import PRUNE_RULES
+from src.utils.confidence import t_quantile, wilson_interval
+
+# Colunas por execução: campo do dicionário de execução -> dtype
+RUN_COLUMNS = {
+    "config": np.int32,
+    "run_id": np.int32,
+    "num_edges": np.int64,
+    "bt_time": np.float64,
+    "bt_steps": np.int64,
+    "bt_memory_mb": np.float64,
+    "bt_baseline_mb": np.float64,
+    "h_time": np.float64,
+    "h_memory_mb": np.float64,
+    "h_baseline_mb": np.float64,
+    "known_answer": np.int8,  # -1 = desconhecida
+    "bt_success": np.bool_,
+    "bt_timeout": np.bool_,
+    "bt_oom": np.bool_,
+    "bt_reused": np.bool_,
+    "bt_skipped": np.bool_,
+    "bt_error": np.bool_,
+    "h_success": np.bool_,
+    "h_timeout": np.bool_,
+    "h_oom": np.bool_,
+    "h_skipped": np.bool_,
+    "h_error": np.bool_,
+    # Passada de memória concluída (não há no modo 'time' nem após timeout)
+    "bt_memory_measured": np.bool_,
+    "h_memory_measured": np.bool_,
+    # Instrumentação da busca (ExperimentRunner(instrument=True))
+    "bt_instrumented": np.bool_,
+    "bt_max_depth": np.int32,
+    "bt_dead_ends": np.int64,
+    "bt_first_solution_time": np.float64,
+    **{f"bt_prunes_{rule}": np.int64 for rule in PRUNE_RULES},
+}
+
+PATH_SOLVERS = ("bt", "h")
+
+# Histogramas por profundidade (listas de tamanho variável), num buffer int64
+HISTOGRAM_FIELDS = ("bt_depth_expansions", "bt_depth_children")
+PATH_POLICIES = ("keep", "drop", "spill")
+
+
+class ResultStore:
+    """
+    Execuções em colunas tipadas, com configurações (n, densidade, ...) numa
+    tabela à parte referenciada pela coluna `config`.
+
+    Políticas de caminhos:
+        'keep'  buffer int32 empacotado em memória
+        'drop'  caminhos descartados (só o resultado/tempo fica)
+        'spill' caminhos gravados num arquivo binário int32 (lidos sob demanda)
+
+    A política pode passar de 'keep' para 'drop' (e vice-versa) a qualquer
+    momento; 'spill' deve ser escolhida na criação.
+    """
+
+    def __init__(self, path_policy: str = "keep", spill_path: Optional[str] = None,
+                 capacity: int = 1024):
+        """
+        Args:
+            path_policy: 'keep', 'drop' ou 'spill'
+            spill_path: arquivo para a política 'spill' (padrão: temporário)
+            capacity: capacidade inicial das colunas
+        """
+        if path_policy not in PATH_POLICIES:
+            raise ValueError(f"Política inválida: {path_policy} (use: {', '.join(PATH_POLICIES)})")
+        self.path_policy = path_policy
+        self.spill_path = spill_path
+        self._spill = None
+        self._capacity = max(1, capacity)
+        self.clear()
+
+    def clear(self):
+        """Remove todas as execuções e configurações."""
+        self.configs: List[Dict[str, Any]] = []
+        self._ranges: List[List[int]] = []  # linhas [início, fim) do primeiro bloco
+        self._counts: List[int] = []  # total de linhas de cada configuração
+        self._size = 0
+        self._columns = {name: np.zeros(self._capacity, dtype=dt) for name, dt in RUN_COLUMNS.items()}
+        for solver in PATH_SOLVERS:
+            self._columns[f"{solver}_path_start"] = np.zeros(self._capacity, dtype=np.int64)
+            self._columns[f"{solver}_path_len"] = np.full(self._capacity, -1, dtype=np.int32)
+        for field in HISTOGRAM_FIELDS:
+            self._columns[f"{field}_start"] = np.zeros(self._capacity, dtype=np.int64)
+            self._columns[f"{field}_len"] = np.full(self._capacity, -1, dtype=np.int32)
+        self._paths = np.zeros(self._capacity, dtype=np.int32)
+        self._paths_size = 0
+        self._hist = np.zeros(0, dtype=np.int64)
+        self._hist_size = 0
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def add_config(self, **meta) -> int:
+        """Registra uma configuração (n, density, generator, probability, seed...)."""
+        self.configs.append(meta)
+        self._ranges.append([self._size, self._size])
+        self._counts.append(0)
+        return len(self.configs) - 1
+
+    def _grow(self, needed: int):
+        capacity = len(self._columns["config"])
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.full(capacity, -1 if name.endswith("_len") else 0, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def _store_path(self, row: int, solver: str, path: Optional[Sequence[int]]):
+        if path is None or self.path_policy == "drop":
+            return
+        data = np.asarray(path, dtype=np.int32)
+
+        if self.path_policy == "spill":
+            if self._spill is None:
+                if self.spill_path is None:
+                    fd, self.spill_path = tempfile.mkstemp(suffix=".paths")
+                    os.close(fd)
+                self._spill = open(self.spill_path, "w+b")
+            self._spill.seek(0, os.SEEK_END)
+            start = self._spill.tell() // 4
+            self._spill.write(data.astype("<i4").tobytes())
+        else:
+            end = self._paths_size + len(data)
+            if end > len(self._paths):
+                grown = np.zeros(max(end, 2 * len(self._paths)), dtype=np.int32)
+                grown[:self._paths_size] = self._paths[:self._paths_size]
+                self._paths = grown
+            start = self._paths_size
+            self._paths[start:end] = data
+            self._paths_size = end
+
+        self._columns[f"{solver}_path_start"][row] = start
+        self._columns[f"{solver}_path_len"][row] = len(data)
+
+    def _store_histogram(self, row: int, field: str, values: Optional[Sequence[int]]):
+        if values is None:
+            return
+        end = self._hist_size + len(values)
+        if end > len(self._hist):
+            grown = np.zeros(max(end, 2 * len(self._hist), 1024), dtype=np.int64)
+            grown[:self._hist_size] = self._hist[:self._hist_size]
+            self._hist = grown
+        start = self._hist_size
+        self._hist[start:end] = values
+        self._hist_size = end
+        self._columns[f"{field}_start"][row] = start
+        self._columns[f"{field}_len"][row] = len(values)
+
+    def append(self, config_id: int, run: Dict[str, Any]) -> int:
+        """Acrescenta uma execução (dicionário de ExperimentRunner._run_repetition)."""
+        row = self._size
+        self._grow(row + 1)
+        columns = self._columns
+        columns["config"][row] = config_id
+        for name in RUN_COLUMNS:
+            if name == "config":
+                continue
+            value = run.get(name)
+            if name == "known_answer":
+                value = -1 if value is None else int(value)
+            columns[name][row] = value if value is not None else 0
+        for solver in PATH_SOLVERS:
+            columns[f"{solver}_path_len"][row] = -1
+            self._store_path(row, solver, run.get(f"{solver}_path"))
+        for field in HISTOGRAM_FIELDS:
+            columns[f"{field}_len"][row] = -1
+            self._store_histogram(row, field, run.get(field))
+
+        self._size += 1
+        self._counts[config_id] += 1
+        if self._ranges[config_id][1] == row:
+            self._ranges[config_id][1] = row + 1
+        return row
+
+    def extend(self, config_id: int, runs: Iterable[Dict[str, Any]]):
+        for run in runs:
+            self.append(config_id, run)
+
+    @classmethod
+    def from_runs(cls, runs: Iterable[Dict[str, Any]], **meta) -> "ResultStore":
+        """Store de uma única configuração, sem caminhos (para agregar listas de execuções)."""
+        store = cls(path_policy="drop")
+        store.extend(store.add_config(**meta), runs)
+        return store
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, name: str) -> np.ndarray:
+        """Visão (somente leitura) de uma coluna."""
+        view = self._columns[name][:self._size]
+        view.flags.writeable = False
+        return view
+
+    def rows(self, config_id: int):
+        """Linhas de uma configuração: range se contíguas (caso comum), senão índices."""
+        start, end = self._ranges[config_id]
+        if end - start == self._counts[config_id]:
+            return range(start, end)
+        return np.flatnonzero(self.column("config") == config_id)
+
+    def path(self, row: int, solver: str) -> Optional[List[int]]:
+        """Caminho de um método numa execução (None se não houver ou foi descartado)."""
+        length = int(self._columns[f"{solver}_path_len"][row])
+        if length < 0:
+            return None
+        start = int(self._columns[f"{solver}_path_start"][row])
+        if self._spill is not None:
+            self._spill.flush()
+            self._spill.seek(4 * start)
+            return np.frombuffer(self._spill.read(4 * length), dtype="<i4").tolist()
+        return self._paths[start:start + length].tolist()
+
+    def histogram(self, row: int, field: str) -> Optional[List[int]]:
+        """Histograma por profundidade de uma execução (None se não instrumentada)."""
+        length = int(self._columns[f"{field}_len"][row])
+        if length < 0:
+            return None
+        start = int(self._columns[f"{field}_start"][row])
+        return self._hist[start:start + length].tolist()
+
+    def run(self, row: int) -> Dict[str, Any]:
+        """Reconstrói o dicionário de uma execução."""
+        run = {}
+        for name in RUN_COLUMNS:
+            if name == "config":
+                continue
+            value = self._columns[name][row].item()
+            if name == "known_answer":
+                value = None if value < 0 else bool(value)
+            run[name] = value
+        if not run["bt_instrumented"] or not run["bt_success"]:
+            run["bt_first_solution_time"] = None
+        for solver in PATH_SOLVERS:
+            run[f"{solver}_path"] = self.path(row, solver)
+        for field in HISTOGRAM_FIELDS:
+            run[field] = self.histogram(row, field)
+        return run
+
+    def runs(self, config_id: int) -> "RunsView":
+        return RunsView(self, config_id)
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelas colunas e pelo buffer de caminhos."""
+        return sum(c.nbytes for c in self._columns.values()) + self._paths.nbytes + self._hist.nbytes
+
+    def close(self):
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    # ------------------------------------------------------------------
+    # Agregação
+    # ------------------------------------------------------------------
+
+    def statistics(self, config_id: int) -> Dict[str, Any]:
+        """Estatísticas de uma configuração (mesmas chaves de group_statistics)."""
+        rows = self.rows(config_id)
+        if isinstance(rows, range):
+            index = slice(rows.start, rows.stop)
+        else:
+            index = rows
+        columns = {name: self._columns[name][:self._size][index] for name in self._columns}
+        return _aggregate(columns, np.zeros(len(columns["config"]), dtype=np.int64), 1, self._hist)[0]
+
+    def group_statistics(self) -> List[Dict[str, Any]]:
+        """Estatísticas de todas as configurações, indexadas por config_id."""
+        columns = {name: self.column(name) for name in self._columns}
+        return _aggregate(columns, columns["config"].astype(np.int64), len(self.configs), self._hist)
+
+
+class RunsView(Sequence):
+    """Sequência de execuções de uma configuração, materializadas sob demanda."""
+
+    def __init__(self, store: ResultStore, config_id: int):
+        self._store = store
+        self._config_id = config_id
+
+    def _rows(self):
+        return self._store.rows(self._config_id)
+
+    def __len__(self) -> int:
+        return len(self._rows())
+
+    def __getitem__(self, i):
+        rows = self._rows()
+        if isinstance(i, slice):
+            return [self._store.run(int(r)) for r in rows[i]]
+        return self._store.run(int(rows[i]))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row in self._rows():
+            yield self._store.run(int(row))
+
+
+def _histogram_sums(columns: Dict[str, np.ndarray], field: str, groups: np.ndarray, mask: np.ndarray,
+                    k: int, buffer: np.ndarray) -> np.ndarray:
+    """Soma, por grupo e profundidade, dos histogramas das linhas em `mask` (matriz k x D)."""
+    lengths = columns[f"{field}_len"][mask].astype(np.int64)
+    starts = columns[f"{field}_start"][mask][lengths > 0]
+    owners = groups[mask][lengths > 0]
+    lengths = lengths[lengths > 0]
+    depth_count = int(lengths.max()) if len(lengths) else 0
+    sums = np.zeros((k, depth_count), dtype=np.float64)
+    if depth_count:
+        depth = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        values = buffer[np.repeat(starts, lengths) + depth]
+        np.add.at(sums, (np.repeat(owners, lengths), depth), values)
+    return sums
+
+
+def _trim(values: np.ndarray) -> List[float]:
+    """Lista sem os zeros finais (profundidades não atingidas pelo grupo)."""
+    nonzero = np.flatnonzero(values)
+    return values[:nonzero[-1] + 1].tolist() if len(nonzero) else []
+
+
+def _aggregate(columns: Dict[str, np.ndarray], groups: np.ndarray, k: int,
+               histograms: Optional[np.ndarray] = None, confidence: float = 0.95) -> List[Dict[str, Any]]:
+    """
+    Group-by vetorizado: estatísticas por grupo (0..k-1) das colunas dadas.
+
+    Execuções puladas (fronteira) não entram em nenhuma estatística do
+    método; as com resposta reaproveitada não têm tempo/passos medidos.
+    Tempos, passos e memória de um grupo sem nenhuma execução que os tenha
+    medido (ex.: todas reaproveitadas, todas em timeout) são NaN, e o IC do
+    tempo fica indefinido (None); as médias de memória só usam execuções
+    com a passada de memória concluída.
+    As métricas de instrumentação só consideram execuções instrumentadas
+    (e, para o tempo até a primeira solução, as que acharam caminho).
+    """
+    def count(mask):
+        return np.bincount(groups[mask], minlength=k)
+
+    def total(values, mask):
+        return np.bincount(groups[mask], weights=values[mask], minlength=k)
+
+    def mean(values, mask, empty=0.0):
+        c = count(mask)
+        return np.divide(total(values, mask), c, out=np.full(k, empty), where=c > 0)
+
+    def extreme(values, mask, ufunc, start, empty=0.0):
+        out = np.full(k, start, dtype=np.float64)
+        ufunc.at(out, groups[mask], values[mask])
+        out[~np.isfinite(out)] = empty
+        return out
+
+    everything = np.ones(len(groups), dtype=bool)
+    bt_runs = ~columns["bt_skipped"]
+    h_runs = ~columns["h_skipped"]
+    measured = bt_runs & ~columns["bt_reused"]
+    bt_timed = measured & ~columns["bt_timeout"]
+    bt_memory = measured & columns["bt_memory_measured"]
+    h_memory = h_runs & columns["h_memory_measured"]
+    bt_time = columns["bt_time"]
+    h_time = columns["h_time"]
+    steps = columns["bt_steps"].astype(np.float64)
+
+    n_total = count(everything)
+    n_bt = count(bt_runs)
+    n_h = count(h_runs)
+    n_measured = count(measured)
+    n_timed = count(bt_timed)
+    bt_success = count(bt_runs & columns["bt_success"])
+    h_success = count(h_runs & columns["h_success"])
+
+    arrays = {
+        "bt_avg_time": mean(bt_time, bt_timed, np.nan),
+        "bt_min_time": extreme(bt_time, bt_timed, np.minimum, np.inf, np.nan),
+        "bt_max_time": extreme(bt_time, bt_timed, np.maximum, -np.inf, np.nan),
+        "bt_success_rate": np.divide(bt_success, n_bt, out=np.zeros(k), where=n_bt > 0),
+        "bt_timeout_count": count(bt_runs & columns["bt_timeout"]),
+        "bt_oom_count": count(bt_runs & columns["bt_oom"]),
+        "bt_error_count": count(bt_runs & columns["bt_error"]),
+        "bt_reused_count": n_bt - n_measured,
+        "bt_skipped_count": n_total - n_bt,
+        "bt_avg_steps": mean(steps, measured, np.nan),
+        "bt_min_steps": extreme(steps, measured, np.minimum, np.inf, np.nan),
+        "bt_max_steps": extreme(steps, measured, np.maximum, -np.inf, np.nan),
+        "bt_avg_memory": mean(columns["bt_memory_mb"], bt_memory, np.nan),
+        "bt_avg_baseline_memory": mean(columns["bt_baseline_mb"], bt_memory, np.nan),
+
+        "h_avg_time": mean(h_time, h_runs, np.nan),
+        "h_min_time": extreme(h_time, h_runs, np.minimum, np.inf, np.nan),
+        "h_max_time": extreme(h_time, h_runs, np.maximum, -np.inf, np.nan),
+        "h_success_rate": np.divide(h_success, n_h, out=np.zeros(k), where=n_h > 0),
+        "h_avg_memory": mean(columns["h_memory_mb"], h_memory, np.nan),
+        "h_avg_baseline_memory": mean(columns["h_baseline_mb"], h_memory, np.nan),
+        "h_timeout_count": count(h_runs & (columns["h_timeout"] | columns["h_oom"])),
+        "h_skipped_count": n_total - n_h,
+        "h_error_count": count(h_runs & columns["h_error"]),
+        "avg_edges": mean(columns["num_edges"].astype(np.float64), everything),
+    }
+
+    instrumented = measured & columns["bt_instrumented"]
+    n_instrumented = count(instrumented)
+    arrays.update({
+        "bt_instrumented_count": n_instrumented,
+        "bt_avg_dead_ends": mean(columns["bt_dead_ends"].astype(np.float64), instrumented),
+        "bt_avg_max_depth": mean(columns["bt_max_depth"].astype(np.float64), instrumented),
+        "bt_max_depth": extreme(columns["bt_max_depth"].astype(np.float64), instrumented, np.maximum, -np.inf),
+        "bt_avg_first_solution_time": mean(columns["bt_first_solution_time"],
+                                           instrumented & columns["bt_success"]),
+        **{f"bt_avg_prunes_{rule}": mean(columns[f"bt_prunes_{rule}"].astype(np.float64), instrumented)
+           for rule in PRUNE_RULES},
+    })
+    if histograms is not None and "bt_depth_expansions_len" in columns:
+        expansions = _histogram_sums(columns, "bt_depth_expansions", groups, instrumented, k, histograms)
+        generated = _histogram_sums(columns, "bt_depth_children", groups, instrumented, k, histograms)
+    else:
+        expansions = generated = np.zeros((k, 0))
+    integer_keys = {key for key in arrays
+                    if key.endswith(("_count", "_steps", "_depth")) and "avg" not in key}
+
+    # Variância do tempo por grupo, para o IC t da média
+    bt_time_sq = total(bt_time * bt_time, bt_timed)
+
+    stats = []
+    for g in range(k):
+        entry = {
+            key: int(values[g]) if key in integer_keys and np.isfinite(values[g]) else float(values[g])
+            for key, values in arrays.items()
+        }
+
+        c = int(n_timed[g])
+        center = entry["bt_avg_time"]
+        if c <= 1:
+            # Nenhum ou um único tempo: IC indefinido
+            entry["bt_time_ci_low"] = entry["bt_time_ci_high"] = None
+        else:
+            variance = max(0.0, (bt_time_sq[g] - c * center * center) / (c - 1))
+            half = t_quantile(confidence, c - 1) * math.sqrt(variance / c)
+            entry["bt_time_ci_low"], entry["bt_time_ci_high"] = center - half, center + half
+
+        _, entry["bt_success_ci_low"], entry["bt_success_ci_high"] = wilson_interval(
+            int(bt_success[g]), int(n_bt[g]), confidence
+        )
+
+        # Histogramas: expansões médias por profundidade e fator de ramificação
+        runs_g = max(1, int(n_instrumented[g]))
+        entry["bt_avg_depth_expansions"] = _trim(expansions[g] / runs_g)
+        depth_count = len(entry["bt_avg_depth_expansions"])
+        entry["bt_depth_branching"] = np.divide(
+            generated[g], expansions[g], out=np.zeros(expansions.shape[1]), where=expansions[g] > 0
+        )[:depth_count].tolist()
+        stats.append(entry)
+
+    return stats
@@ -0,0 +1,543 @@
+# src/experiments/results_db.py
+"""
+Banco de resultados em SQLite (biblioteca padrão).
+
+Esquema:
+    machines         máquina que executou (hostname, plataforma, Python, CPUs)
+    solver_versions  versão de cada método (hash do código-fonte do módulo)
+    configurations   (n, densidade, gerador, probabilidade, semente, instância,
+                     modo de medição)
+    runs             uma linha por repetição (configuração, máquina, run_id)
+    measurements     uma linha por (repetição, método), indexada por
+                     (solver, n, density)
+    adaptive_stops   critério de parada de cada configuração adaptativa
+                     (repetições feitas e ICs finais; ver write_adaptive)
+
+O banco abre em modo WAL: leitores não bloqueiam o escritor e vários
+processos da mesma máquina podem gravar no mesmo arquivo; cada lote é uma
+transação `BEGIN IMMEDIATE` com `executemany`. Bancos de outras máquinas
+entram com `ResultsDB.merge`. As agregações por configuração são feitas
+em SQL, sem reler as execuções em Python.
+"""
+
+import hashlib
+import math
+import os
+import platform
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.confidence import t_quantile, wilson_interval
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS machines (
+    id INTEGER PRIMARY KEY,
+    hostname TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    python TEXT NOT NULL,
+    cpu_count INTEGER,
+    UNIQUE (hostname, platform, python)
+);
+CREATE TABLE IF NOT EXISTS solver_versions (
+    id INTEGER PRIMARY KEY,
+    solver TEXT NOT NULL,
+    version TEXT NOT NULL,
+    UNIQUE (solver, version)
+);
+CREATE TABLE IF NOT EXISTS configurations (
+    id INTEGER PRIMARY KEY,
+    n INTEGER NOT NULL,
+    density TEXT NOT NULL,
+    generator TEXT NOT NULL DEFAULT '',
+    probability REAL NOT NULL,
+    seed INTEGER NOT NULL DEFAULT -1,
+    instance TEXT NOT NULL DEFAULT '',
+    measure TEXT NOT NULL DEFAULT '',
+    UNIQUE (n, density, generator, probability, seed, instance, measure)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    config_id INTEGER NOT NULL REFERENCES configurations(id),
+    machine_id INTEGER NOT NULL REFERENCES machines(id),
+    run_id INTEGER NOT NULL,
+    num_edges INTEGER NOT NULL,
+    known_answer INTEGER,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    run_pk INTEGER NOT NULL REFERENCES runs(id),
+    solver TEXT NOT NULL,
+    solver_version_id INTEGER NOT NULL REFERENCES solver_versions(id),
+    n INTEGER NOT NULL,
+    density TEXT NOT NULL,
+    time REAL NOT NULL,
+    success INTEGER NOT NULL,
+    timeout INTEGER NOT NULL,
+    oom INTEGER NOT NULL,
+    error INTEGER NOT NULL,
+    skipped INTEGER NOT NULL,
+    reused INTEGER NOT NULL,
+    steps INTEGER,
+    memory_mb REAL,
+    baseline_mb REAL,
+    PRIMARY KEY (run_pk, solver)
+);
+CREATE INDEX IF NOT EXISTS idx_measurements_solver_n_density
+    ON measurements (solver, n, density);
+CREATE INDEX IF NOT EXISTS idx_runs_config ON runs (config_id);
+CREATE TABLE IF NOT EXISTS adaptive_stops (
+    id INTEGER PRIMARY KEY,
+    config_id INTEGER NOT NULL REFERENCES configurations(id),
+    repetitions INTEGER NOT NULL,
+    statistic TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    time_center REAL,
+    time_ci_low REAL,
+    time_ci_high REAL,
+    success_rate REAL,
+    success_ci_low REAL,
+    success_ci_high REAL,
+    converged INTEGER NOT NULL,
+    created_at TEXT NOT NULL
+);
+"""
+
+# Campos de medição por método no dicionário de execução (ver
+# ExperimentRunner._run_repetition); ausentes valem 0, e os de memória
+# ficam NULL sem a passada de memória (`<método>_memory_measured`)
+MEMORY_FIELDS = ('memory_mb', 'baseline_mb')
+MEASUREMENT_FIELDS = (
+    'time', 'success', 'timeout', 'oom', 'error', 'skipped', 'reused', 'steps', 'memory_mb', 'baseline_mb',
+)
+
+
+def machine_info() -> Dict[str, Any]:
+    """Identificação da máquina atual."""
+    return {
+        "hostname": platform.node(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def solver_versions() -> Dict[str, str]:
+    """Versão de cada método: os 12 primeiros hex do SHA-1 do módulo que o implementa."""
+    from src.algorithms.backtracking import find_hamiltonian_path_bt
+    from src.algorithms.heuristic import heuristic_path
+
+    versions = {}
+    for solver, func in (('bt', find_hamiltonian_path_bt), ('h', heuristic_path)):
+        with open(sys.modules[func.__module__].__file__, 'rb') as f:
+            versions[solver] = hashlib.sha1(f.read()).hexdigest()[:12]
+    return versions
+
+
+class ResultsDB:
+    """
+    Banco SQLite de execuções, com a mesma interface de escrita de um
+    ResultSink (`write`, `close`, `count`), então pode ser o `sink` de um
+    ExperimentRunner.
+
+    As execuções são acumuladas e gravadas em lotes (a cada `batch_size`
+    execuções ou `flush_seconds` segundos, e no `close`); uma interrupção
+    perde no máximo o lote em andamento.
+
+    Uso:
+        with ResultsDB("results.db") as db:
+            runner = ExperimentRunner(sink=db, path_policy='drop')
+            runner.run_batch_experiments(...)
+
+        results = ResultsDB("results.db").load_results(generator='gnp')
+    """
+
+    def __init__(self, path: str, batch_size: int = 256, flush_seconds: float = 5.0,
+                 busy_timeout: float = 30.0):
+        """
+        Args:
+            path: arquivo do banco (criado se não existir)
+            batch_size: execuções por transação de escrita
+            flush_seconds: intervalo máximo entre gravações de um lote parcial
+            busy_timeout: espera máxima (s) pelo lock de escrita de outro processo
+        """
+        self.path = str(path)
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.count = 0
+        self._pending: List[Tuple[Dict, Dict]] = []
+        self._last_flush = time.monotonic()
+        self._machine_id = None
+        self._version_ids = None
+        self._config_ids: Dict[Tuple, int] = {}
+
+        # Autocommit: as transações são abertas explicitamente em flush
+        self._conn = sqlite3.connect(self.path, timeout=busy_timeout, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def _get_or_create(self, table: str, values: Dict[str, Any]) -> int:
+        columns = ", ".join(values)
+        self._conn.execute(
+            f"INSERT OR IGNORE INTO {table} ({columns}) VALUES ({', '.join('?' * len(values))})",
+            tuple(values.values())
+        )
+        where = " AND ".join(f"{c} = ?" for c in values)
+        return self._conn.execute(f"SELECT id FROM {table} WHERE {where}", tuple(values.values())).fetchone()[0]
+
+    def _config_id(self, config: Dict) -> int:
+        seed = config.get("seed")
+        values = {
+            "n": int(config["n"]),
+            "density": str(config["density"]),
+            "generator": config.get("generator") or "",
+            "probability": float(config.get("probability") or 0),
+            "seed": -1 if seed is None else int(seed),
+            "instance": config.get("instance") or "",
+            "measure": config.get("measure") or "",
+        }
+        key = tuple(values.values())
+        if key not in self._config_ids:
+            self._config_ids[key] = self._get_or_create("configurations", values)
+        return self._config_ids[key]
+
+    def write(self, result: Dict, run: Dict):
+        """Acrescenta uma execução ao lote (gravado ao encher ou por tempo)."""
+        self._pending.append((result, run))
+        self.count += 1
+        if len(self._pending) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_seconds:
+            self.flush()
+
+    def write_adaptive(self, result: Dict):
+        """
+        Registra o critério de parada de uma configuração adaptativa
+        (ExperimentRunner.run_adaptive_experiment): repetições feitas e ICs
+        finais. IC de tempo indefinido (um só tempo medido) fica NULL.
+        """
+        adaptive = result["adaptive"]
+        time_ci = adaptive["time_ci"] or (None, None)
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute(
+                "INSERT INTO adaptive_stops (config_id, repetitions, statistic, confidence, time_center, "
+                "time_ci_low, time_ci_high, success_rate, success_ci_low, success_ci_high, converged, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._config_id(result), int(result["repetitions"]), adaptive["statistic"],
+                 float(adaptive["confidence"]), adaptive["time_center"], *time_ci,
+                 adaptive["success_rate"], *adaptive["success_ci"], int(bool(adaptive["converged"])),
+                 datetime.now().isoformat())
+            )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            self._config_ids.clear()
+            raise
+
+    def adaptive_stops(self) -> List[Dict[str, Any]]:
+        """Critérios de parada gravados, com a configuração de cada um."""
+        cursor = self._conn.execute("""
+            SELECT c.n, c.density, c.generator, c.seed, c.measure, a.repetitions, a.statistic,
+                   a.confidence, a.time_center, a.time_ci_low, a.time_ci_high, a.success_rate,
+                   a.success_ci_low, a.success_ci_high, a.converged, a.created_at
+            FROM adaptive_stops a JOIN configurations c ON c.id = a.config_id
+            ORDER BY a.id
+        """)
+        names = [d[0] for d in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def extend(self, records: Iterable[Tuple[Dict, Dict]]):
+        """Grava vários pares (configuração, execução), ex.: de read_runs."""
+        for result, run in records:
+            self.write(result, run)
+        self.flush()
+
+    def flush(self):
+        """Grava o lote pendente numa única transação."""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            if self._machine_id is None:
+                self._machine_id = self._get_or_create("machines", machine_info())
+                self._version_ids = {
+                    solver: self._get_or_create("solver_versions", {"solver": solver, "version": version})
+                    for solver, version in solver_versions().items()
+                }
+
+            # O lock de escrita é exclusivo até o COMMIT: os ids a partir do
+            # maior existente não colidem com outro processo
+            first = self._conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM runs").fetchone()[0]
+            now = datetime.now().isoformat()
+            run_rows, measurement_rows = [], []
+            for pk, (result, run) in enumerate(pending, start=first):
+                known = run.get("known_answer")
+                run_rows.append((
+                    pk, self._config_id(result), self._machine_id, int(run["run_id"]),
+                    int(run["num_edges"]), None if known is None else int(known), now,
+                ))
+                for solver, version_id in self._version_ids.items():
+                    memory = run.get(f"{solver}_memory_measured", True)
+                    measurement_rows.append((
+                        pk, solver, version_id, int(result["n"]), str(result["density"]),
+                        *((float(run.get(f"{solver}_{field}") or 0) if memory else None) if field in MEMORY_FIELDS
+                          else float(run.get(f"{solver}_{field}") or 0) if field == 'time'
+                          else int(run.get(f"{solver}_{field}") or 0) for field in MEASUREMENT_FIELDS),
+                    ))
+
+            self._conn.executemany("INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)", run_rows)
+            self._conn.executemany(
+                "INSERT INTO measurements VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", measurement_rows
+            )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            self._config_ids.clear()
+            raise
+
+    def merge(self, path: str) -> int:
+        """
+        Incorpora as execuções de outro banco (ex.: de outra máquina).
+
+        Máquinas, versões e configurações são unificadas pelas chaves
+        naturais; as execuções recebem novos ids.
+
+        Returns:
+            Número de execuções incorporadas
+        """
+        self.flush()
+        self._conn.execute("ATTACH DATABASE ? AS other", (str(path),))
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO machines (hostname, platform, python, cpu_count) "
+                    "SELECT hostname, platform, python, cpu_count FROM other.machines")
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO solver_versions (solver, version) "
+                    "SELECT solver, version FROM other.solver_versions")
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO configurations "
+                    "(n, density, generator, probability, seed, instance, measure) "
+                    "SELECT n, density, generator, probability, seed, instance, measure FROM other.configurations")
+
+                offset = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM runs").fetchone()[0]
+                merged = self._conn.execute("""
+                    INSERT INTO runs
+                    SELECT r.id + ?, c.id, ma.id, r.run_id, r.num_edges, r.known_answer, r.created_at
+                    FROM other.runs r
+                    JOIN other.configurations oc ON oc.id = r.config_id
+                    JOIN configurations c ON c.n = oc.n AND c.density = oc.density
+                        AND c.generator = oc.generator AND c.probability = oc.probability
+                        AND c.seed = oc.seed AND c.instance = oc.instance AND c.measure = oc.measure
+                    JOIN other.machines om ON om.id = r.machine_id
+                    JOIN machines ma ON ma.hostname = om.hostname AND ma.platform = om.platform
+                        AND ma.python = om.python
+                """, (offset,)).rowcount
+                self._conn.execute("""
+                    INSERT INTO measurements
+                    SELECT m.run_pk + ?, m.solver, sv.id, m.n, m.density, m.time, m.success,
+                           m.timeout, m.oom, m.error, m.skipped, m.reused, m.steps, m.memory_mb, m.baseline_mb
+                    FROM other.measurements m
+                    JOIN other.solver_versions osv ON osv.id = m.solver_version_id
+                    JOIN solver_versions sv ON sv.solver = osv.solver AND sv.version = osv.version
+                """, (offset,))
+                # Bancos anteriores à tabela adaptive_stops não a têm
+                has_stops = self._conn.execute(
+                    "SELECT 1 FROM other.sqlite_master WHERE type = 'table' AND name = 'adaptive_stops'"
+                ).fetchone()
+                if has_stops:
+                    self._conn.execute("""
+                        INSERT INTO adaptive_stops (config_id, repetitions, statistic, confidence, time_center,
+                            time_ci_low, time_ci_high, success_rate, success_ci_low, success_ci_high,
+                            converged, created_at)
+                        SELECT c.id, a.repetitions, a.statistic, a.confidence, a.time_center, a.time_ci_low,
+                               a.time_ci_high, a.success_rate, a.success_ci_low, a.success_ci_high,
+                               a.converged, a.created_at
+                        FROM other.adaptive_stops a
+                        JOIN other.configurations oc ON oc.id = a.config_id
+                        JOIN configurations c ON c.n = oc.n AND c.density = oc.density
+                            AND c.generator = oc.generator AND c.probability = oc.probability
+                            AND c.seed = oc.seed AND c.instance = oc.instance AND c.measure = oc.measure
+                    """)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        finally:
+            self._conn.execute("DETACH DATABASE other")
+        self._config_ids.clear()
+        return merged
+
+    def close(self):
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def aggregate(self, generator: Optional[str] = None, hostname: Optional[str] = None,
+                  since: Optional[str] = None, measure: Optional[str] = None,
+                  confidence: float = 0.95) -> List[Dict[str, Any]]:
+        """
+        Estatísticas por (n, densidade, gerador, instância, modo de medição),
+        agregadas em SQL. Modos diferentes nunca são misturados: no modo
+        'memory' os tempos incluem o custo do tracemalloc.
+
+        As chaves de `statistics` são as de ExperimentRunner._compute_statistics,
+        com as mesmas exclusões (execuções puladas ou com resposta
+        reaproveitada; timeouts fora do tempo do backtracking).
+
+        Args:
+            generator: só este gerador
+            hostname: só execuções desta máquina
+            since: só execuções a partir desta data/hora ISO
+            measure: só este modo de medição ('time', 'memory', 'both')
+            confidence: nível dos intervalos de confiança
+
+        Returns:
+            Lista de {n, density, generator, instance, measure, repetitions, statistics}
+        """
+        filters, params = [], []
+        if measure is not None:
+            filters.append("c.measure = ?")
+            params.append(measure)
+        if generator is not None:
+            filters.append("c.generator = ?")
+            params.append(generator)
+        if hostname is not None:
+            filters.append("ma.hostname = ?")
+            params.append(hostname)
+        if since is not None:
+            filters.append("r.created_at >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+
+        # "medido" = não pulado e não reaproveitado; "cronometrado" = medido e sem timeout;
+        # memória: medido e com a passada de memória (bancos anteriores
+        # gravavam 0 no modo 'time' e após timeout/estouro)
+        memory = ("m.skipped = 0 AND m.reused = 0 AND m.memory_mb IS NOT NULL "
+                  "AND c.measure != 'time' AND m.timeout = 0 AND m.oom = 0")
+        query = f"""
+            SELECT c.n, c.density, c.generator, c.instance, c.measure, m.solver,
+                   COUNT(*) AS total,
+                   SUM(1 - m.skipped) AS runs,
+                   SUM(m.success * (1 - m.skipped)) AS success,
+                   SUM(m.timeout * (1 - m.skipped)) AS timeouts,
+                   SUM(m.oom * (1 - m.skipped)) AS ooms,
+                   SUM(m.error * (1 - m.skipped)) AS errors,
+                   SUM(m.reused * (1 - m.skipped)) AS reused,
+                   COUNT(CASE WHEN m.skipped = 0 AND m.reused = 0 AND m.timeout = 0 THEN 1 END) AS timed,
+                   AVG(CASE WHEN m.skipped = 0 AND m.reused = 0 AND m.timeout = 0 THEN m.time END) AS t_avg,
+                   MIN(CASE WHEN m.skipped = 0 AND m.reused = 0 AND m.timeout = 0 THEN m.time END) AS t_min,
+                   MAX(CASE WHEN m.skipped = 0 AND m.reused = 0 AND m.timeout = 0 THEN m.time END) AS t_max,
+                   SUM(CASE WHEN m.skipped = 0 AND m.reused = 0 AND m.timeout = 0 THEN m.time * m.time END) AS t_sq,
+                   AVG(CASE WHEN m.skipped = 0 THEN m.time END) AS all_avg,
+                   MIN(CASE WHEN m.skipped = 0 THEN m.time END) AS all_min,
+                   MAX(CASE WHEN m.skipped = 0 THEN m.time END) AS all_max,
+                   AVG(CASE WHEN m.skipped = 0 AND m.reused = 0 THEN m.steps END) AS s_avg,
+                   MIN(CASE WHEN m.skipped = 0 AND m.reused = 0 THEN m.steps END) AS s_min,
+                   MAX(CASE WHEN m.skipped = 0 AND m.reused = 0 THEN m.steps END) AS s_max,
+                   AVG(CASE WHEN {memory} THEN m.memory_mb END) AS mem_avg,
+                   AVG(CASE WHEN {memory} THEN m.baseline_mb END) AS base_avg,
+                   AVG(r.num_edges) AS avg_edges
+            FROM measurements m
+            JOIN runs r ON r.id = m.run_pk
+            JOIN configurations c ON c.id = r.config_id
+            JOIN machines ma ON ma.id = r.machine_id
+            {where}
+            GROUP BY c.n, c.density, c.generator, c.instance, c.measure, m.solver
+            ORDER BY c.generator, c.instance, c.measure, c.density, c.n
+        """
+        self.flush()
+        groups: Dict[Tuple, Dict[str, Any]] = {}
+        cursor = self._conn.execute(query, params)
+        names = [d[0] for d in cursor.description]
+        for values in cursor:
+            row = dict(zip(names, values))
+            key = (row["n"], row["density"], row["generator"], row["instance"], row["measure"])
+            entry = groups.setdefault(key, {
+                "n": row["n"], "density": row["density"], "generator": row["generator"],
+                "instance": row["instance"] or None, "measure": row["measure"] or None,
+                "repetitions": row["total"],
+                "statistics": {"avg_edges": row["avg_edges"] or 0},
+            })
+            entry["statistics"].update(_solver_statistics(row, confidence))
+        return list(groups.values())
+
+    def load_results(self, **filters) -> List[Dict[str, Any]]:
+        """Resultados no formato de load_results_from_store (com memory_stats)."""
+        results = self.aggregate(**filters)
+        for result in results:
+            stats = result["statistics"]
+            result["memory_stats"] = {
+                "bt_avg_memory": stats.get("bt_avg_memory", 0),
+                "h_avg_memory": stats.get("h_avg_memory", 0),
+            }
+        return results
+
+
+def _solver_statistics(row: Dict[str, Any], confidence: float) -> Dict[str, Any]:
+    """Estatísticas de um método a partir de uma linha agregada de ResultsDB.aggregate."""
+    solver, total, runs = row["solver"], row["total"], row["runs"] or 0
+
+    def value(key):
+        return row[key] if row[key] is not None else 0
+
+    def measured(key):
+        # Média/extremo sem nenhuma execução medida: NaN, como em ResultStore
+        return row[key] if row[key] is not None else math.nan
+
+    stats = {
+        "success_rate": value("success") / runs if runs else 0,
+        "error_count": value("errors"),
+        "skipped_count": total - runs,
+    }
+    if solver == "h":
+        # Heurística: sem reaproveitamento; timeouts entram no tempo
+        stats.update({
+            "avg_time": measured("all_avg"), "min_time": measured("all_min"), "max_time": measured("all_max"),
+            "avg_memory": measured("mem_avg"),
+            "avg_baseline_memory": measured("base_avg"),
+            "timeout_count": value("timeouts") + value("ooms"),
+        })
+    else:
+        center, timed = measured("t_avg"), value("timed")
+        if timed <= 1:
+            # Nenhum ou um único tempo: IC indefinido
+            lo = hi = None
+        else:
+            variance = max(0.0, (value("t_sq") - timed * center * center) / (timed - 1))
+            half = t_quantile(confidence, timed - 1) * math.sqrt(variance / timed)
+            lo, hi = center - half, center + half
+        _, rate_lo, rate_hi = wilson_interval(value("success"), runs, confidence)
+        stats.update({
+            "avg_time": center, "min_time": measured("t_min"), "max_time": measured("t_max"),
+            "time_ci_low": lo, "time_ci_high": hi,
+            "success_ci_low": rate_lo, "success_ci_high": rate_hi,
+            "timeout_count": value("timeouts"),
+            "oom_count": value("ooms"),
+            "reused_count": value("reused"),
+            "avg_steps": measured("s_avg"), "min_steps": measured("s_min"), "max_steps": measured("s_max"),
+            "avg_memory": measured("mem_avg"),
+            "avg_baseline_memory": measured("base_avg"),
+        })
+    return {f"{solver}_{key}": v for key, v in stats.items()}
@@ -0,0 +1,240 @@
+# src/graph_corpus.py
+"""
+Corpus de instâncias: muitos grafos em um único arquivo (.hpc).
+
+Layout (little-endian):
+    [0:32)    cabeçalho  -> magic "HPC1", versão, offset do índice, tamanho do índice
+    registros arestas de cada grafo como int32[m, 2] (u < v), um após o outro
+    índice    JSON com uma entrada por grafo (offset, n, m e metadados)
+
+Novos grafos são acrescentados ao final do arquivo e o índice é regravado
+depois deles; o cabeçalho só passa a apontar para o novo índice no final
+da escrita, então uma interrupção no meio de um append não corrompe o
+corpus existente.
+"""
+
+import json
+import os
+import struct
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+CORPUS_MAGIC = b"HPC1"
+CORPUS_VERSION = 1
+CORPUS_HEADER_FORMAT = "<4sIqq"
+CORPUS_HEADER_SIZE = 32
+
+# Chaves do índice preenchidas pelo próprio corpus; não podem vir como metadados
+RESERVED_KEYS = frozenset({"id", "offset", "n", "m", "name"})
+
+
+def is_corpus_file(path: str) -> bool:
+    """Indica se o arquivo é um corpus .hpc."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(CORPUS_MAGIC)) == CORPUS_MAGIC
+    except OSError:
+        return False
+
+
+class GraphCorpus:
+    """
+    Contêiner indexado de grafos com acesso aleatório O(1) e append.
+
+    Cada entrada do índice guarda `id`, `offset`, `n`, `m` e metadados
+    livres (ex.: gerador, parâmetros, semente, resposta conhecida).
+
+    Uso:
+        with GraphCorpus("corpus.hpc", "a") as corpus:
+            corpus.add(n, edges, generator="gnp", p=0.2, seed=42)
+
+        corpus = GraphCorpus("corpus.hpc")
+        n, edges = corpus.get(0)
+        for entry, n, edges in corpus.iter_graphs(n=20):
+            ...
+    """
+
+    def __init__(self, path: str, mode: str = "r"):
+        """
+        Args:
+            path: caminho do arquivo .hpc
+            mode: "r" (somente leitura) ou "a" (leitura e append; cria se não existir)
+        """
+        if mode not in ("r", "a"):
+            raise ValueError(f"Modo inválido: {mode} (use 'r' ou 'a')")
+
+        self.path = str(path)
+        self.mode = mode
+        self.entries: List[Dict[str, Any]] = []
+        self._by_name: Dict[str, int] = {}
+        self._dirty = False
+
+        if mode == "a" and not os.path.exists(self.path):
+            self._file = open(self.path, "w+b")
+            self._index_offset = CORPUS_HEADER_SIZE
+            self._write_index()
+        else:
+            self._file = open(self.path, "r+b" if mode == "a" else "rb")
+            try:
+                self._read_index()
+            except ValueError:
+                self._file.close()
+                raise
+
+    # ------------------------------------------------------------------
+    # Índice
+    # ------------------------------------------------------------------
+
+    def _read_index(self):
+        self._file.seek(0)
+        raw = self._file.read(CORPUS_HEADER_SIZE)
+        if len(raw) < CORPUS_HEADER_SIZE or raw[:4] != CORPUS_MAGIC:
+            raise ValueError(f"{self.path} não é um corpus .hpc válido")
+
+        _, version, index_offset, index_length = struct.unpack_from(CORPUS_HEADER_FORMAT, raw)
+        if version != CORPUS_VERSION:
+            raise ValueError(f"Versão de corpus não suportada: {version}")
+
+        self._file.seek(index_offset)
+        self.entries = json.loads(self._file.read(index_length).decode("utf-8"))
+        self._index_offset = index_offset
+        self._by_name = {
+            e["name"]: e["id"] for e in self.entries if e.get("name") is not None
+        }
+
+    def _write_index(self):
+        data = json.dumps(self.entries).encode("utf-8")
+        self._file.seek(self._index_offset)
+        self._file.write(data)
+        self._file.truncate()
+        self._file.flush()
+
+        # O cabeçalho é atualizado por último
+        header = struct.pack(
+            CORPUS_HEADER_FORMAT, CORPUS_MAGIC, CORPUS_VERSION, self._index_offset, len(data)
+        )
+        self._file.seek(0)
+        self._file.write(header.ljust(CORPUS_HEADER_SIZE, b"\0"))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def add(self, n: int, edges, name: Optional[str] = None, **metadata) -> int:
+        """
+        Acrescenta um grafo ao corpus.
+
+        Args:
+            n: número de vértices
+            edges: arestas (lista de pares ou array [m, 2])
+            name: chave textual opcional e única para busca direta
+            **metadata: metadados livres (gerador, parâmetros, seed, answer...);
+                chaves em RESERVED_KEYS são recusadas
+
+        Returns:
+            id do grafo no corpus
+
+        Raises:
+            ValueError: se o nome já existir ou um metadado usar chave reservada
+        """
+        if self.mode != "a":
+            raise IOError("Corpus aberto somente para leitura")
+        reserved = sorted(RESERVED_KEYS.intersection(metadata))
+        if reserved:
+            raise ValueError(f"Metadados com chaves reservadas do índice: {', '.join(reserved)}")
+        if name is not None and name in self._by_name:
+            raise ValueError(f"Nome já existe no corpus: {name}")
+
+        data = np.ascontiguousarray(np.asarray(edges, dtype="<i4").reshape(-1, 2))
+
+        # Registros novos entram depois do índice atual (que segue válido)
+        self._file.seek(0, os.SEEK_END)
+        offset = self._file.tell()
+        self._file.write(data.tobytes())
+        self._index_offset = self._file.tell()
+
+        graph_id = len(self.entries)
+        entry = {"id": graph_id, "offset": offset, "n": int(n), "m": len(data)}
+        if name is not None:
+            entry["name"] = name
+            self._by_name[name] = graph_id
+        entry.update(metadata)
+        self.entries.append(entry)
+        self._dirty = True
+
+        return graph_id
+
+    def flush(self):
+        """Grava o índice (e o cabeçalho) se houver grafos novos."""
+        if self._dirty:
+            self._write_index()
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self.mode == "a":
+            self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def entry(self, key: Union[int, str]) -> Dict[str, Any]:
+        """Retorna a entrada do índice por id (int) ou nome (str)."""
+        if isinstance(key, str):
+            if key not in self._by_name:
+                raise KeyError(f"Grafo não encontrado no corpus: {key}")
+            key = self._by_name[key]
+        return self.entries[key]
+
+    def get(self, key: Union[int, str]) -> Tuple[int, np.ndarray]:
+        """
+        Lê um grafo por id ou nome (acesso aleatório O(1)).
+
+        Returns:
+            Tupla (n, edges) com edges como array int32 [m, 2]
+        """
+        entry = self.entry(key)
+        self._file.seek(entry["offset"])
+        raw = self._file.read(8 * entry["m"])
+        edges = np.frombuffer(raw, dtype="<i4").reshape(-1, 2)
+        return entry["n"], edges
+
+    def find(self, **criteria) -> List[Dict[str, Any]]:
+        """Retorna as entradas cujos metadados são iguais aos critérios dados."""
+        return [
+            e for e in self.entries
+            if all(e.get(k) == v for k, v in criteria.items())
+        ]
+
+    def iter_graphs(self, ids: Optional[List[Union[int, str]]] = None,
+                    **criteria) -> Iterator[Tuple[Dict[str, Any], int, np.ndarray]]:
+        """
+        Itera (preguiçosamente) sobre os grafos do corpus.
+
+        Args:
+            ids: ids ou nomes específicos (padrão: todos)
+            **criteria: filtros de igualdade sobre os metadados
+
+        Yields:
+            (entry, n, edges)
+        """
+        entries = [self.entry(k) for k in ids] if ids is not None else self.entries
+        for entry in entries:
+            if all(entry.get(k) == v for k, v in criteria.items()):
+                n, edges = self.get(entry["id"])
+                yield entry, n, edges
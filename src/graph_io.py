@@ -1,30 +1,175 @@
 # src/graph_io.py
+import bz2
+import gzip
+import io
+import lzma
 
-def load_graph(path):
+
+# ============================================================================
+# COMPRESSÃO TRANSPARENTE
+# ============================================================================
+
+# Assinaturas (magic bytes) dos formatos de compressão suportados
+COMPRESSION_MAGIC = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+
+# Extensões usadas para escolher a compressão na escrita
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+}
+
+_COMPRESSION_OPENERS = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+
+def detect_compression(path):
+    """
+    Detecta a compressão de um arquivo pelos magic bytes.
+
+    Retorna:
+        "gzip", "bz2", "xz" ou None (arquivo sem compressão)
+    """
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for name, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def strip_compression_suffix(path):
+    """Remove a extensão de compressão (.gz/.bz2/.xz) do nome, se houver."""
+    path = str(path)
+    for suffix in COMPRESSION_SUFFIXES:
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return path
+
+
+def open_graph_file(path, mode="rb"):
+    """
+    Abre um arquivo de grafo com (des)compressão transparente em streaming.
+
+    Na leitura a compressão é detectada pelos magic bytes; na escrita é
+    escolhida pela extensão (.gz, .bz2, .xz). Nenhuma cópia descomprimida
+    é gravada em disco.
+
+    Args:
+        path (str): caminho do arquivo
+        mode (str): "rb", "rt", "wb" ou "wt"
+    """
+    if mode.startswith("r"):
+        compression = detect_compression(path)
+    else:
+        compression = next(
+            (c for suffix, c in COMPRESSION_SUFFIXES.items() if str(path).endswith(suffix)),
+            None,
+        )
+
+    binary_mode = mode[0] + "b"
+    if compression is None:
+        stream = open(path, binary_mode)
+    else:
+        stream = _COMPRESSION_OPENERS[compression](path, binary_mode)
+
+    if mode.endswith("t"):
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return stream
+
+
+# ============================================================================
+# FORMATO TEXTO (n m / u v)
+# ============================================================================
+
+def load_graph(path, return_report=False):
     """
     Lê um grafo a partir de um arquivo no formato:
     n m
     u v
     u v
     ...
+    Arestas são normalizadas na leitura: laços (u == v) e arestas repetidas
+    (em qualquer orientação) são descartados; vértices fora de [0, n) geram erro.
+    Arquivos comprimidos (gzip/bz2/xz) são descomprimidos em streaming.
     Retorna:
         n (int): número de vértices
         adj (list[list[int]]): lista de adjacência
+        report (dict): apenas se return_report=True (ver `normalize_edges`)
     """
-    with open(path, "r") as f:
+    seen = set()
+    self_loops = 0
+    duplicates = 0
+    total = 0
+
+    with open_graph_file(path, "rt") as f:
         first_line = f.readline().strip().split()
         n, m = map(int, first_line)
 
         adj = [[] for _ in range(n)]
 
         for line in f:
+            if not line.strip():
+                continue
             u, v = map(int, line.strip().split())
+            total += 1
+            if not (0 <= u < n and 0 <= v < n):
+                raise ValueError(f"Aresta ({u}, {v}) fora do intervalo [0, {n}) em {path}")
+            if u == v:
+                self_loops += 1
+                continue
+            key = (u, v) if u < v else (v, u)
+            if key in seen:
+                duplicates += 1
+                continue
+            seen.add(key)
             adj[u].append(v)
             adj[v].append(u)  # grafo não-direcionado
 
+    report = _normalization_report(m, total, self_loops, duplicates)
+    _warn_normalization(path, report)
+
+    if return_report:
+        return n, adj, report
     return n, adj
 
 
+def _normalization_report(header_m, input_edges, self_loops, duplicates):
+    """Monta o relatório de normalização de arestas."""
+    return {
+        "header_edges": header_m,
+        "input_edges": input_edges,
+        "self_loops": self_loops,
+        "duplicates": duplicates,
+        "output_edges": input_edges - self_loops - duplicates,
+        "header_mismatch": header_m != input_edges,
+    }
+
+
+def _warn_normalization(path, report):
+    """Emite um aviso resumindo o que a normalização alterou (se algo mudou)."""
+    import warnings
+
+    changes = []
+    if report["header_mismatch"]:
+        changes.append(
+            f"cabeçalho declara m={report['header_edges']}, lidas {report['input_edges']}"
+        )
+    if report["self_loops"]:
+        changes.append(f"{report['self_loops']} laço(s) removido(s)")
+    if report["duplicates"]:
+        changes.append(f"{report['duplicates']} aresta(s) duplicada(s) removida(s)")
+    if changes:
+        warnings.warn(f"Normalização de {path}: " + "; ".join(changes))
+
+
 def save_graph(path, n, adj):
     """
     Salva um grafo em arquivo no formato:
@@ -32,6 +177,7 @@ def save_graph(path, n, adj):
     u v
     u v
     ...
+    Se o caminho terminar em .gz, .bz2 ou .xz, a saída é comprimida na escrita.
     Args:
         path (str): caminho do arquivo
         n (int): número de vértices
@@ -46,8 +192,526 @@ def save_graph(path, n, adj):
     
     m = len(edges)
     
-    with open(path, "w") as f:
+    with open_graph_file(path, "wt") as f:
         f.write(f"{n} {m}\n")
         for u, v in sorted(edges):
             f.write(f"{u} {v}\n")
 
+
+
+# ============================================================================
+# CARREGAMENTO RÁPIDO (NumPy / CSR)
+# ============================================================================
+
+# Tamanho dos blocos lidos de uma vez pelo carregador rápido (16 MiB)
+FAST_IO_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def _parse_int_block(block):
+    """Converte um bloco de texto ASCII em um vetor int64 (parsing vetorizado)."""
+    import numpy as np
+
+    if not block.strip():
+        return np.empty(0, dtype=np.int64)
+    return np.fromstring(block.decode("ascii"), dtype=np.int64, sep=" ")
+
+
+def normalize_edges(n, u, v, header_m=None):
+    """
+    Normaliza vetores de arestas em uma única passada vetorizada.
+
+    - canonicaliza cada aresta como (min, max)
+    - remove laços e arestas duplicadas (mantém a primeira ocorrência)
+    - valida os vértices contra [0, n)
+
+    Args:
+        n (int): número de vértices
+        u, v (np.ndarray): extremidades de cada aresta
+        header_m (int | None): número de arestas declarado no cabeçalho
+    Retorna:
+        u, v (np.ndarray[int64]): arestas normalizadas (u < v)
+        report (dict): contagens de entrada, laços, duplicatas e saída
+    Raises:
+        ValueError: se algum vértice estiver fora do intervalo
+    """
+    import numpy as np
+
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    total = len(u)
+
+    out_of_range = (u < 0) | (u >= n) | (v < 0) | (v >= n)
+    if out_of_range.any():
+        bad = int(np.flatnonzero(out_of_range)[0])
+        raise ValueError(
+            f"{int(out_of_range.sum())} aresta(s) fora do intervalo [0, {n}), "
+            f"a primeira é ({u[bad]}, {v[bad]})"
+        )
+
+    lo = np.minimum(u, v)
+    hi = np.maximum(u, v)
+
+    loops = lo == hi
+    lo, hi = lo[~loops], hi[~loops]
+
+    _, first = np.unique(lo * n + hi, return_index=True)
+    keep = np.sort(first)
+    lo, hi = lo[keep], hi[keep]
+
+    self_loops = int(loops.sum())
+    duplicates = total - self_loops - len(keep)
+    report = _normalization_report(
+        total if header_m is None else header_m, total, self_loops, duplicates
+    )
+    return lo, hi, report
+
+
+def edges_to_csr(n, u, v):
+    """
+    Constrói a representação CSR (não-direcionada) a partir de vetores de arestas.
+
+    Args:
+        n (int): número de vértices
+        u, v (np.ndarray): extremidades de cada aresta
+    Retorna:
+        indptr (np.ndarray[int64]): deslocamentos de tamanho n + 1
+        indices (np.ndarray[int32]): vizinhos concatenados
+    """
+    import numpy as np
+
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+
+    src = np.concatenate([u, v])
+    dst = np.concatenate([v, u])
+
+    order = np.argsort(src, kind="stable")
+    indices = dst[order].astype(np.int32)
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+
+    return indptr, indices
+
+
+def csr_to_edges(n, indptr, indices):
+    """
+    Extrai as arestas (u < v) de um grafo em CSR.
+
+    Retorna:
+        u, v (np.ndarray[int64]): extremidades de cada aresta
+    """
+    import numpy as np
+
+    src = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    dst = np.asarray(indices, dtype=np.int64)
+    mask = src < dst
+    return src[mask], dst[mask]
+
+
+def csr_to_adj(n, indptr, indices):
+    """Converte CSR para a lista de adjacência usada por `load_graph`."""
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    return [indices[indptr[u]:indptr[u + 1]] for u in range(n)]
+
+
+def load_graph_fast(path, chunk_bytes=FAST_IO_CHUNK_BYTES, return_report=False):
+    """
+    Versão rápida de `load_graph` para arquivos grandes.
+
+    Lê o arquivo em blocos grandes, converte os inteiros de forma vetorizada
+    (NumPy) e monta o CSR diretamente, sem listas Python intermediárias.
+    O número de arestas informado no cabeçalho é validado e as arestas passam
+    por `normalize_edges` (laços e duplicatas removidos). Entradas comprimidas
+    são descomprimidas bloco a bloco direto no parser.
+
+    Args:
+        path (str): caminho do arquivo no formato `n m / u v`
+        chunk_bytes (int): tamanho dos blocos de leitura
+        return_report (bool): se True, retorna também o relatório de normalização
+    Retorna:
+        n (int): número de vértices
+        indptr (np.ndarray[int64]): deslocamentos CSR
+        indices (np.ndarray[int32]): vizinhos concatenados
+        report (dict): apenas se return_report=True
+    Raises:
+        ValueError: se o arquivo estiver malformado (um `m` que não confere
+            com o corpo só gera aviso, como em load_graph)
+    """
+    import numpy as np
+
+    blocks = []
+    with open_graph_file(path, "rb") as f:
+        header = f.readline().split()
+        if len(header) != 2:
+            raise ValueError(f"Cabeçalho inválido em {path}: esperado 'n m'")
+        n, m = map(int, header)
+
+        tail = b""
+        while True:
+            chunk = f.read(chunk_bytes)
+            if not chunk:
+                break
+            chunk = tail + chunk
+            # Cortar no último '\n' para não partir um número ao meio
+            cut = chunk.rfind(b"\n") + 1
+            tail = chunk[cut:]
+            blocks.append(_parse_int_block(chunk[:cut]))
+        blocks.append(_parse_int_block(tail))
+
+    values = np.concatenate(blocks) if blocks else np.empty(0, dtype=np.int64)
+    if values.size % 2:
+        raise ValueError(f"Número ímpar de inteiros no corpo de {path}")
+
+    # `m` divergente do corpo: mesma política de load_graph (aviso e relatório)
+    pairs = values.reshape(-1, 2)
+
+    try:
+        u, v, report = normalize_edges(n, pairs[:, 0], pairs[:, 1], header_m=m)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from None
+    _warn_normalization(path, report)
+
+    indptr, indices = edges_to_csr(n, u, v)
+    if return_report:
+        return n, indptr, indices, report
+    return n, indptr, indices
+
+
+# ============================================================================
+# FORMATO BINÁRIO MAPEÁVEL EM MEMÓRIA (.hpg)
+# ============================================================================
+#
+# Layout (little-endian):
+#   [0:64)   cabeçalho  -> magic "HPG1", versão, flags, n, m, len(metadados)
+#   indptr   int64[n + 1]
+#   indices  int32[2m]          (alinhado em 8 bytes)
+#   perm     int32[n]           (opcional, flag HPG_FLAG_PERMUTATION)
+#   meta     JSON UTF-8         (opcional)
+#
+# Os vetores são abertos com np.memmap: nenhum parsing nem cópia, e vários
+# processos que abrem o mesmo arquivo compartilham as páginas via cache do SO.
+# Um .hpg comprimido (ex.: .hpg.gz) é descomprimido para a memória, sem mmap.
+
+HPG_MAGIC = b"HPG1"
+HPG_VERSION = 1
+HPG_HEADER_FORMAT = "<4sIIqqq"
+HPG_HEADER_SIZE = 64
+HPG_FLAG_PERMUTATION = 0x1
+
+
+def _align8(offset):
+    return (offset + 7) & ~7
+
+
+def _hpg_layout(n, m, has_perm):
+    """Calcula os deslocamentos (em bytes) de cada seção do arquivo .hpg."""
+    indptr_off = HPG_HEADER_SIZE
+    indices_off = _align8(indptr_off + 8 * (n + 1))
+    perm_off = _align8(indices_off + 4 * 2 * m)
+    meta_off = _align8(perm_off + (4 * n if has_perm else 0))
+    return indptr_off, indices_off, perm_off, meta_off
+
+
+def is_binary_graph(path):
+    """Indica se o arquivo está no formato binário .hpg."""
+    with open_graph_file(path, "rb") as f:
+        return f.read(len(HPG_MAGIC)) == HPG_MAGIC
+
+
+def save_graph_binary(path, n, indptr, indices, permutation=None, metadata=None):
+    """
+    Salva um grafo CSR no formato binário .hpg.
+
+    Args:
+        path (str): caminho do arquivo
+        n (int): número de vértices
+        indptr (np.ndarray): deslocamentos CSR (n + 1)
+        indices (np.ndarray): vizinhos concatenados (2m)
+        permutation (np.ndarray | None): permutação opcional dos vértices
+        metadata (dict | None): metadados arbitrários (serializados em JSON)
+    """
+    import json
+    import struct
+    import numpy as np
+
+    indptr = np.ascontiguousarray(indptr, dtype="<i8")
+    indices = np.ascontiguousarray(indices, dtype="<i4")
+    if len(indptr) != n + 1 or indptr[-1] != len(indices) or len(indices) % 2:
+        raise ValueError("CSR inconsistente: indptr/indices não conferem com n")
+    m = len(indices) // 2
+
+    has_perm = permutation is not None
+    flags = HPG_FLAG_PERMUTATION if has_perm else 0
+    meta_bytes = json.dumps(metadata).encode("utf-8") if metadata else b""
+
+    indptr_off, indices_off, perm_off, meta_off = _hpg_layout(n, m, has_perm)
+    header = struct.pack(
+        HPG_HEADER_FORMAT, HPG_MAGIC, HPG_VERSION, flags, n, m, len(meta_bytes)
+    )
+
+    sections = [
+        (indptr_off, indptr.tobytes()),
+        (indices_off, indices.tobytes()),
+    ]
+    if has_perm:
+        sections.append((perm_off, np.ascontiguousarray(permutation, dtype="<i4").tobytes()))
+    sections.append((meta_off, meta_bytes))
+
+    # Escrita sequencial com padding explícito (compatível com saída comprimida)
+    with open_graph_file(path, "wb") as f:
+        f.write(header.ljust(HPG_HEADER_SIZE, b"\0"))
+        position = HPG_HEADER_SIZE
+        for offset, data in sections:
+            f.write(b"\0" * (offset - position))
+            f.write(data)
+            position = offset + len(data)
+
+
+def _memmap_section(path, dtype, offset, count, buffer=None):
+    import numpy as np
+
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    if buffer is not None:
+        return np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+
+
+def load_graph_binary(path, with_info=False):
+    """
+    Abre um grafo .hpg sem cópia (np.memmap).
+
+    Args:
+        path (str): caminho do arquivo
+        with_info (bool): se True, retorna também permutação e metadados
+    Retorna:
+        n, indptr, indices
+        ou (n, indptr, indices, info) com info = {"permutation", "metadata"}
+    Raises:
+        ValueError: se o arquivo não for um .hpg válido
+    """
+    import json
+    import struct
+
+    # Comprimido: não há como mapear, descomprime tudo para a memória
+    buffer = None
+    if detect_compression(path) is not None:
+        with open_graph_file(path, "rb") as f:
+            buffer = f.read()
+        raw = buffer[:HPG_HEADER_SIZE]
+    else:
+        with open(path, "rb") as f:
+            raw = f.read(HPG_HEADER_SIZE)
+    if len(raw) < HPG_HEADER_SIZE or raw[:4] != HPG_MAGIC:
+        raise ValueError(f"{path} não é um arquivo .hpg válido")
+
+    _, version, flags, n, m, meta_len = struct.unpack_from(HPG_HEADER_FORMAT, raw)
+    if version != HPG_VERSION:
+        raise ValueError(f"Versão .hpg não suportada: {version}")
+
+    has_perm = bool(flags & HPG_FLAG_PERMUTATION)
+    indptr_off, indices_off, perm_off, meta_off = _hpg_layout(n, m, has_perm)
+
+    indptr = _memmap_section(path, "<i8", indptr_off, n + 1, buffer)
+    indices = _memmap_section(path, "<i4", indices_off, 2 * m, buffer)
+
+    if not with_info:
+        return n, indptr, indices
+
+    permutation = _memmap_section(path, "<i4", perm_off, n, buffer) if has_perm else None
+    metadata = {}
+    if meta_len:
+        if buffer is not None:
+            meta_bytes = buffer[meta_off:meta_off + meta_len]
+        else:
+            with open(path, "rb") as f:
+                f.seek(meta_off)
+                meta_bytes = f.read(meta_len)
+        metadata = json.loads(meta_bytes.decode("utf-8"))
+
+    return n, indptr, indices, {"permutation": permutation, "metadata": metadata}
+
+
+# ============================================================================
+# INSTÂNCIAS DE BENCHMARK (TSPLIB .hcp / DIMACS)
+# ============================================================================
+
+# Palavras-chave do cabeçalho TSPLIB usadas para reconhecer arquivos .hcp
+TSPLIB_KEYWORDS = (
+    "NAME", "TYPE", "COMMENT", "DIMENSION", "EDGE_DATA_FORMAT", "EDGE_DATA_SECTION",
+)
+
+
+def _finish_1_indexed(path, n, u, v, header_m=None, return_report=False):
+    """Converte arestas 1-indexadas para CSR normalizado."""
+    import numpy as np
+
+    u = np.asarray(u, dtype=np.int64) - 1
+    v = np.asarray(v, dtype=np.int64) - 1
+    try:
+        u, v, report = normalize_edges(n, u, v, header_m=header_m)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from None
+    _warn_normalization(path, report)
+
+    indptr, indices = edges_to_csr(n, u, v)
+    if return_report:
+        return n, indptr, indices, report
+    return n, indptr, indices
+
+
+def load_graph_hcp(path, return_report=False):
+    """
+    Lê uma instância TSPLIB de ciclo hamiltoniano (.hcp) em streaming.
+
+    Suporta EDGE_DATA_FORMAT EDGE_LIST e ADJ_LIST; vértices são 1-indexados
+    no arquivo e convertidos para 0..n-1.
+
+    Retorna:
+        n, indptr, indices (e report, se return_report=True)
+    Raises:
+        ValueError: se DIMENSION ou EDGE_DATA_SECTION estiverem ausentes
+    """
+    import numpy as np
+    from array import array
+
+    header = {}
+    values = array("q")
+
+    with open_graph_file(path, "rt") as f:
+        in_section = False
+        for line in f:
+            tokens = line.split()
+            if not tokens:
+                continue
+            if tokens[0] == "EOF":
+                break
+            if in_section:
+                values.extend(map(int, tokens))
+                continue
+            if tokens[0].startswith("EDGE_DATA_SECTION"):
+                in_section = True
+                continue
+            key, _, value = line.partition(":")
+            header[key.strip().upper()] = value.strip()
+
+    if "DIMENSION" not in header or not in_section:
+        raise ValueError(f"{path}: arquivo .hcp sem DIMENSION ou EDGE_DATA_SECTION")
+    if header.get("TYPE", "HCP").upper() != "HCP":
+        raise ValueError(f"{path}: TYPE {header['TYPE']} não suportado (esperado HCP)")
+
+    n = int(header["DIMENSION"])
+    values = np.frombuffer(values, dtype=np.int64) if len(values) else np.empty(0, dtype=np.int64)
+    data_format = header.get("EDGE_DATA_FORMAT", "EDGE_LIST").upper()
+
+    if data_format == "EDGE_LIST":
+        # Pares "u v" terminados por -1
+        stop = np.flatnonzero(values == -1)
+        body = values[:stop[0]] if len(stop) else values
+        if body.size % 2:
+            raise ValueError(f"{path}: EDGE_LIST com número ímpar de inteiros")
+        pairs = body.reshape(-1, 2)
+        return _finish_1_indexed(path, n, pairs[:, 0], pairs[:, 1], return_report=return_report)
+
+    if data_format == "ADJ_LIST":
+        # Listas "v a b c -1", seção terminada por um -1 extra
+        ends = np.flatnonzero(values == -1)
+        if not len(ends):
+            raise ValueError(f"{path}: ADJ_LIST sem terminador -1")
+        values = values[:ends[-1] + 1]
+        starts = np.concatenate([[0], ends[:-1] + 1])
+        lengths = ends - starts
+        valid = lengths > 0
+        starts, lengths = starts[valid], lengths[valid]
+
+        u = np.repeat(values[starts], lengths - 1)
+        mask = values != -1
+        mask[starts] = False
+        v = values[mask]
+        return _finish_1_indexed(path, n, u, v, return_report=return_report)
+
+    raise ValueError(f"{path}: EDGE_DATA_FORMAT {data_format} não suportado")
+
+
+def load_graph_dimacs(path, return_report=False):
+    """
+    Lê um grafo no formato DIMACS (`p edge n m` / `e u v`) em streaming.
+
+    Linhas de comentário (`c`) são ignoradas; vértices são 1-indexados no
+    arquivo e convertidos para 0..n-1. Arestas listadas nos dois sentidos
+    são unificadas pela normalização.
+
+    Retorna:
+        n, indptr, indices (e report, se return_report=True)
+    Raises:
+        ValueError: se a linha `p` estiver ausente ou malformada
+    """
+    from array import array
+
+    n = m = None
+    u = array("q")
+    v = array("q")
+
+    with open_graph_file(path, "rt") as f:
+        for line in f:
+            if line.startswith("e"):
+                _, a, b = line.split()[:3]
+                u.append(int(a))
+                v.append(int(b))
+            elif line.startswith("p"):
+                tokens = line.split()
+                if len(tokens) < 4:
+                    raise ValueError(f"{path}: linha 'p' inválida: {line.strip()}")
+                n, m = int(tokens[2]), int(tokens[3])
+
+    if n is None:
+        raise ValueError(f"{path}: linha 'p edge n m' ausente")
+
+    return _finish_1_indexed(path, n, u, v, header_m=m, return_report=return_report)
+
+
+def detect_graph_format(path):
+    """
+    Identifica o formato de um arquivo de grafo (comprimido ou não).
+
+    Retorna:
+        "hpg", "hcp", "dimacs" ou "edgelist"
+    """
+    if is_binary_graph(path):
+        return "hpg"
+
+    with open_graph_file(path, "rt") as f:
+        for line in f:
+            tokens = line.split()
+            if not tokens:
+                continue
+            first = tokens[0].rstrip(":").upper()
+            if tokens[0] in ("c", "p"):
+                return "dimacs"
+            if first in TSPLIB_KEYWORDS or ":" in line:
+                return "hcp"
+            return "edgelist"
+    return "edgelist"
+
+
+def load_graph_auto(path, return_report=False):
+    """
+    Carrega um grafo em CSR detectando o formato automaticamente.
+
+    Arquivos .hpg são mapeados em memória; .hcp e DIMACS usam os leitores
+    dedicados; os demais usam `load_graph_fast`.
+
+    Retorna:
+        n, indptr, indices (e report, se return_report=True; None para .hpg)
+    """
+    fmt = detect_graph_format(path)
+    if fmt == "hpg":
+        n, indptr, indices = load_graph_binary(path)
+        return (n, indptr, indices, None) if return_report else (n, indptr, indices)
+    if fmt == "hcp":
+        return load_graph_hcp(path, return_report=return_report)
+    if fmt == "dimacs":
+        return load_graph_dimacs(path, return_report=return_report)
+    return load_graph_fast(path, return_report=return_report)
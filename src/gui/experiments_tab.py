@@ -6,13 +6,14 @@ Permite configurar e executar experimentos sistemáticos.
 
 import sys
 import os
+import random
 from typing import Optional, List, Dict
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QComboBox, QSpinBox, QPushButton, QTextEdit,
     QGroupBox, QTableWidget, QTableWidgetItem,
     QSplitter, QTabWidget, QFileDialog, QProgressBar,
-    QMessageBox
+    QMessageBox, QCheckBox
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 import time
@@ -25,51 +26,65 @@ if PROJECT_ROOT not in sys.path:
 
 from src.gui.graph_canvas import GraphCanvas
 from src.experiments.experiment_runner import ExperimentRunner
+from src.experiments.result_sink import ResultSink
+from src.algorithms.progress import format_progress
 
 
 class ExperimentWorker(QThread):
     """Worker thread para executar experimentos sem travar a GUI."""
     
     progress = pyqtSignal(str)  # mensagem de progresso
+    telemetry = pyqtSignal(dict)  # progresso dos métodos durante a busca
     finished = pyqtSignal(dict)  # resultado final
     error = pyqtSignal(str)  # erro
     
-    def __init__(self, runner: ExperimentRunner, n: int, density: str, reps: int):
+    def __init__(self, runner: ExperimentRunner, n: int, density: str, reps: int,
+                 live_telemetry: bool = False):
         super().__init__()
         self.runner = runner
         self.n = n
         self.density = density
         self.reps = reps
+        self.live_telemetry = live_telemetry
     
     def run(self):
         """Executa experimento em thread separada."""
         try:
             self.progress.emit(f"Iniciando experimento: n={self.n}, densidade={self.density}, repetições={self.reps}")
+            if self.live_telemetry:
+                self.runner.telemetry = self.telemetry.emit
             result = self.runner.run_single_experiment(self.n, self.density, self.reps)
             self.finished.emit(result)
         except Exception as e:
             self.error.emit(str(e))
+        finally:
+            self.runner.telemetry = None
 
 
 class BatchExperimentWorker(QThread):
     """Worker para batch de experimentos."""
     
     progress = pyqtSignal(str, int, int)  # mensagem, atual, total
+    telemetry = pyqtSignal(dict)  # progresso dos métodos durante a busca
     finished = pyqtSignal(list)  # resultados
     error = pyqtSignal(str)
     
-    def __init__(self, runner: ExperimentRunner, sizes: List[int], densities: List[str], reps: int):
+    def __init__(self, runner: ExperimentRunner, sizes: List[int], densities: List[str], reps: int,
+                 live_telemetry: bool = False):
         super().__init__()
         self.runner = runner
         self.sizes = sizes
         self.densities = densities
         self.reps = reps
+        self.live_telemetry = live_telemetry
     
     def run(self):
         """Executa batch de experimentos."""
         try:
             total = len(self.sizes) * len(self.densities)
             current = 0
+            if self.live_telemetry:
+                self.runner.telemetry = self.telemetry.emit
             
             for n in self.sizes:
                 for density in self.densities:
@@ -84,6 +99,8 @@ class BatchExperimentWorker(QThread):
             self.finished.emit(self.runner.results)
         except Exception as e:
             self.error.emit(str(e))
+        finally:
+            self.runner.telemetry = None
 
 
 class ExperimentsTab(QWidget):
@@ -93,7 +110,8 @@ class ExperimentsTab(QWidget):
         super().__init__(parent)
         
         # Estado
-        self.experiment_runner = ExperimentRunner()
+        # Sinais de timeout não funcionam na QThread: isolar cada medição
+        self.experiment_runner = ExperimentRunner(isolation='subprocess')
         self.current_result: Optional[Dict] = None
         self.current_graph_n = 0
         self.current_graph_edges = []
@@ -189,6 +207,16 @@ class ExperimentsTab(QWidget):
         self.progress_bar.setVisible(False)
         batch_layout.addWidget(self.progress_bar)
         
+        # Telemetria da busca em andamento (nós/s, profundidade, melhor caminho);
+        # desligada por padrão: o backtracking passa a rodar instrumentado
+        self.check_telemetry = QCheckBox("Telemetria ao vivo (deixa o backtracking mais lento)")
+        self.check_telemetry.setChecked(False)
+        batch_layout.addWidget(self.check_telemetry)
+        
+        self.label_telemetry = QLabel("")
+        self.label_telemetry.setWordWrap(True)
+        batch_layout.addWidget(self.label_telemetry)
+        
         group_batch.setLayout(batch_layout)
         layout.addWidget(group_batch)
         
@@ -201,6 +229,14 @@ class ExperimentsTab(QWidget):
         self.btn_export_csv.setEnabled(False)
         export_layout.addWidget(self.btn_export_csv)
         
+        # Gravação contínua: cada execução vai para o arquivo ao terminar
+        self.btn_stream = QPushButton("Gravar Continuamente...")
+        self.btn_stream.clicked.connect(self.on_select_stream_file)
+        export_layout.addWidget(self.btn_stream)
+        self.label_stream = QLabel("Gravação contínua: desativada")
+        self.label_stream.setWordWrap(True)
+        export_layout.addWidget(self.label_stream)
+        
         self.btn_clear = QPushButton("Limpar Resultados")
         self.btn_clear.clicked.connect(self.on_clear_results)
         export_layout.addWidget(self.btn_clear)
@@ -264,18 +300,31 @@ class ExperimentsTab(QWidget):
     # EXECUÇÃO DE EXPERIMENTOS
     # ================================================================
     
+    def _new_seed(self) -> int:
+        """
+        Sorteia a semente base da próxima execução.
+
+        O runner é único na aba; sem uma semente nova, repetir a mesma
+        (n, densidade) regeneraria exatamente os mesmos grafos.
+        """
+        self.experiment_runner.seed = random.getrandbits(63)
+        return self.experiment_runner.seed
+    
     def on_run_single_experiment(self):
         """Executa experimento individual."""
         n = self.spin_n.value()
         density = self.combo_density.currentText()
         reps = self.spin_reps.value()
+        seed = self._new_seed()
         
-        self.log(f"Iniciando experimento: n={n}, densidade={density}, reps={reps}")
+        self.log(f"Iniciando experimento: n={n}, densidade={density}, reps={reps}, semente={seed}")
         self.btn_run_single.setEnabled(False)
         
         # Criar worker
-        self.worker = ExperimentWorker(self.experiment_runner, n, density, reps)
+        self.worker = ExperimentWorker(self.experiment_runner, n, density, reps,
+                                       live_telemetry=self.check_telemetry.isChecked())
         self.worker.progress.connect(self.log)
+        self.worker.telemetry.connect(self.on_telemetry)
         self.worker.finished.connect(self.on_experiment_finished)
         self.worker.error.connect(self.on_experiment_error)
         self.worker.start()
@@ -285,16 +334,19 @@ class ExperimentsTab(QWidget):
         sizes = [10, 20, 30, 40, 50]
         densities = ['sparse', 'medium', 'dense']
         reps = self.spin_batch_reps.value()
+        seed = self._new_seed()
         
-        self.log(f"Iniciando batch: tamanhos={sizes}, densidades={densities}, reps={reps}")
+        self.log(f"Iniciando batch: tamanhos={sizes}, densidades={densities}, reps={reps}, semente={seed}")
         self.btn_run_batch.setEnabled(False)
         self.btn_run_single.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setMaximum(len(sizes) * len(densities))
         
         # Criar worker
-        self.worker = BatchExperimentWorker(self.experiment_runner, sizes, densities, reps)
+        self.worker = BatchExperimentWorker(self.experiment_runner, sizes, densities, reps,
+                                            live_telemetry=self.check_telemetry.isChecked())
         self.worker.progress.connect(self.on_batch_progress)
+        self.worker.telemetry.connect(self.on_telemetry)
         self.worker.finished.connect(self.on_batch_finished)
         self.worker.error.connect(self.on_experiment_error)
         self.worker.start()
@@ -302,6 +354,7 @@ class ExperimentsTab(QWidget):
     def on_experiment_finished(self, result: Dict):
         """Callback quando experimento individual termina."""
         self.current_result = result
+        self.label_telemetry.setText("")
         self.log("Experimento concluído!")
         self.btn_run_single.setEnabled(True)
         
@@ -321,8 +374,15 @@ class ExperimentsTab(QWidget):
         self.log(message)
         self.progress_bar.setValue(current)
     
+    def on_telemetry(self, info: Dict):
+        """Mostra o relatório de progresso mais recente do método em execução."""
+        self.label_telemetry.setText(
+            f"n={info['n']}, {info['density']}, run {info['run_id']}: {format_progress(info)}"
+        )
+    
     def on_batch_finished(self, results: List[Dict]):
         """Callback quando batch termina."""
+        self.label_telemetry.setText("")
         self.log(f"Batch concluído! {len(results)} experimentos executados.")
         self.btn_run_batch.setEnabled(True)
         self.btn_run_single.setEnabled(True)
@@ -334,6 +394,7 @@ class ExperimentsTab(QWidget):
     
     def on_experiment_error(self, error_msg: str):
         """Callback para erros."""
+        self.label_telemetry.setText("")
         self.log(f"ERRO: {error_msg}")
         self.btn_run_single.setEnabled(True)
         self.btn_run_batch.setEnabled(True)
@@ -373,8 +434,7 @@ class ExperimentsTab(QWidget):
             self.results_table.setItem(i, 6, QTableWidgetItem(f"{stats['h_success_rate']:.2%}"))
             
             # Número médio de arestas
-            avg_edges = sum(r['num_edges'] for r in result['runs']) / len(result['runs'])
-            self.results_table.setItem(i, 7, QTableWidgetItem(f"{avg_edges:.1f}"))
+            self.results_table.setItem(i, 7, QTableWidgetItem(f"{stats.get('avg_edges', 0):.1f}"))
         
         self.results_table.resizeColumnsToContents()
     
@@ -404,6 +464,33 @@ class ExperimentsTab(QWidget):
                 self.log(f"Erro ao exportar: {e}")
                 QMessageBox.critical(self, "Erro", f"Erro ao exportar:\n{e}")
     
+    def on_select_stream_file(self):
+        """Escolhe o arquivo (CSV ou JSONL) que recebe cada execução ao terminar."""
+        if self.worker is not None and self.worker.isRunning():
+            QMessageBox.warning(self, "Aviso", "Aguarde o experimento em andamento terminar.")
+            return
+        
+        filepath, _ = QFileDialog.getSaveFileName(
+            self,
+            "Gravar resultados continuamente",
+            "experiment_results.csv",
+            "CSV Files (*.csv);;JSON Lines (*.jsonl)"
+        )
+        if not filepath:
+            return
+        
+        try:
+            sink = ResultSink(filepath, append=True)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Erro", f"Erro ao abrir arquivo:\n{e}")
+            return
+        
+        if self.experiment_runner.sink is not None:
+            self.experiment_runner.sink.close()
+        self.experiment_runner.sink = sink
+        self.label_stream.setText(f"Gravação contínua: {filepath}")
+        self.log(f"Execuções serão gravadas em: {filepath}")
+    
     def on_clear_results(self):
         """Limpa todos os resultados."""
         reply = QMessageBox.question(
@@ -414,7 +501,7 @@ class ExperimentsTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.experiment_runner.results.clear()
+            self.experiment_runner.clear_results()
             self.results_table.setRowCount(0)
             self.summary_text.clear()
             self.log_output.clear()
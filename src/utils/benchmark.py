@@ -0,0 +1,211 @@
+# src/utils/benchmark.py
+"""
+Micro-benchmark de funções (no espírito de `timeit`/`pyperf`).
+
+Cada amostra executa a função `loops` vezes seguidas e registra o tempo
+médio por chamada; `loops` é calibrado automaticamente (1, 2, 5, 10, 20,
+...) até uma amostra durar ao menos `min_time`, de modo que funções de
+microssegundos não fiquem abaixo da resolução do relógio. Amostras de
+aquecimento são descartadas e o GC fica desligado durante as medições.
+
+O resumo traz mínimo, mediana, quartis/IQR e o número de outliers
+(critério de Tukey: fora de [Q1 - 1.5·IQR, Q3 + 1.5·IQR]). Para comparar
+métodos, prefira o mínimo ou a mediana à média.
+"""
+
+import gc
+import time
+from statistics import mean, median, stdev
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# ============================================================================
+# MÉTODOS DISPONÍVEIS
+# ============================================================================
+
+
+def _edges_to_adj(n, edges):
+    adj = [[] for _ in range(n)]
+    for u, v in edges:
+        adj[u].append(v)
+        adj[v].append(u)
+    return adj
+
+
+def _engine_bt(n, edges):
+    from src.algorithms.backtracking import find_hamiltonian_path_bt
+    return find_hamiltonian_path_bt, (n, edges)
+
+
+def _engine_h(n, edges):
+    from src.algorithms.heuristic import heuristic_path
+    return heuristic_path, (n, edges)
+
+
+def _engine_bt_legacy(n, edges):
+    from src.backtracking import hamiltonian_path_backtracking
+    return hamiltonian_path_backtracking, (n, _edges_to_adj(n, edges))
+
+
+def _engine_h_legacy(n, edges):
+    from src.heuristic import heuristic_hamiltonian_path
+    return heuristic_hamiltonian_path, (n, _edges_to_adj(n, edges))
+
+
+# Métodos por nome: (n, arestas) -> (função, argumentos). A preparação
+# (ex.: montar a lista de adjacência) fica fora da região medida.
+ENGINES = {
+    'bt': _engine_bt,
+    'h': _engine_h,
+    'bt-legacy': _engine_bt_legacy,
+    'h-legacy': _engine_h_legacy,
+}
+
+
+def prepare_engine(name: str, n: int, edges: List[Tuple[int, int]]) -> Tuple[Callable, tuple]:
+    """Função e argumentos de um método de ENGINES para o grafo dado."""
+    if name not in ENGINES:
+        raise ValueError(f"Método desconhecido: {name} (disponíveis: {', '.join(ENGINES)})")
+    return ENGINES[name](n, edges)
+
+
+# ============================================================================
+# MEDIÇÃO
+# ============================================================================
+
+
+def _sample(func: Callable, args: tuple, kwargs: dict, loops: int) -> float:
+    """Tempo total (s) de `loops` chamadas seguidas."""
+    timer = time.perf_counter_ns
+    start = timer()
+    for _ in range(loops):
+        func(*args, **kwargs)
+    return (timer() - start) / 1e9
+
+
+def calibrate_loops(func: Callable, args: tuple = (), kwargs: Optional[dict] = None,
+                    min_time: float = 0.05, max_loops: int = 10 ** 7) -> int:
+    """
+    Menor número de chamadas por amostra (sequência 1, 2, 5, 10, 20, 50,
+    ...) cuja duração total atinge `min_time`, como `timeit.Timer.autorange`.
+    """
+    kwargs = kwargs or {}
+    loops = 1
+    while loops < max_loops:
+        for factor in (1, 2, 5):
+            count = loops * factor
+            if _sample(func, args, kwargs, count) >= min_time:
+                return count
+        loops *= 10
+    return max_loops
+
+
+def benchmark(
+    func: Callable,
+    *args,
+    repeat: int = 7,
+    warmup: int = 1,
+    loops: Optional[int] = None,
+    min_time: float = 0.05,
+    time_budget: Optional[float] = None,
+    disable_gc: bool = True,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Mede `func(*args, **kwargs)` em amostras repetidas.
+
+    Args:
+        func: função a medir (deve ser determinística o bastante para ser
+            repetida; o resultado é descartado)
+        repeat: número de amostras registradas
+        warmup: amostras de aquecimento descartadas
+        loops: chamadas por amostra (padrão: calibrado por `min_time`)
+        min_time: duração mínima de uma amostra na calibração (s)
+        time_budget: tempo total máximo (s); ao estourá-lo, param as
+            amostras (ao menos uma é registrada)
+        disable_gc: desligar o GC durante calibração e amostras
+
+    Returns:
+        Dicionário com `samples` (tempo por chamada, s), `loops`, `warmup`
+        e o resumo de `summarize`
+    """
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        started = time.perf_counter()
+        if loops is None:
+            loops = calibrate_loops(func, args, kwargs, min_time)
+
+        for _ in range(warmup):
+            _sample(func, args, kwargs, loops)
+
+        samples = []
+        for _ in range(max(1, repeat)):
+            samples.append(_sample(func, args, kwargs, loops) / loops)
+            if time_budget is not None and time.perf_counter() - started >= time_budget:
+                break
+    finally:
+        if disable_gc and gc_was_enabled:
+            gc.enable()
+
+    return {
+        'samples': samples,
+        'loops': loops,
+        'warmup': warmup,
+        'gc_disabled': disable_gc,
+        **summarize(samples),
+    }
+
+
+def _quantile(ordered: Sequence[float], q: float) -> float:
+    """Quantil com interpolação linear (mesmo critério do numpy.percentile)."""
+    position = (len(ordered) - 1) * q
+    lo = int(position)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (position - lo)
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, Any]:
+    """
+    Resumo robusto de amostras de tempo.
+
+    Returns:
+        min, max, mean, stdev, median, q1, q3, iqr e outliers (Tukey)
+    """
+    if not samples:
+        raise ValueError("Nenhuma amostra para resumir")
+    ordered = sorted(samples)
+    q1, q3 = _quantile(ordered, 0.25), _quantile(ordered, 0.75)
+    iqr = q3 - q1
+    low, high = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    return {
+        'min': ordered[0],
+        'max': ordered[-1],
+        'mean': mean(ordered),
+        'stdev': stdev(ordered) if len(ordered) > 1 else 0.0,
+        'median': median(ordered),
+        'q1': q1,
+        'q3': q3,
+        'iqr': iqr,
+        'outliers': sum(1 for s in ordered if s < low or s > high),
+    }
+
+
+def format_time(seconds: float) -> str:
+    """Tempo com a unidade adequada (ns, µs, ms ou s)."""
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def format_benchmark(result: Dict[str, Any]) -> str:
+    """Linha de resumo: mediana ± IQR, mínimo, amostras e outliers."""
+    return (
+        f"mediana {format_time(result['median'])} "
+        f"(IQR {format_time(result['iqr'])}), "
+        f"mín {format_time(result['min'])}; "
+        f"{len(result['samples'])} amostras x {result['loops']} loops, "
+        f"{result['outliers']} outlier(s)"
+    )
@@ -0,0 +1,267 @@
+# src/utils/graph_families.py
+"""
+Famílias estruturadas de grafos para benchmark (vetorizadas, NumPy).
+
+Cada gerador `*_edges` devolve (n, u, v) com arestas u < v sem duplicatas;
+`edges_to_csr(n, u, v)` (src.graph_io) leva direto para CSR. Os geradores
+com parâmetro de densidade são registrados em `FAMILY_GENERATORS`, usado
+pelo registro `GENERATORS` de src.utils.graph_generator.
+"""
+
+import math
+
+import numpy as np
+
+from src.graph_io import normalize_edges
+
+
+def _canonical(n, u, v):
+    """Canonicaliza (min, max) e remove duplicatas/laços."""
+    u, v, _ = normalize_edges(n, u, v)
+    return u, v
+
+
+# ============================================================================
+# GERADORES
+# ============================================================================
+
+def random_regular_edges(n, d, rng, max_tries=10000):
+    """
+    Grafo d-regular aleatório uniforme pelo modelo de pareamento.
+
+    Os n*d "meios-de-aresta" são embaralhados e pareados; pareamentos com
+    laços ou arestas múltiplas são rejeitados (rejeição exata, uniforme).
+
+    Raises:
+        ValueError: se n*d for ímpar, d >= n ou nenhuma tentativa for simples
+    """
+    if (n * d) % 2 or d >= n:
+        raise ValueError(f"Não existe grafo {d}-regular com {n} vértices")
+
+    stubs = np.repeat(np.arange(n, dtype=np.int64), d)
+    for _ in range(max_tries):
+        pairs = rng.permutation(stubs).reshape(-1, 2)
+        u, v = pairs.min(axis=1), pairs.max(axis=1)
+        if (u == v).any():
+            continue
+        if len(np.unique(u * n + v)) != len(u):
+            continue
+        return n, u, v
+
+    raise ValueError(f"Pareamento {d}-regular simples não encontrado em {max_tries} tentativas")
+
+
+# Deslocamentos (linha, coluna) de cada tipo de tabuleiro; só metade das
+# direções, a outra metade é a mesma aresta no sentido oposto
+LATTICE_MOVES = {
+    'grid': [(0, 1), (1, 0)],
+    'king': [(0, 1), (1, 0), (1, 1), (1, -1)],
+    'knight': [(1, 2), (2, 1), (1, -2), (2, -1)],
+}
+
+
+def lattice_edges(rows, cols, kind='grid'):
+    """
+    Grafo de tabuleiro rows x cols: 'grid' (vizinhos ortogonais),
+    'king' (8 vizinhos) ou 'knight' (saltos de cavalo).
+    """
+    index = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+    us, vs = [], []
+    for dr, dc in LATTICE_MOVES[kind]:
+        if dr >= rows or abs(dc) >= cols:
+            continue
+        c0, c1 = max(0, -dc), cols - max(0, dc)
+        us.append(index[:rows - dr, c0:c1].ravel())
+        vs.append(index[dr:, c0 + dc:c1 + dc].ravel())
+
+    if not us:
+        empty = np.empty(0, dtype=np.int64)
+        return rows * cols, empty, empty.copy()
+    return rows * cols, *_canonical(rows * cols, np.concatenate(us), np.concatenate(vs))
+
+
+def hypercube_edges(d):
+    """Hipercubo Q_d: 2^d vértices, arestas entre rótulos a distância de Hamming 1."""
+    n = 1 << d
+    vertices = np.arange(n, dtype=np.int64)
+    us, vs = [], []
+    for bit in range(d):
+        low = vertices[(vertices >> bit) & 1 == 0]
+        us.append(low)
+        vs.append(low | (1 << bit))
+    if not us:
+        empty = np.empty(0, dtype=np.int64)
+        return n, empty, empty.copy()
+    return n, np.concatenate(us), np.concatenate(vs)
+
+
+def generalized_petersen_edges(k, s):
+    """
+    Grafo de Petersen generalizado GP(k, s): ciclo externo 0..k-1, raios
+    i -- k+i e estrela interna k+i -- k+(i+s) mod k. GP(5, 2) é o Petersen.
+    """
+    if k < 3 or not 1 <= s < k:
+        raise ValueError(f"GP({k}, {s}) inválido")
+    i = np.arange(k, dtype=np.int64)
+    u = np.concatenate([i, i, k + i])
+    v = np.concatenate([(i + 1) % k, k + i, k + (i + s) % k])
+    return 2 * k, *_canonical(2 * k, u, v)
+
+
+def unique_hamiltonian_edges(n, chord_p, rng):
+    """
+    Grafo com ciclo hamiltoniano único: um grafo exoplanar 2-conexo.
+
+    Parte do ciclo 0..n-1 e acrescenta cordas diádicas (a, a + 2^l), com
+    a múltiplo de 2^l, cada uma com probabilidade `chord_p`. Intervalos
+    diádicos são aninhados ou disjuntos, então as cordas não se cruzam; todo
+    grafo exoplanar 2-conexo tem exatamente um ciclo hamiltoniano (a face
+    externa), qualquer que seja o subconjunto de cordas sorteado.
+    """
+    if n < 3:
+        raise ValueError("São necessários ao menos 3 vértices")
+    i = np.arange(n, dtype=np.int64)
+    us, vs = [i], [(i + 1) % n]
+
+    step = 2
+    while step < n:
+        a = np.arange(0, n - step, step, dtype=np.int64)
+        keep = rng.random(len(a)) < chord_p
+        us.append(a[keep])
+        vs.append(a[keep] + step)
+        step *= 2
+
+    return n, *_canonical(n, np.concatenate(us), np.concatenate(vs))
+
+
+# ============================================================================
+# PARAMETRIZAÇÃO POR DENSIDADE / TAMANHO
+# ============================================================================
+
+# Grau do grafo regular por rótulo de densidade (rejeição do pareamento
+# custa ~exp((d^2 - 1) / 4) tentativas, por isso d <= 5)
+REGULAR_DEGREE = {'sparse': 3, 'medium': 4, 'dense': 5}
+
+# Fração de arestas mantidas nos reticulados/hipercubo (percolação);
+# 'dense' mantém o grafo completo, cuja resposta é conhecida
+LATTICE_KEEP = {'sparse': 0.8, 'medium': 0.9, 'dense': 1.0}
+
+# Salto s da estrela interna do Petersen generalizado
+PETERSEN_STEP = {'sparse': 1, 'medium': 2, 'dense': 3}
+
+# Probabilidade das cordas da família de ciclo hamiltoniano único
+UNIQUE_CHORD_P = {'sparse': 0.3, 'medium': 0.6, 'dense': 0.9}
+
+
+def _relabel(n, u, v, rng):
+    """Aplica uma permutação aleatória aos rótulos (esconde a estrutura da DFS)."""
+    perm = rng.permutation(n)
+    return _canonical(n, perm[u], perm[v])
+
+
+def _percolate(u, v, keep, rng):
+    if keep >= 1.0:
+        return u, v
+    mask = rng.random(len(u)) < keep
+    return u[mask], v[mask]
+
+
+def _regular_instance(n, density, rng):
+    d = REGULAR_DEGREE.get(density, 4)
+    n += (n * d) % 2  # n*d precisa ser par
+    # Com n par, qualquer d <= n - 1 tem paridade válida (n pequeno: completo)
+    d = max(0, min(d, n - 1))
+    n, u, v = random_regular_edges(n, d, rng)
+    return u, v, {"n": n, "degree": d, "probability": d / (n - 1), "known_answer": None}
+
+
+def _lattice_instance(kind):
+    def generate(n, density, rng):
+        rows = max(1, math.isqrt(n))
+        cols = max(1, -(-n // rows))
+        n, u, v = lattice_edges(rows, cols, kind)
+        keep = LATTICE_KEEP.get(density, 1.0)
+        u, v = _percolate(u, v, keep, rng)
+
+        # Tabuleiros completos: caminho por serpentina (grid/king); passeio
+        # aberto do cavalo existe sempre que min(rows, cols) >= 5
+        complete = keep >= 1.0
+        if kind == 'knight':
+            known = True if complete and min(rows, cols) >= 5 else None
+        else:
+            known = True if complete else None
+
+        u, v = _relabel(n, u, v, rng)
+        return u, v, {
+            "n": n, "rows": rows, "cols": cols, "keep": keep,
+            "probability": 2 * len(u) / (n * (n - 1)) if n > 1 else 0,
+            "known_answer": known,
+        }
+    return generate
+
+
+def _hypercube_instance(n, density, rng):
+    d = max(1, round(math.log2(max(n, 2))))
+    n, u, v = hypercube_edges(d)
+    keep = LATTICE_KEEP.get(density, 1.0)
+    u, v = _percolate(u, v, keep, rng)
+    u, v = _relabel(n, u, v, rng)
+    return u, v, {
+        "n": n, "dimension": d, "keep": keep,
+        "probability": 2 * len(u) / (n * (n - 1)),
+        # Q_d completo tem ciclo hamiltoniano (código de Gray)
+        "known_answer": True if keep >= 1.0 else None,
+    }
+
+
+def _petersen_instance(n, density, rng):
+    k = max(3, n // 2)
+    s = min(PETERSEN_STEP.get(density, 2), (k - 1) // 2) or 1
+    n, u, v = generalized_petersen_edges(k, s)
+    u, v = _relabel(n, u, v, rng)
+    return u, v, {
+        "n": n, "k": k, "s": s,
+        "probability": 2 * len(u) / (n * (n - 1)),
+        # GP(k, 1) é um prisma; GP(k, 2) é hamiltoniano ou hipohamiltoniano
+        # (Alspach; Bondy), e em ambos os casos tem caminho hamiltoniano
+        "known_answer": True if s in (1, 2) else None,
+    }
+
+
+def _hypohamiltonian_instance(n, density, rng):
+    # GP(k, 2) com k ≡ 5 (mod 6) é hipohamiltoniano: sem ciclo hamiltoniano,
+    # mas G - v é hamiltoniano para todo v (logo há caminho hamiltoniano).
+    # A densidade não se aplica: a família é rígida.
+    k = max(5, n // 2)
+    k += (5 - k) % 6
+    n, u, v = generalized_petersen_edges(k, 2)
+    u, v = _relabel(n, u, v, rng)
+    return u, v, {
+        "n": n, "k": k, "s": 2,
+        "probability": 2 * len(u) / (n * (n - 1)),
+        "known_answer": True,
+    }
+
+
+def _unique_instance(n, density, rng):
+    chord_p = UNIQUE_CHORD_P.get(density, 0.6)
+    n, u, v = unique_hamiltonian_edges(max(n, 3), chord_p, rng)
+    u, v = _relabel(n, u, v, rng)
+    return u, v, {
+        "n": n, "chord_p": chord_p,
+        "probability": 2 * len(u) / (n * (n - 1)),
+        "known_answer": True,
+    }
+
+
+# Famílias estruturadas: (n, densidade, rng) -> (u, v, info)
+FAMILY_GENERATORS = {
+    'regular': _regular_instance,
+    'grid': _lattice_instance('grid'),
+    'king': _lattice_instance('king'),
+    'knight': _lattice_instance('knight'),
+    'hypercube': _hypercube_instance,
+    'petersen': _petersen_instance,
+    'hypohamiltonian': _hypohamiltonian_instance,
+    'unique': _unique_instance,
+}
@@ -1,22 +1,258 @@
 # src/utils/graph_generator.py
+import math
 import random
 
-def generate_random_graph(n, p):
+import numpy as np
+
+from src.graph_io import open_graph_file, edges_to_csr
+from src.utils.graph_families import FAMILY_GENERATORS
+
+
+def _default_rng(rng=None):
+    """
+    Retorna o gerador NumPy a usar.
+
+    Sem `rng` explícito, deriva um do módulo `random`, de modo que
+    `random.seed(...)` continua tornando a geração reprodutível.
+    """
+    if rng is None:
+        return np.random.default_rng(random.getrandbits(64))
+    return rng
+
+
+def _pairs_from_index(n, k):
+    """
+    Converte índices lineares de pares (u < v), em ordem lexicográfica,
+    de volta para (u, v). Vetorizado.
+    """
+    k = np.asarray(k, dtype=np.int64)
+    b = 2 * n - 1
+    u = np.floor((b - np.sqrt(float(b) * b - 8.0 * k)) / 2).astype(np.int64)
+
+    # Corrigir eventuais erros de arredondamento (no máximo uma posição)
+    def row_start(r):
+        return r * (2 * n - r - 1) // 2
+
+    u -= row_start(u) > k
+    u += row_start(u + 1) <= k
+
+    v = k - row_start(u) + u + 1
+    return u, v
+
+
+def gnp_edges(n, p, rng=None):
+    """
+    Amostra as arestas de G(n, p) em O(n + m) com saltos geométricos
+    (Batagelj–Brandes), em lotes vetorizados.
+
+    Args:
+        n (int): número de vértices
+        p (float): probabilidade de cada aresta
+        rng (np.random.Generator | None): gerador aleatório
+    Retorna:
+        u, v (np.ndarray[int64]): arestas com u < v, em ordem lexicográfica
+    """
+    total = n * (n - 1) // 2
+    if total == 0 or p <= 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy()
+    if p >= 1:
+        return _pairs_from_index(n, np.arange(total, dtype=np.int64))
+
+    rng = _default_rng(rng)
+
+    # Lote ~ média + 5 desvios: quase sempre basta uma iteração
+    expected = total * p
+    batch = int(min(total, expected + 5 * np.sqrt(expected) + 16))
+
+    chunks = []
+    position = -1
+    while True:
+        gaps = rng.geometric(p, size=batch)
+        index = position + np.cumsum(gaps)
+        if index[-1] >= total:
+            chunks.append(index[index < total])
+            break
+        chunks.append(index)
+        position = index[-1]
+
+    return _pairs_from_index(n, np.concatenate(chunks))
+
+
+def gnp_csr(n, p, rng=None):
+    """Gera G(n, p) direto em CSR (indptr, indices)."""
+    u, v = gnp_edges(n, p, rng)
+    return edges_to_csr(n, u, v)
+
+
+def generate_random_graph(n, p, rng=None):
     """
     Gera grafo aleatório de n vértices com probabilidade p de existir aresta.
     p baixo → esparso
     p alto → denso
     """
-    edges = []
-    for i in range(n):
-        for j in range(i+1, n):
-            if random.random() < p:
-                edges.append((i, j))
-    return edges
+    u, v = gnp_edges(n, p, rng)
+    return list(zip(u.tolist(), v.tolist()))
+
+
+# ============================================================================
+# FAMÍLIAS DE INSTÂNCIAS DIFÍCEIS
+# ============================================================================
+
+# Probabilidade de aresta do G(n, p) por rótulo de densidade
+DENSITY_MAP = {
+    'sparse': 0.2,
+    'medium': 0.5,
+    'dense': 0.8,
+}
+
+# Grau médio do ruído somado ao caminho plantado, por rótulo de densidade
+PLANTED_NOISE_DEGREE = {
+    'sparse': 1.0,
+    'medium': 2.0,
+    'dense': 4.0,
+}
+
+# Deslocamento c em p = (ln n + ln ln n + c) / n, por rótulo de densidade.
+# P(hamiltoniano) -> exp(-exp(-c)): ~0.07, ~0.37 e ~0.69.
+THRESHOLD_OFFSET = {
+    'sparse': -1.0,
+    'medium': 0.0,
+    'dense': 1.0,
+}
+
+
+def planted_hamiltonian_edges(n, noise_p, rng=None):
+    """
+    Gera um grafo com caminho hamiltoniano plantado.
+
+    O caminho segue uma permutação aleatória dos vértices (escondendo a
+    solução) e recebe ruído G(n, noise_p) por cima.
+
+    Args:
+        n (int): número de vértices
+        noise_p (float): probabilidade das arestas de ruído
+        rng (np.random.Generator | None): gerador aleatório
+    Retorna:
+        u, v (np.ndarray[int64]): arestas com u < v (sem duplicatas)
+        path (np.ndarray[int64]): o caminho plantado
+    """
+    rng = _default_rng(rng)
+    path = rng.permutation(n)
+
+    noise_u, noise_v = gnp_edges(n, noise_p, rng)
+    u = np.concatenate([path[:-1], noise_u])
+    v = np.concatenate([path[1:], noise_v])
+
+    lo, hi = np.minimum(u, v), np.maximum(u, v)
+    keys = np.unique(lo * n + hi)
+    return keys // n, keys % n, path
+
+
+def threshold_probability(n, c=0.0):
+    """p = (ln n + ln ln n + c) / n, o limiar de hamiltonicidade do G(n, p)."""
+    if n < 3:
+        return 1.0
+    return min(1.0, max(0.0, (math.log(n) + math.log(math.log(n)) + c) / n))
+
+
+def _gnp_instance(n, density, rng):
+    p = DENSITY_MAP.get(density, 0.5)
+    u, v = gnp_edges(n, p, rng)
+    return u, v, {"probability": p, "known_answer": None}
+
+
+def _planted_instance(n, density, rng):
+    noise_p = min(1.0, PLANTED_NOISE_DEGREE.get(density, 2.0) / max(n - 1, 1))
+    u, v, path = planted_hamiltonian_edges(n, noise_p, rng)
+    return u, v, {
+        "probability": noise_p,
+        "known_answer": n > 0,
+        "planted_path": path.tolist(),
+    }
+
+
+def _threshold_instance(n, density, rng):
+    p = threshold_probability(n, THRESHOLD_OFFSET.get(density, 0.0))
+    u, v = gnp_edges(n, p, rng)
+    return u, v, {"probability": p, "known_answer": None}
+
+
+# Geradores selecionáveis por nome: (n, densidade, rng) -> (u, v, info)
+GENERATORS = {
+    'gnp': _gnp_instance,
+    'planted': _planted_instance,
+    'threshold': _threshold_instance,
+    **FAMILY_GENERATORS,
+}
+
+
+def generate_instance(name, n, density, rng=None):
+    """
+    Gera uma instância de uma família registrada em GENERATORS.
+
+    Args:
+        name (str): nome do gerador ('gnp', 'planted', 'threshold', ...)
+        n (int): número de vértices
+        density (str): rótulo de densidade ('sparse', 'medium', 'dense')
+        rng (np.random.Generator | None): gerador aleatório
+    Retorna:
+        n (int): número de vértices efetivo
+        edges (list[tuple[int, int]]): lista de arestas
+        info (dict): probabilidade/parâmetros e resposta conhecida (`known_answer`)
+    """
+    if name not in GENERATORS:
+        raise ValueError(f"Gerador desconhecido: {name} (disponíveis: {', '.join(GENERATORS)})")
+
+    u, v, info = GENERATORS[name](n, density, _default_rng(rng))
+    info.setdefault("n", n)
+    return info["n"], list(zip(u.tolist(), v.tolist())), info
+
+
+# ============================================================================
+# VARREDURAS ACOPLADAS DE DENSIDADE
+# ============================================================================
+
+# Famílias G(n, p) cuja probabilidade depende só de (n, densidade) e que
+# portanto admitem acoplamento monótono entre densidades
+COUPLED_GENERATORS = ('gnp', 'threshold')
+
+
+def edge_probability(name, n, density):
+    """Probabilidade de aresta de uma família acoplável para (n, densidade)."""
+    if name == 'gnp':
+        return DENSITY_MAP.get(density, 0.5)
+    if name == 'threshold':
+        return threshold_probability(n, THRESHOLD_OFFSET.get(density, 0.0))
+    raise ValueError(f"Gerador {name} não admite varredura acoplada "
+                     f"(use: {', '.join(COUPLED_GENERATORS)})")
+
+
+def coupled_gnp_edges(n, probabilities, rng=None):
+    """
+    Gera G(n, p) acoplados para várias probabilidades.
+
+    Sorteia um único uniforme U por par de vértices e, para cada p, mantém
+    as arestas com U < p. Os grafos são encaixados: G(n, p) ⊆ G(n, p') para
+    p <= p', logo um caminho hamiltoniano achado em p vale em todo p' > p.
+
+    Args:
+        n (int): número de vértices
+        probabilities (list[float]): probabilidades (qualquer ordem)
+        rng (np.random.Generator | None): gerador aleatório
+    Yields:
+        (p, u, v) em ordem crescente de p
+    """
+    rng = _default_rng(rng)
+    total = n * (n - 1) // 2
+    uniforms = rng.random(total, dtype=np.float32)
+
+    for p in sorted(probabilities):
+        yield (p, *_pairs_from_index(n, np.flatnonzero(uniforms < p)))
 
 
 def save_graph(path, n, edges):
-    with open(path, "w") as f:
+    with open_graph_file(path, "wt") as f:
         f.write(f"{n} {len(edges)}\n")
         for u, v in edges:
             f.write(f"{u} {v}\n")
@@ -0,0 +1,399 @@
+# src/utils/metrics.py
+"""
+Métricas de batches longos no formato de exposição texto do Prometheus.
+
+Duas formas de publicação (podem ser usadas juntas):
+    arquivo  reescrito atomicamente (arquivo temporário + os.replace) a cada
+             `interval` segundos; aponte o textfile collector do
+             node_exporter para o diretório (o arquivo deve terminar em .prom)
+    HTTP     endpoint local `http://127.0.0.1:<porta>/metrics` para o
+             Prometheus raspar diretamente
+
+Uso:
+    metrics = RunnerMetrics()
+    with MetricsExporter(metrics.registry, path="/var/lib/node_exporter/hp.prom"):
+        runner = ExperimentRunner(sink=metrics)
+        runner.run_batch_experiments(...)
+
+RunnerMetrics tem a interface de um sink (write/close), então recebe cada
+execução concluída como ResultSink e ResultsDB (combine-os com TeeSink).
+"""
+
+import math
+import os
+import tempfile
+import threading
+import time
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import psutil
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Limites (s) do histograma de tempo de resolução: de 100 µs a 10 min
+SOLVE_TIME_BUCKETS = (0.0001, 0.001, 0.01, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 600)
+
+# ============================================================================
+# TIPOS DE MÉTRICA
+# ============================================================================
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Base: nome, ajuda, nomes de rótulos e valores por combinação de rótulos."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (), lock=None):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._lock = lock or threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name}: rótulos esperados {self.label_names}, recebidos {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _samples(self) -> Iterable[Tuple[str, str, float]]:
+        for key, value in sorted(self._values.items()):
+            yield self.name, _format_labels(self.label_names, key), value
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {_escape(self.help)}", f"# TYPE {self.name} {self.kind}"]
+        lines += [f"{name}{labels} {_format_value(value)}" for name, labels, value in self._samples()]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """Contador monotônico."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        if amount < 0:
+            raise ValueError(f"{self.name}: contador não pode diminuir ({amount})")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """Valor instantâneo; com `set_function`, calculado no momento da coleta."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (), lock=None):
+        super().__init__(name, help_text, labels, lock)
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_function(self, function: Callable[[], float]):
+        """Valor calculado a cada coleta (só para gauges sem rótulos)."""
+        if self.label_names:
+            raise ValueError(f"{self.name}: set_function exige gauge sem rótulos")
+        self._function = function
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self):
+        if self._function is not None:
+            yield self.name, "", self._function()
+        else:
+            yield from super()._samples()
+
+
+class Histogram(_Metric):
+    """Histograma com limites fixos (`le` cumulativo, `_sum` e `_count`)."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = SOLVE_TIME_BUCKETS, lock=None):
+        super().__init__(name, help_text, labels, lock)
+        if "le" in self.label_names:
+            raise ValueError(f"{self.name}: 'le' é reservado para os limites")
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def _samples(self):
+        for key, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket", _format_labels(self.label_names, key, le), cumulative
+            labels = _format_labels(self.label_names, key)
+            yield f"{self.name}_sum", labels, self._sums[key]
+            yield f"{self.name}_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """Conjunto de métricas renderizado como um documento de exposição."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Métrica já registrada: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labels, self._lock))
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labels, self._lock))
+
+    def histogram(self, name: str, help_text: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = SOLVE_TIME_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets, self._lock))
+
+    def render(self) -> str:
+        with self._lock:
+            return "".join(metric.render() for metric in self._metrics.values())
+
+
+# ============================================================================
+# MÉTRICAS DO RUNNER
+# ============================================================================
+
+
+class RunnerMetrics:
+    """
+    Métricas de um ExperimentRunner, alimentadas como sink (`write`) e,
+    opcionalmente, pela telemetria dos métodos (`telemetry`).
+
+    Métricas (prefixo `hamiltonian_`):
+        runs_total{density}                         repetições concluídas
+        solver_runs_total{engine,density,outcome}   found, not_found, timeout,
+                                                    oom, error, skipped, reused
+        solve_seconds{engine,density}               histograma dos tempos medidos
+        nodes_per_second{engine}                    taxa da busca (telemetria ao
+                                                    vivo ou passos/tempo da última
+                                                    execução)
+        process_resident_memory_bytes               RSS do processo do runner
+        last_run_timestamp_seconds                  fim da última execução (para
+                                                    alertar sobre batches parados)
+    """
+
+    SOLVERS = ('bt', 'h')
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, prefix: str = "hamiltonian"):
+        self.registry = registry or MetricsRegistry()
+        self.count = 0
+        r = self.registry
+        self.runs = r.counter(f"{prefix}_runs_total", "Repetições concluídas.", ("density",))
+        self.solver_runs = r.counter(
+            f"{prefix}_solver_runs_total", "Execuções por método e desfecho.", ("engine", "density", "outcome")
+        )
+        self.solve_seconds = r.histogram(
+            f"{prefix}_solve_seconds", "Tempo medido de resolução (s).", ("engine", "density")
+        )
+        self.nodes_per_second = r.gauge(
+            f"{prefix}_nodes_per_second", "Nós expandidos por segundo na busca mais recente.", ("engine",)
+        )
+        self.rss = r.gauge(f"{prefix}_process_resident_memory_bytes", "Memória residente do processo do runner.")
+        process = psutil.Process(os.getpid())
+        self.rss.set_function(lambda: process.memory_info().rss)
+        self.last_run = r.gauge(f"{prefix}_last_run_timestamp_seconds", "Horário (Unix) da última execução concluída.")
+        self.last_run.set(0)
+
+    @staticmethod
+    def _outcome(run: Dict, solver: str) -> str:
+        if run.get(f"{solver}_skipped"):
+            return "skipped"
+        if solver == "bt" and run.get("bt_reused"):
+            return "reused"
+        for flag in ("timeout", "oom", "error"):
+            if run.get(f"{solver}_{flag}"):
+                return flag
+        return "found" if run.get(f"{solver}_success") else "not_found"
+
+    def write(self, result: Dict, run: Dict):
+        """Registra uma execução concluída (interface de sink)."""
+        density = result.get("density", "")
+        self.runs.inc(density=density)
+        for solver in self.SOLVERS:
+            outcome = self._outcome(run, solver)
+            self.solver_runs.inc(engine=solver, density=density, outcome=outcome)
+            if outcome in ("found", "not_found", "error"):
+                self.solve_seconds.observe(run.get(f"{solver}_time", 0.0), engine=solver, density=density)
+        if self._outcome(run, "bt") in ("found", "not_found") and run.get("bt_time", 0) > 0:
+            self.nodes_per_second.set(run.get("bt_steps", 0) / run["bt_time"], engine="bt")
+        self.last_run.set(time.time())
+        self.count += 1
+
+    def telemetry(self, info: Dict):
+        """Callback de progresso (ver src/algorithms/progress.py): taxa ao vivo."""
+        self.nodes_per_second.set(info["nodes_per_second"], engine=info["solver"])
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+# ============================================================================
+# PUBLICAÇÃO
+# ============================================================================
+
+
+def write_textfile(registry: MetricsRegistry, path: str):
+    """Grava a exposição de forma atômica (o coletor nunca lê um arquivo pela metade)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".metrics-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(registry.render())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _handler_for(registry: MetricsRegistry):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return MetricsHandler
+
+
+class MetricsExporter:
+    """
+    Publica um MetricsRegistry em arquivo (a cada `interval` s) e/ou HTTP.
+
+    As duas publicações rodam em threads daemon; `close` para ambas e faz
+    uma última gravação do arquivo, com os valores finais do batch.
+    """
+
+    def __init__(self, registry: MetricsRegistry, path: Optional[str] = None, port: Optional[int] = None,
+                 interval: float = 5.0, host: str = "127.0.0.1"):
+        """
+        Args:
+            registry: métricas a publicar
+            path: arquivo de saída (textfile collector: extensão .prom)
+            port: porta do endpoint HTTP (0 = escolhida pelo sistema)
+            interval: período de regravação do arquivo (s)
+            host: interface do endpoint HTTP (padrão: só local)
+        """
+        if path is None and port is None:
+            raise ValueError("Informe um arquivo e/ou uma porta para as métricas")
+        if interval <= 0:
+            raise ValueError(f"Intervalo inválido: {interval}")
+        if path is not None and not path.endswith(".prom"):
+            warnings.warn(f"O textfile collector do node_exporter só lê arquivos .prom: {path}")
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self.server: Optional[ThreadingHTTPServer] = None
+
+        if path is not None:
+            write_textfile(registry, path)
+            self._spawn(self._write_loop, "metrics-textfile")
+        if port is not None:
+            self.server = ThreadingHTTPServer((host, port), _handler_for(registry))
+            self.server.daemon_threads = True
+            self._spawn(self.server.serve_forever, "metrics-http")
+
+    @property
+    def url(self) -> Optional[str]:
+        if self.server is None:
+            return None
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def _spawn(self, target, name):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _write_loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                write_textfile(self.registry, self.path)
+            except OSError as e:
+                warnings.warn(f"Falha ao gravar métricas em {self.path}: {e}")
+
+    def close(self):
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        for thread in self._threads:
+            thread.join()
+        if self.path is not None:
+            write_textfile(self.registry, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -3,13 +3,22 @@ Módulo de monitoramento de performance e memória.
 Fornece ferramentas para medir consumo de memória e gerar relatórios detalhados.
 """
 
+import gc
 import time
 import tracemalloc
 import psutil
 import os
+import threading
+import multiprocessing
 from typing import Dict, Optional, Callable, Any, Tuple
 from functools import wraps
 import signal
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 
 class TimeoutError(Exception):
@@ -22,28 +31,33 @@ def timeout_handler(signum, frame):
     raise TimeoutError("Função excedeu o tempo limite")
 
 
-def with_timeout(seconds: int):
+def with_timeout(seconds: float):
     """
     Decorator para adicionar timeout a uma função.
     
+    Usa `signal.setitimer` (precisão sub-segundo). Sinais só podem ser
+    tratados na thread principal; fora dela a função roda sem timeout
+    (use `PerformanceMonitor(isolation='subprocess')` nesse caso).
+    
     Args:
         seconds: tempo limite em segundos
     """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Configurar signal alarm (apenas Linux/Unix)
-            if os.name != 'nt':  # Não é Windows
+            # Configurar timer de sinal (apenas Linux/Unix, thread principal)
+            if os.name != 'nt' and threading.current_thread() is threading.main_thread():
                 old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(seconds)
+                signal.setitimer(signal.ITIMER_REAL, seconds)
                 try:
                     result = func(*args, **kwargs)
-                    signal.alarm(0)  # Cancelar alarme
+                    signal.setitimer(signal.ITIMER_REAL, 0)  # Cancelar alarme
                     return result
                 except TimeoutError:
-                    signal.alarm(0)
+                    signal.setitimer(signal.ITIMER_REAL, 0)
                     raise
                 finally:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
                     signal.signal(signal.SIGALRM, old_handler)
             else:
                 # No Windows, executar sem timeout
@@ -52,55 +66,381 @@ def with_timeout(seconds: int):
     return decorator
 
 
+def _max_rss_mb() -> float:
+    """Pico de RSS do processo atual (ru_maxrss), em MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta em KB, macOS em bytes
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
 class MemoryMonitor:
-    """Monitora consumo de memória de uma operação."""
+    """
+    Mede o pico de memória de uma operação acima de uma linha de base.
+    
+    Fontes:
+        'tracemalloc'  pico das alocações Python desde a entrada (com
+                       `reset_peak`), independente do que o processo já
+                       alocou antes
+        'rusage'       crescimento do ru_maxrss do processo; só é confiável
+                       num processo novo (filho dedicado à medição), pois o
+                       ru_maxrss é a marca máxima de toda a vida do processo
     
-    def __init__(self):
+    A linha de base (RSS do interpretador na entrada) é reportada à parte
+    em `start_mb`; `peak_mb` é sempre relativo a ela, nunca negativo. Só a
+    fonte 'rusage' dá também o pico absoluto de RSS (`peak_rss_mb`): o pico
+    do tracemalloc conta só o heap Python e não se soma ao RSS.
+    """
+    
+    SOURCES = ('tracemalloc', 'rusage')
+    
+    def __init__(self, source: str = 'tracemalloc'):
+        if source not in self.SOURCES:
+            raise ValueError(f"Fonte inválida: {source} (use: {', '.join(self.SOURCES)})")
+        if source == 'rusage' and resource is None:
+            raise ValueError("Fonte 'rusage' indisponível nesta plataforma")
+        self.source = source
         self.process = psutil.Process(os.getpid())
         self.start_memory = 0
         self.peak_memory = 0
         self.end_memory = 0
+        self._was_tracing = False
+        self._start_traced = 0
+        self._start_max_rss = 0.0
+        self.peak_rss = None
         
     def __enter__(self):
         """Inicia monitoramento ao entrar no contexto."""
-        tracemalloc.start()
         self.start_memory = self.process.memory_info().rss / 1024 / 1024  # MB
+        if self.source == 'rusage':
+            self._start_max_rss = _max_rss_mb()
+        else:
+            self._was_tracing = tracemalloc.is_tracing()
+            if not self._was_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._start_traced = tracemalloc.get_traced_memory()[0]
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Finaliza monitoramento ao sair do contexto."""
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        if self.source == 'rusage':
+            self.peak_rss = _max_rss_mb()
+            self.peak_memory = max(0.0, self.peak_rss - self._start_max_rss)
+        else:
+            _, peak = tracemalloc.get_traced_memory()
+            if not self._was_tracing:
+                tracemalloc.stop()
+            self.peak_memory = max(0, peak - self._start_traced) / 1024 / 1024  # MB
         
         self.end_memory = self.process.memory_info().rss / 1024 / 1024  # MB
-        self.peak_memory = peak / 1024 / 1024  # MB
         
     def get_stats(self) -> Dict[str, float]:
         """
         Retorna estatísticas de memória.
         
         Returns:
-            Dicionário com uso de memória (em MB)
+            Dicionário com uso de memória (em MB): linha de base (`start_mb`),
+            pico acima dela (`peak_mb`), RSS final, a diferença de RSS
+            (`delta_mb`, sujeita ao ruído do alocador) e o pico absoluto de
+            RSS (`peak_rss_mb`; None com a fonte 'tracemalloc')
         """
         return {
             'start_mb': self.start_memory,
             'end_mb': self.end_memory,
             'peak_mb': self.peak_memory,
-            'delta_mb': self.end_memory - self.start_memory
+            'delta_mb': self.end_memory - self.start_memory,
+            'peak_rss_mb': self.peak_rss,
+            'source': self.source
         }
 
 
+# ============================================================================
+# EXECUÇÃO ISOLADA EM SUBPROCESSO
+# ============================================================================
+
+# Tempo concedido ao filho para encerrar após SIGTERM antes do SIGKILL
+SUBPROCESS_GRACE_SECONDS = 0.5
+
+# Argumento nomeado de saída da função medida: um dicionário que ela
+# preenche mesmo quando é interrompida (ex.: `stats` de
+# find_hamiltonian_path_bt). O monitor o devolve do processo filho e não o
+# deixa ser sobrescrito pela passada de memória.
+OUTPUT_KWARG = 'stats'
+
+# Código de saída do filho que ficou sem memória até para devolver o
+# resultado pelo pipe (o pai o distingue de outras mortes)
+OOM_EXIT_CODE = 75
+
+
+def _subprocess_context():
+    """
+    Contexto multiprocessing dos filhos de medição.
+
+    fork não é seguro num processo com threads (ex.: QThread da GUI): no
+    Linux usa-se forkserver (filhos derivados de um servidor sem threads);
+    nas demais plataformas, o padrão (spawn no macOS e no Windows). Em
+    ambos a função medida e seus argumentos precisam ser serializáveis
+    (funções de módulo, não lambdas).
+
+    O servidor pré-carrega os módulos do projeto já importados pelo pai
+    (e, com eles, NumPy etc.): cada filho reexecuta o script principal,
+    e sem isso pagaria todas as importações a cada medição.
+    """
+    if sys.platform.startswith("linux") and "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        package = __name__.split(".")[0]
+        ctx.set_forkserver_preload(
+            ["__main__"] + sorted(name for name in sys.modules if name.split(".")[0] == package)
+        )
+        return ctx
+    return multiprocessing.get_context()
+
+
+def _new_stats(measure: str) -> Dict:
+    """Dicionário de estatísticas de uma medição ainda sem passada concluída."""
+    return {
+        'time_seconds': 0,
+        'memory_mb': 0,
+        'baseline_mb': 0,
+        'peak_memory_mb': None,
+        'memory_source': None,
+        'success': False,
+        'error': None,
+        'timeout': False,
+        'oom': False,
+        'measure': measure
+    }
+
+
+def _call_with_timeout(func: Callable, args, kwargs, timeout_seconds) -> Any:
+    if timeout_seconds and os.name != 'nt':
+        # Usar timeout apenas em sistemas Unix
+        @with_timeout(timeout_seconds)
+        def timed_func():
+            return func(*args, **kwargs)
+        return timed_func()
+    return func(*args, **kwargs)
+
+
+def _record_failure(stats: Dict, error: BaseException):
+    if isinstance(error, TimeoutError):
+        stats['timeout'] = True
+        stats['error'] = 'Timeout'
+    elif isinstance(error, MemoryError):
+        stats['oom'] = True
+        stats['error'] = 'MemoryError'
+    else:
+        stats['error'] = str(error)
+
+
+def _timed_pass(func: Callable, args, kwargs, timeout_seconds, stats: Dict) -> Any:
+    """Passada de tempo: sem tracemalloc, GC desligado, perf_counter_ns."""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        result = _call_with_timeout(func, args, kwargs, timeout_seconds)
+        stats['time_seconds'] = (time.perf_counter_ns() - start) / 1e9
+        stats['success'] = True
+        return result
+    except Exception as e:
+        _record_failure(stats, e)
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+# Chaves de stats preenchidas pela passada de memória, da fonte indicada
+# em `memory_source`: `memory_mb` é o pico acima da linha de base
+# `baseline_mb` (RSS na entrada); `peak_memory_mb` é o pico absoluto de RSS,
+# só com a fonte 'rusage' (None com 'tracemalloc', ver MemoryMonitor)
+MEMORY_STATS_KEYS = ('memory_mb', 'baseline_mb', 'peak_memory_mb', 'memory_source')
+
+
+def _memory_pass(func: Callable, args, kwargs, timeout_seconds, stats: Dict, record_time: bool,
+                 source: str = 'tracemalloc') -> Any:
+    """
+    Passada de memória: pico acima da linha de base (ver MemoryMonitor).
+    Com `record_time` (modo 'memory'), o tempo e o resultado desta passada
+    são os reportados.
+    """
+    memory_stats = {} if not record_time else stats
+    result = None
+    try:
+        with MemoryMonitor(source) as mem:
+            start = time.perf_counter_ns()
+            result = _call_with_timeout(func, args, kwargs, timeout_seconds)
+            elapsed = (time.perf_counter_ns() - start) / 1e9
+        mem_stats = mem.get_stats()
+        stats['memory_mb'] = mem_stats['peak_mb']
+        stats['baseline_mb'] = mem_stats['start_mb']
+        stats['peak_memory_mb'] = mem_stats['peak_rss_mb']
+        stats['memory_source'] = source
+        if record_time:
+            stats['time_seconds'] = elapsed
+            stats['success'] = True
+    except Exception as e:
+        # No modo 'both' a falha da passada de memória não invalida a de tempo
+        _record_failure(memory_stats, e)
+    return result
+
+
+def _measure_inline(func: Callable, args, kwargs, timeout_seconds, stats: Dict,
+                    measure: str = 'both', memory_source: str = 'tracemalloc') -> Any:
+    """
+    Executa e mede `func` no processo atual, preenchendo `stats`.
+    
+    Args:
+        measure: 'time' (só a passada de tempo), 'memory' (só a passada de
+            memória) ou 'both' (tempo e, se bem-sucedida, nova execução
+            para a memória)
+        memory_source: fonte da passada de memória (ver MemoryMonitor)
+    """
+    stats['measure'] = measure
+    if measure == 'memory':
+        return _memory_pass(func, args, kwargs, timeout_seconds, stats, True, memory_source)
+    
+    result = _timed_pass(func, args, kwargs, timeout_seconds, stats)
+    if measure == 'both' and stats['success']:
+        _memory_pass(func, args, _scratch_output(kwargs), timeout_seconds, stats, False, memory_source)
+    return result
+
+
+def _scratch_output(kwargs: Dict) -> Dict:
+    """kwargs com um OUTPUT_KWARG descartável (a saída reportada é a da passada de tempo)."""
+    if isinstance(kwargs.get(OUTPUT_KWARG), dict):
+        return dict(kwargs, **{OUTPUT_KWARG: {}})
+    return kwargs
+
+
+def _send(conn, message):
+    """Envia ao pai sem que o SIGTERM do prazo interrompa a mensagem no meio."""
+    if hasattr(signal, 'pthread_sigmask'):
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+        try:
+            conn.send(message)
+        finally:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
+    else:
+        conn.send(message)
+
+
+class _ProgressSender:
+    """Callback `progress` do filho: repassa cada relatório ao pai pelo pipe."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __call__(self, info: Dict):
+        _send(self.conn, ('progress', info))
+
+
+def _subprocess_entry(conn, func: Callable, args, kwargs, memory_limit_mb, stats: Dict, measure: str,
+                      forward_progress: bool = False):
+    """
+    Ponto de entrada do filho: aplica RLIMIT_AS, mede e devolve (resultado, stats).
+    
+    Cada filho faz uma única passada ('time' ou 'memory'); a de memória usa
+    o ru_maxrss do próprio filho, que é novo a cada passada. Mensagens no
+    pipe: ('progress', info) com `forward_progress` (o callback `progress`
+    da função é substituído por um envio ao pai) e, por fim,
+    ('result', (resultado, stats, saída)), com `saída` o OUTPUT_KWARG da
+    função (ou None). O SIGTERM do pai ao fim do prazo vira TimeoutError na
+    função, e o resultado parcial ainda é enviado antes de o filho sair.
+    Um resultado que não pode ser serializado é devolvido como erro; sem
+    memória nem para isso, o filho sai com OOM_EXIT_CODE.
+    """
+    try:
+        _subprocess_run(conn, func, args, kwargs, memory_limit_mb, stats, measure, forward_progress)
+    except MemoryError:
+        os._exit(OOM_EXIT_CODE)
+
+
+def _subprocess_run(conn, func: Callable, args, kwargs, memory_limit_mb, stats: Dict, measure: str,
+                    forward_progress: bool):
+    """Corpo de _subprocess_entry."""
+    if hasattr(signal, 'SIGTERM') and os.name != 'nt':
+        signal.signal(signal.SIGTERM, timeout_handler)
+    output = kwargs.get(OUTPUT_KWARG)
+    if not isinstance(output, dict):
+        output = None
+    if forward_progress:
+        kwargs = dict(kwargs, progress=_ProgressSender(conn))
+    if memory_limit_mb and resource is not None:
+        limit = int(memory_limit_mb * 1024 * 1024)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    
+    # O prazo é imposto pelo processo pai
+    try:
+        source = 'rusage' if resource is not None else 'tracemalloc'
+        result = _measure_inline(func, args, kwargs, None, stats, measure, source)
+    except MemoryError:
+        stats['oom'] = True
+        stats['success'] = False
+        stats['error'] = 'MemoryError'
+        result = None
+    try:
+        # Depois do resultado, um SIGTERM tardio só encerra o filho
+        if hasattr(signal, 'SIGTERM') and os.name != 'nt':
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        try:
+            _send(conn, ('result', (result, stats, output)))
+        except MemoryError:
+            raise
+        except Exception as e:
+            stats['success'] = False
+            stats['error'] = f"Resultado não serializável: {e}"
+            _send(conn, ('result', (None, stats, output)))
+    finally:
+        conn.close()
+
+
 class PerformanceMonitor:
     """
     Monitor completo de performance incluindo tempo, memória e estatísticas.
+    
+    Com `isolation='subprocess'`, cada chamada medida roda num processo
+    filho: o prazo é imposto pelo pai (precisão sub-segundo, inclusive
+    durante código C), o filho é morto ao estourá-lo, e `memory_limit_mb`
+    impõe um teto RLIMIT_AS. Timeout e falta de memória aparecem no mesmo
+    dicionário de estatísticas (`timeout`, `oom`). Funciona fora da thread
+    principal (ex.: QThread da GUI), onde `signal` não está disponível.
+
+    Um dicionário passado à função como OUTPUT_KWARG (`stats`) recebe o que
+    ela preencheu em qualquer isolamento, inclusive numa execução
+    interrompida pelo prazo (ao fim do prazo o filho recebe SIGTERM e tem
+    SUBPROCESS_GRACE_SECONDS para devolvê-lo antes do SIGKILL).
     """
     
-    def __init__(self, timeout_seconds: Optional[int] = None):
+    ISOLATION_MODES = ('inline', 'subprocess')
+    MEASURE_MODES = ('time', 'memory', 'both')
+    
+    def __init__(
+        self,
+        timeout_seconds: Optional[float] = None,
+        isolation: str = 'inline',
+        memory_limit_mb: Optional[float] = None,
+        measure: str = 'both'
+    ):
         """
         Args:
-            timeout_seconds: tempo limite opcional para execução
+            timeout_seconds: tempo limite opcional para execução (por passada)
+            isolation: 'inline' (mesmo processo, timeout por sinal) ou
+                'subprocess' (processo filho com kill garantido)
+            memory_limit_mb: teto de memória virtual do filho (só 'subprocess')
+            measure: 'time' (sem tracemalloc, GC desligado), 'memory' (só a
+                execução sob tracemalloc; tempo inflado pelo rastreamento) ou
+                'both' (tempo limpo e memória numa segunda execução)
         """
+        if isolation not in self.ISOLATION_MODES:
+            raise ValueError(f"Isolamento inválido: {isolation} (use: {', '.join(self.ISOLATION_MODES)})")
+        if measure not in self.MEASURE_MODES:
+            raise ValueError(f"Modo de medição inválido: {measure} (use: {', '.join(self.MEASURE_MODES)})")
         self.timeout_seconds = timeout_seconds
+        self.isolation = isolation
+        self.memory_limit_mb = memory_limit_mb
+        self.measure = measure
         self.results = {}
         
     def measure_function(
@@ -120,46 +460,120 @@ class PerformanceMonitor:
         Returns:
             Tupla (resultado, estatísticas)
         """
-        stats = {
-            'time_seconds': 0,
-            'memory_mb': 0,
-            'peak_memory_mb': 0,
-            'success': False,
-            'error': None,
-            'timeout': False
-        }
+        stats = _new_stats(self.measure)
         
-        result = None
+        if self.isolation == 'subprocess':
+            return self._measure_subprocess(func, args, kwargs, stats)
+        
+        result = _measure_inline(func, args, kwargs, self.timeout_seconds, stats, self.measure)
+        return result, stats
+    
+    def _measure_subprocess(self, func: Callable, args, kwargs, stats: Dict) -> Tuple[Any, Dict]:
+        """
+        Mede a chamada em filhos com prazo, teto de memória e kill garantido.
+        
+        No modo 'both' são dois filhos, cada um com o seu prazo: um para o
+        tempo e outro, novo, para o pico de memória (um ru_maxrss que já
+        incluísse a passada de tempo não mediria nada). Se a passada de
+        memória falhar, valem os números da de tempo (e as colunas de
+        memória ficam sem medição: `memory_source` None).
+        """
+        if self.measure != 'both':
+            return self._run_child(func, args, kwargs, stats, self.measure)
+        
+        result, stats = self._run_child(func, args, kwargs, stats, 'time')
+        if stats['success']:
+            _, memory = self._run_child(func, args, _scratch_output(kwargs), _new_stats('memory'), 'memory')
+            if memory['success']:
+                for key in MEMORY_STATS_KEYS:
+                    stats[key] = memory[key]
+        stats['measure'] = 'both'
+        return result, stats
+    
+    def _run_child(self, func: Callable, args, kwargs, stats: Dict, measure: str) -> Tuple[Any, Dict]:
+        """
+        Executa uma passada num processo filho.
         
+        Um callback `progress` nos kwargs fica no pai: o filho envia os
+        relatórios pelo pipe e o pai os repassa enquanto espera o resultado.
+        O OUTPUT_KWARG devolvido pelo filho (completo ou parcial, se o prazo
+        estourou) é copiado no dicionário do chamador.
+        """
+        output = kwargs.get(OUTPUT_KWARG)
+        progress = kwargs.get('progress')
+        if progress is not None:
+            kwargs = {key: value for key, value in kwargs.items() if key != 'progress'}
+        ctx = _subprocess_context()
+        parent_conn, child_conn = ctx.Pipe(duplex=False)
+        process = ctx.Process(
+            target=_subprocess_entry,
+            args=(child_conn, func, args, kwargs, self.memory_limit_mb, dict(stats), measure,
+                  progress is not None),
+            daemon=True
+        )
+        
+        start_time = time.perf_counter()
+        deadline = start_time + self.timeout_seconds if self.timeout_seconds else None
+        process.start()
+        child_conn.close()
+        
+        result = None
+        child_output = None
         try:
-            with MemoryMonitor() as mem:
-                start_time = time.time()
-                
-                if self.timeout_seconds and os.name != 'nt':
-                    # Usar timeout apenas em sistemas Unix
-                    @with_timeout(self.timeout_seconds)
-                    def timed_func():
-                        return func(*args, **kwargs)
-                    result = timed_func()
-                else:
-                    result = func(*args, **kwargs)
-                
-                end_time = time.time()
-                
-                stats['time_seconds'] = end_time - start_time
-                mem_stats = mem.get_stats()
-                stats['memory_mb'] = mem_stats['delta_mb']
-                stats['peak_memory_mb'] = mem_stats['peak_mb']
-                stats['success'] = True
-                
-        except TimeoutError:
-            stats['timeout'] = True
-            stats['error'] = 'Timeout'
-        except Exception as e:
-            stats['error'] = str(e)
-            
+            while True:
+                remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+                if not parent_conn.poll(remaining):
+                    stats['timeout'] = True
+                    stats['error'] = 'Timeout'
+                    stats['time_seconds'] = time.perf_counter() - start_time
+                    # SIGTERM interrompe a função no filho, que ainda devolve a saída parcial
+                    process.terminate()
+                    child_output = self._partial_output(parent_conn)
+                    break
+                try:
+                    kind, payload = parent_conn.recv()
+                except EOFError:
+                    # Filho morreu sem responder: é falta de memória só com
+                    # SIGKILL (OOM killer) ou OOM_EXIT_CODE; o resto (ex.:
+                    # segfault) é erro com o código de saída
+                    process.join()
+                    stats['oom'] = process.exitcode in (OOM_EXIT_CODE, -getattr(signal, 'SIGKILL', 9))
+                    stats['error'] = 'MemoryError' if stats['oom'] else f"Processo terminou com código {process.exitcode}"
+                    break
+                if kind == 'progress':
+                    progress(payload)
+                    continue
+                result, stats, child_output = payload
+                break
+        finally:
+            parent_conn.close()
+            if process.is_alive():
+                process.terminate()
+                process.join(SUBPROCESS_GRACE_SECONDS)
+                if process.is_alive():
+                    process.kill()
+            process.join()
+        
+        if isinstance(output, dict) and child_output is not None:
+            output.clear()
+            output.update(child_output)
         return result, stats
     
+    @staticmethod
+    def _partial_output(conn) -> Optional[Dict]:
+        """Espera (até SUBPROCESS_GRACE_SECONDS) a saída parcial de um filho que recebeu SIGTERM."""
+        deadline = time.perf_counter() + SUBPROCESS_GRACE_SECONDS
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or not conn.poll(remaining):
+                return None
+            try:
+                kind, payload = conn.recv()
+            except (EOFError, OSError):
+                return None
+            if kind == 'result':
+                return payload[2]
+    
     def compare_algorithms(
         self,
         algo1: Callable,
@@ -228,7 +642,7 @@ class PerformanceMonitor:
         
         time_str = f"⏱️  {stats['time_seconds']:.6f}s"
         mem_str = f"💾 {stats['memory_mb']:.2f} MB"
-        peak_str = f"(pico: {stats['peak_memory_mb']:.2f} MB)"
+        peak_str = f"(base: {stats.get('baseline_mb', 0):.2f} MB)"
         
         return f"{time_str}  |  {mem_str} {peak_str}"
 
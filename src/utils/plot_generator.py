@@ -11,6 +11,9 @@ from pathlib import Path
 from typing import List, Dict, Optional
 import csv
 
+from src.experiments.result_store import ResultStore
+from src.experiments.result_sink import memory_measured
+
 
 class PlotGenerator:
     """Gera gráficos de análise de performance."""
@@ -44,6 +47,8 @@ class PlotGenerator:
         
         for result in results:
             density = result['density']
+            if density not in data_by_density:
+                continue
             n = result['n']
             stats = result['statistics']
             
@@ -99,7 +104,7 @@ class PlotGenerator:
         data_by_density = {d: {'n': [], 'bt': [], 'h': []} for d in densities}
         
         for result in results:
-            if 'memory_stats' in result:
+            if 'memory_stats' in result and result['density'] in data_by_density:
                 density = result['density']
                 n = result['n']
                 mem = result['memory_stats']
@@ -156,6 +161,8 @@ class PlotGenerator:
         
         for result in results:
             density = result['density']
+            if density not in data_by_density:
+                continue
             n = result['n']
             stats = result['statistics']
             
@@ -290,59 +297,105 @@ class PlotGenerator:
         return plots
 
 
+def load_results_from_store(store: ResultStore) -> List[Dict]:
+    """
+    Resultados agregados (um por configuração) a partir de um ResultStore.
+    
+    As estatísticas de todas as configurações saem de uma única agregação
+    vetorizada (ResultStore.group_statistics).
+    
+    Args:
+        store: store com as execuções
+        
+    Returns:
+        Lista de dicionários com n, density, statistics e memory_stats
+    """
+    results = []
+    for config, stats in zip(store.configs, store.group_statistics()):
+        results.append({
+            **config,
+            'statistics': stats,
+            'memory_stats': {
+                'bt_avg_memory': stats['bt_avg_memory'],
+                'h_avg_memory': stats['h_avg_memory'],
+            },
+        })
+    return results
+
+
 def load_results_from_csv(csv_path: str) -> List[Dict]:
     """
     Carrega resultados de um arquivo CSV para gerar gráficos.
     
+    Colunas ausentes (CSVs de versões anteriores) assumem valores neutros.
+    
     Args:
         csv_path: caminho do arquivo CSV
         
     Returns:
         Lista de dicionários com resultados agregados
     """
-    results = {}
+    store = ResultStore(path_policy='drop')
+    configs = {}
+    
+    def flag(row, key):
+        return bool(int(row.get(key) or 0))
     
     with open(csv_path, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         
         for row in reader:
-            key = (int(row['n']), row['densidade'])
+            key = (int(row['n']), row['densidade'], row.get('gerador') or '', row.get('modo_medicao') or None)
             
-            if key not in results:
-                results[key] = {
-                    'n': int(row['n']),
-                    'density': row['densidade'],
-                    'runs': []
-                }
+            if key not in configs:
+                configs[key] = store.add_config(
+                    n=key[0], density=key[1], generator=key[2], measure=key[3],
+                    probability=float(row.get('probabilidade') or 0),
+                )
             
-            results[key]['runs'].append({
+            store.append(configs[key], {
+                'run_id': int(row.get('run_id') or 0),
+                'num_edges': int(row.get('num_arestas') or 0),
                 'bt_time': float(row['bt_tempo']),
-                'bt_success': bool(int(row['bt_sucesso'])),
+                'bt_success': flag(row, 'bt_sucesso'),
+                'bt_timeout': flag(row, 'bt_timeout'),
                 'bt_steps': int(row['bt_passos']),
+                'bt_memory_measured': memory_measured(row, 'bt'),
+                'bt_memory_mb': float(row.get('bt_memoria_mb') or 0),
+                'bt_baseline_mb': float(row.get('bt_memoria_base_mb') or 0),
                 'h_time': float(row['h_tempo']),
-                'h_success': bool(int(row['h_sucesso']))
+                'h_success': flag(row, 'h_sucesso'),
+                'h_timeout': flag(row, 'h_timeout'),
+                'h_oom': flag(row, 'h_sem_memoria'),
+                'h_memory_measured': memory_measured(row, 'h'),
+                'h_memory_mb': float(row.get('h_memoria_mb') or 0),
+                'h_baseline_mb': float(row.get('h_memoria_base_mb') or 0),
+                'bt_oom': flag(row, 'bt_sem_memoria'),
+                'bt_reused': flag(row, 'bt_reutilizado'),
+                'bt_error': flag(row, 'bt_erro'),
+                'h_error': flag(row, 'h_erro'),
+                'bt_skipped': flag(row, 'bt_pulado'),
+                'h_skipped': flag(row, 'h_pulado'),
             })
     
-    # Calcular estatísticas
-    result_list = []
-    for (n, density), data in results.items():
-        runs = data['runs']
-        
-        bt_times = [r['bt_time'] for r in runs]
-        h_times = [r['h_time'] for r in runs]
-        bt_steps = [r['bt_steps'] for r in runs]
-        
-        data['statistics'] = {
-            'bt_avg_time': np.mean(bt_times),
-            'bt_success_rate': sum(r['bt_success'] for r in runs) / len(runs),
-            'bt_avg_steps': np.mean(bt_steps),
-            'h_avg_time': np.mean(h_times),
-            'h_success_rate': sum(r['h_success'] for r in runs) / len(runs),
-        }
-        
-        result_list.append(data)
+    return load_results_from_store(store)
+
+
+def load_results_from_db(db_path: str, **filters) -> List[Dict]:
+    """
+    Carrega resultados de um banco ResultsDB, agregados em SQL.
+    
+    Args:
+        db_path: arquivo SQLite
+        **filters: generator, hostname, since e/ou measure (ver ResultsDB.aggregate)
+        
+    Returns:
+        Lista de dicionários com resultados agregados
+    """
+    from src.experiments.results_db import ResultsDB
     
-    return result_list
+    with ResultsDB(db_path) as db:
+        return db.load_results(**filters)
 
 
 if __name__ == "__main__":
@@ -350,11 +403,14 @@ if __name__ == "__main__":
     import sys
     
     if len(sys.argv) > 1:
-        csv_file = sys.argv[1]
-        print(f"Carregando dados de: {csv_file}")
+        data_file = sys.argv[1]
+        print(f"Carregando dados de: {data_file}")
         
-        results = load_results_from_csv(csv_file)
+        if data_file.endswith(('.db', '.sqlite', '.sqlite3')):
+            results = load_results_from_db(data_file)
+        else:
+            results = load_results_from_csv(data_file)
         generator = PlotGenerator()
         generator.generate_all_plots(results)
     else:
-        print("Uso: python plot_generator.py <arquivo.csv>")
+        print("Uso: python plot_generator.py <arquivo.csv | arquivo.db>")
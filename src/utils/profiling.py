@@ -0,0 +1,309 @@
+# src/utils/profiling.py
+"""
+Perfilamento dos métodos sob demanda (`analyze --profile`, `batch --profile`).
+
+Dois modos:
+    cprofile  determinístico (cProfile): grava `.pstats` (abra com `pstats`
+              ou snakeviz) e pilhas colapsadas reconstruídas do grafo de
+              chamadas (aproximadas: recursão vira um único quadro e o tempo
+              de funções com vários chamadores é repartido proporcionalmente)
+    sample    amostragem por uma thread-timer que lê `sys._current_frames()`;
+              só pilhas colapsadas (exatas, na resolução do intervalo; a troca
+              de GIL é reduzida ao intervalo enquanto a amostragem dura)
+
+Pilhas colapsadas: uma linha `raiz;...;folha valor` por pilha, o formato
+de entrada do flamegraph.pl, speedscope e inferno. No cprofile o valor é
+tempo próprio em microssegundos; na amostragem, o número de amostras.
+
+O perfil é sempre uma execução extra: as medições registradas não são
+afetadas, e o overhead é relatado como profiled / sem perfil - 1, com o
+tempo sem perfil dado pela mediana de BASELINE_SAMPLES execuções (uma
+única amostra chegou a dar overheads negativos).
+"""
+
+import cProfile
+import os
+import pstats
+import re
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PROFILE_MODES = ('cprofile', 'sample')
+
+# Execuções sem perfil cuja mediana é a base do overhead
+BASELINE_SAMPLES = 3
+
+# ============================================================================
+# PILHAS COLAPSADAS
+# ============================================================================
+
+
+def _frame_label(name: str, filename: str, lineno: int) -> str:
+    """Rótulo de um quadro: `função (arquivo.py:linha)`, sem ';' nem espaços finais."""
+    if filename == '~':
+        # Funções embutidas no cProfile: ('~', 0, "<built-in method ...>")
+        return name.replace(';', ',')
+    return f"{name} ({os.path.basename(filename)}:{lineno})".replace(';', ',')
+
+
+def collapsed_from_pstats(stats: pstats.Stats) -> Counter:
+    """
+    Pilhas colapsadas (valor = tempo próprio em µs) a partir de um perfil.
+
+    O cProfile só guarda arestas chamador → chamado; as pilhas são
+    reconstruídas percorrendo essas arestas a partir das raízes, com o
+    tempo de cada função repartido entre chamadores pela fração do tempo
+    acumulado vinda de cada um. Ciclos (recursão) são cortados.
+    """
+    entries = stats.stats
+    callees: Dict[tuple, List[tuple]] = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller in callers:
+            callees.setdefault(caller, []).append(func)
+
+    stacks: Counter = Counter()
+    roots = [func for func, entry in entries.items()
+             if not any(caller in entries and caller != func for caller in entry[4])
+             and '_lsprof.Profiler' not in func[2]]
+
+    def visit(func, stack, on_stack, scale):
+        label = _frame_label(func[2], func[0], func[1])
+        stack = stack + (label,)
+        own = entries[func][2] * scale
+        if own > 0:
+            stacks[stack] += own * 1e6
+        for child in callees.get(func, ()):
+            if child in on_stack or child not in entries:
+                continue
+            edge_cumulative = entries[child][4][func][3]
+            child_cumulative = entries[child][3]
+            share = edge_cumulative / child_cumulative if child_cumulative > 0 else 0.0
+            if share > 0:
+                visit(child, stack, on_stack | {child}, scale * share)
+
+    for root in roots:
+        visit(root, (), frozenset((root,)), 1.0)
+    return Counter({stack: round(value) for stack, value in stacks.items() if round(value) > 0})
+
+
+def format_collapsed(stacks: Counter) -> str:
+    """Texto no formato colapsado, pilhas em ordem (o flamegraph.pl não exige)."""
+    return "".join(f"{';'.join(stack)} {int(count)}\n" for stack, count in sorted(stacks.items()))
+
+
+# ============================================================================
+# PERFILADOR POR AMOSTRAGEM
+# ============================================================================
+
+
+class SamplingProfiler:
+    """
+    Amostra periodicamente a pilha de uma thread (padrão: a que chama start).
+
+    A thread amostradora só roda quando obtém o GIL, então o intervalo de
+    troca (`sys.setswitchinterval`) é baixado para `interval` enquanto ela
+    está ativa. Quadros a partir de `root` (exclusive) não entram nas pilhas.
+
+    Uso:
+        with SamplingProfiler(interval=0.001) as profiler:
+            func()
+        print(format_collapsed(profiler.stacks))
+    """
+
+    def __init__(self, interval: float = 0.001, root=None):
+        if interval <= 0:
+            raise ValueError(f"Intervalo de amostragem inválido: {interval}")
+        self.interval = interval
+        self.root = root
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._target: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._switch_interval: Optional[float] = None
+
+    def _sample(self):
+        frame = sys._current_frames().get(self._target)
+        if frame is None or self._stop.is_set():
+            return
+        stack = []
+        while frame is not None and frame is not self.root:
+            code = frame.f_code
+            stack.append(_frame_label(code.co_name, code.co_filename, code.co_firstlineno))
+            frame = frame.f_back
+        self.stacks[tuple(reversed(stack))] += 1
+        self.samples += 1
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self, thread_id: Optional[int] = None):
+        self._target = thread_id if thread_id is not None else threading.get_ident()
+        self._stop.clear()
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._thread = threading.Thread(target=self._loop, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._switch_interval is not None:
+            sys.setswitchinterval(self._switch_interval)
+            self._switch_interval = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+# ============================================================================
+# EXECUÇÃO PERFILADA
+# ============================================================================
+
+
+def profile_call(
+    func: Callable,
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+    mode: str = 'cprofile',
+    interval: float = 0.001
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Executa `func(*args, **kwargs)` sob o perfilador escolhido.
+
+    Returns:
+        (resultado, perfil) com `mode`, `elapsed` (s, com o perfilador
+        ativo), `stacks` (pilhas colapsadas), `samples` (só 'sample') e
+        `pstats` (pstats.Stats, só 'cprofile')
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Modo de perfil inválido: {mode} (use: {', '.join(PROFILE_MODES)})")
+    kwargs = kwargs or {}
+
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            result = profiler.runcall(func, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+        stats = pstats.Stats(profiler)
+        return result, {
+            'mode': mode,
+            'elapsed': elapsed,
+            'pstats': stats,
+            'stacks': collapsed_from_pstats(stats),
+            'samples': None,
+        }
+
+    sampler = SamplingProfiler(interval, root=sys._getframe())
+    start = time.perf_counter()
+    with sampler:
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+    return result, {
+        'mode': mode,
+        'elapsed': elapsed,
+        'pstats': None,
+        'stacks': sampler.stacks,
+        'samples': sampler.samples,
+    }
+
+
+def _safe_name(text: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', text).strip('_') or 'instancia'
+
+
+def write_profile(profile: Dict[str, Any], output_dir: str, engine: str, instance: str) -> List[str]:
+    """
+    Grava `<instância>_<método>.pstats` (cprofile) e `.collapsed`.
+
+    Returns:
+        Arquivos gravados
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    prefix = os.path.join(output_dir, f"{_safe_name(instance)}_{_safe_name(engine)}")
+    files = []
+    if profile['pstats'] is not None:
+        profile['pstats'].dump_stats(prefix + '.pstats')
+        files.append(prefix + '.pstats')
+    with open(prefix + '.collapsed', 'w', encoding='utf-8') as f:
+        f.write(format_collapsed(profile['stacks']))
+    files.append(prefix + '.collapsed')
+    return files
+
+
+def run_profiled(
+    func: Callable,
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+    mode: str = 'cprofile',
+    output_dir: str = 'profiles',
+    engine: str = 'func',
+    instance: str = 'instancia',
+    baseline_time: Optional[float] = None,
+    interval: float = 0.001,
+    baseline_samples: int = BASELINE_SAMPLES
+) -> Dict[str, Any]:
+    """
+    Execução extra perfilada de `func`, com arquivos e overhead.
+
+    Args:
+        baseline_time: tempo (s) já medido da mesma chamada sem perfilador,
+            aproveitado como uma das amostras da base
+        baseline_samples: amostras sem perfil (a base é a mediana); as que
+            faltarem são cronometradas antes da execução perfilada
+        demais: ver profile_call e write_profile
+
+    Returns:
+        Dicionário com `files`, `baseline_time` (mediana), `baseline_samples`,
+        `profiled_time`, `overhead` (fração; None se o tempo base for zero)
+        e `samples`
+    """
+    kwargs = kwargs or {}
+    baseline = [] if baseline_time is None else [baseline_time]
+    while len(baseline) < max(1, baseline_samples):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        baseline.append(time.perf_counter() - start)
+    baseline_time = statistics.median(baseline)
+    _, profile = profile_call(func, args, kwargs, mode, interval)
+    return {
+        'mode': mode,
+        'engine': engine,
+        'instance': instance,
+        'files': write_profile(profile, output_dir, engine, instance),
+        'baseline_time': baseline_time,
+        'baseline_samples': len(baseline),
+        'profiled_time': profile['elapsed'],
+        'overhead': profile['elapsed'] / baseline_time - 1 if baseline_time > 0 else None,
+        'samples': profile['samples'],
+    }
+
+
+def format_overhead(report: Dict[str, Any]) -> str:
+    """Resumo de uma execução perfilada: tempos, overhead e amostras."""
+    overhead = report['overhead']
+    text = (
+        f"{report['mode']}: {report['profiled_time']:.6f}s com perfil vs "
+        f"{report['baseline_time']:.6f}s sem perfil (mediana de {report['baseline_samples']}) "
+        f"(overhead {'n/d' if overhead is None else f'{overhead:+.0%}'})"
+    )
+    if report['samples'] is not None:
+        text += f", {report['samples']} amostra(s)"
+        if report['samples'] == 0:
+            text += " (execução mais curta que o intervalo de amostragem)"
+    return text